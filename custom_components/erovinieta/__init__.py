@@ -30,7 +30,11 @@ from homeassistant.util import dt as dt_util
 from homeassistant.helpers.typing import ConfigType
 
 from .api import ErovinietaAPI
+from .cassette import CassetteRecorder
+from .connection import async_close_connection_pool, async_get_connection_pool
 from .const import (
+    CASSETTE_DIR,
+    CONF_INREGISTRARE_TRAFIC,
     CONF_PASSWORD,
     CONF_UPDATE_INTERVAL,
     CONF_USERNAME,
@@ -43,6 +47,12 @@ from .const import (
 from .coordinator import ErovinietaCoordinator
 from .exceptions import ErovinietaAuthError, ErovinietaConnectionError
 from .license import LicenseManager
+from .storage import (
+    async_get_entry_store,
+    async_get_response_cache,
+    async_remove_entry_store,
+    async_remove_response_cache,
+)
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
@@ -299,14 +309,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
 
     # ── Setup API + Coordinator (logica originală) ──
-    session = async_get_clientsession(hass)
+    # Sesiune proprie per cont (cookie jar izolat), peste pool-ul de conexiuni
+    # al domeniului — login-ul unui cont nu mai șterge JSESSIONID-ul altuia,
+    # iar conexiunile TCP/TLS sunt refolosite între conturi și config flow.
+    session = async_get_connection_pool(hass).create_session()
+    store = await async_get_entry_store(hass, entry.entry_id)
     api = ErovinietaAPI(
-        session, entry.data[CONF_USERNAME], entry.data[CONF_PASSWORD]
+        session,
+        entry.data[CONF_USERNAME],
+        entry.data[CONF_PASSWORD],
+        session_listener=lambda sesiune: store.async_set("sesiune", sesiune),
+        cache=await async_get_response_cache(hass),
+        recorder=_cassette_recorder(hass, entry),
+        # Reîmprospătările cache-ului țin de ciclul de viață al intrării
+        background_task_factory=lambda coro, nume: (
+            entry.async_create_background_task(hass, coro, nume)
+        ),
     )
+    # Închide sesiunea la descărcare și la eșecul setup-ului (pool-ul rămâne)
+    entry.async_on_unload(api.close)
 
-    # Autentificare inițială
+    # Autentificare inițială — sărită dacă sesiunea salvată e încă validă
     try:
-        await api.authenticate()
+        if not api.restore_session(store.get("sesiune")):
+            await api.authenticate()
     except ErovinietaAuthError as err:
         raise ConfigEntryAuthFailed(
             f"Autentificare eșuată: {err}"
@@ -321,7 +347,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
     )
     coordinator = ErovinietaCoordinator(
-        hass, api, config_entry=entry, update_interval=update_interval
+        hass,
+        api,
+        config_entry=entry,
+        update_interval=update_interval,
+        store=store,
     )
 
     # Prima actualizare a datelor
@@ -346,14 +376,31 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+def _cassette_recorder(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> CassetteRecorder | None:
+    """Caseta de trafic a contului, dacă înregistrarea este activă."""
+    if not entry.options.get(CONF_INREGISTRARE_TRAFIC, False):
+        return None
+    path = hass.config.path(CASSETTE_DIR, f"{entry.entry_id}.json")
+    _LOGGER.info("Înregistrare trafic activă pentru %s: %s", entry.title, path)
+    return CassetteRecorder(path)
+
+
 async def async_update_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Aplică modificările de opțiuni (interval, istoric)."""
+    """Aplică modificările de opțiuni (interval, istoric, înregistrare)."""
     coordinator: ErovinietaCoordinator = hass.data[DOMAIN][entry.entry_id]
 
+    inregistrare = entry.options.get(CONF_INREGISTRARE_TRAFIC, False)
+    if inregistrare != (coordinator.api.recorder is not None):
+        if coordinator.api.recorder is not None:
+            await hass.async_add_executor_job(coordinator.api.recorder.salveaza)
+        coordinator.api.recorder = _cassette_recorder(hass, entry)
+
     update_interval = entry.options.get(
         CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
     )
-    coordinator.update_interval = timedelta(seconds=update_interval)
+    coordinator.seteaza_interval(update_interval)
 
     _LOGGER.debug(
         "Interval de actualizare modificat la %s secunde.", update_interval
@@ -378,7 +425,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         coordinator: ErovinietaCoordinator = hass.data[DOMAIN].pop(
             entry.entry_id
         )
-        # Sesiunea HA (async_get_clientsession) se gestionează automat — nu o închidem
+        # Sesiunea contului e închisă prin entry.async_on_unload(api.close)
+        coordinator.api.stop_background_tasks()
 
         # Verifică dacă mai sunt entry-uri active
         entry_ids_ramase = {
@@ -425,6 +473,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 cancel_ce()
                 _LOGGER.debug("[eRovinieta] Cache expiry timer oprit")
 
+            # Închide pool-ul de conexiuni al domeniului
+            await async_close_connection_pool(hass)
+
             # Elimină LicenseManager
             hass.data[DOMAIN].pop(LICENSE_DATA_KEY, None)
             _LOGGER.debug("[eRovinieta] LicenseManager eliminat")
@@ -456,9 +507,13 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
         entry.data.get(CONF_USERNAME),
     )
 
+    # ── Date persistente ale contului (sesiune etc.) ──
+    await async_remove_entry_store(hass, entry.entry_id)
+
     # ── Notificare licență (doar la ultima entry) ──
     remaining = hass.config_entries.async_entries(DOMAIN)
     if not remaining:
+        await async_remove_response_cache(hass)
         notify_data = hass.data.pop(f"{DOMAIN}_notify", None)
         if notify_data and notify_data.get("fingerprint"):
             await _send_lifecycle_event(
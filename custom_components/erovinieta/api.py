@@ -6,13 +6,41 @@ eliminând necesitatea async_add_executor_job.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine
+from typing import Any
 
 import aiohttp
 from yarl import URL
 
+from . import codec
+from .cache import ResponseCache
+from .cassette import CassetteRecorder
 from .const import (
+    BASE_URL,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_RESET_TIMEOUT,
+    DEFAULT_PAGE_SIZE,
+    ENDPOINT_BRIDGE,
+    ENDPOINT_COUNTRIES,
+    ENDPOINT_DETAILS,
+    ENDPOINT_LOGIN,
+    ENDPOINT_PAGINATED,
+    ENDPOINT_TRANSACTIONS,
+    ENDPOINT_USER,
+    REQUEST_CONNECT_TIMEOUT,
+    REQUEST_TIMEOUT,
+    RETRY_ATTEMPTS,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+    SESSION_LEARN_MARGIN,
+    SESSION_LEARN_SAMPLES,
+    SESSION_LIFETIME_MIN,
+    STREAM_CHUNK_SIZE,
     TOKEN_VALIDITY_SECONDS,
     URL_DETALII_TRANZACTIE,
     URL_GET_COUNTRIES,
@@ -25,11 +53,38 @@ from .const import (
 from .exceptions import (
     ErovinietaApiError,
     ErovinietaAuthError,
+    ErovinietaCircuitOpenError,
+    ErovinietaClientError,
     ErovinietaConnectionError,
+    ErovinietaServerError,
 )
+from .metrics import ApiMetrics
+from .models import (
+    PaginaVehicule,
+    PozitieFactura,
+    ProfilUtilizator,
+    Tara,
+    Vehicul,
+)
+from .resilience import CircuitBreaker, RetryPolicy
+from .streaming import iter_json_array
 
 _LOGGER = logging.getLogger(__name__)
 
+# Timeout per cerere; răspunsurile în flux au doar limită între bucăți
+_TIMEOUT_CERERE = aiohttp.ClientTimeout(
+    total=REQUEST_TIMEOUT, connect=REQUEST_CONNECT_TIMEOUT
+)
+_TIMEOUT_FLUX = aiohttp.ClientTimeout(
+    total=None, connect=REQUEST_CONNECT_TIMEOUT, sock_read=REQUEST_TIMEOUT
+)
+
+# Chei posibile pentru numărul total de înregistrări în răspunsul paginat
+_CHEI_TOTAL_PAGINAT = ("total", "totalCount", "totalElements", "totalRecords", "count")
+
+# Pornește un task în fundal: (corutină, nume) → task
+FabricaTask = Callable[[Coroutine[Any, Any, None], str], asyncio.Task]
+
 
 class ErovinietaAPI:
     """Client API async pentru serviciul CNAIR eRovinieta."""
@@ -39,17 +94,127 @@ class ErovinietaAPI:
         session: aiohttp.ClientSession,
         username: str,
         password: str,
+        session_listener: Callable[[dict[str, Any] | None], None] | None = None,
+        cache: ResponseCache | None = None,
+        base_url: str | None = None,
+        recorder: CassetteRecorder | None = None,
+        background_task_factory: FabricaTask | None = None,
     ) -> None:
-        """Inițializează clientul API."""
+        """Inițializează clientul API.
+
+        `session_listener` este apelat după fiecare login reușit cu starea
+        sesiunii (vezi `export_session`), pentru a putea fi persistată.
+        `cache` (opțional, poate fi partajat între conturi) păstrează
+        răspunsurile endpoint-urilor care se schimbă rar.
+        `base_url` înlocuiește BASE_URL în toate URL-urile (ex: portalul
+        local din tools/fake_portal.py, pentru teste de performanță).
+        `recorder` (opțional, comutabil și ulterior prin atributul cu același
+        nume) înregistrează fiecare cerere într-o casetă de trafic.
+        `background_task_factory(coro, nume)` pornește task-urile din fundal
+        (ex: `entry.async_create_background_task`, ca ele să fie anulate la
+        descărcarea intrării); implicit `asyncio.create_task`.
+        """
         self._session = session
+        self._base_url = base_url.rstrip("/") if base_url else None
         self._username = username
         self._password = password
         self._token_time: float = 0
+        # Un singur login simultan; generația crește la fiecare login reușit
+        self._auth_lock = asyncio.Lock()
+        self._auth_generation: int = 0
+        # Durata sesiunii pe server: implicit TOKEN_VALIDITY_SECONDS, redusă
+        # dacă sesiunile expiră mai devreme (vezi `_observa_expirare`)
+        self._durata_sesiune: float = TOKEN_VALIDITY_SECONDS
+        self._expirari_timpurii: deque[float] = deque(maxlen=SESSION_LEARN_SAMPLES)
+        self._reinnoiri: int = 0
+        self._session_listener = session_listener
+        # Amprenta ultimului răspuns brut per endpoint interogat periodic
+        # (cheie → (hash, obiect)); mărginită de numărul de vehicule și pagini
+        self._fingerprints: dict[str, tuple[bytes, Any]] = {}
+        # Proiecția ultimei valori din cache per endpoint: (valoare, proiecție)
+        self._proiectii: dict[str, tuple[Any, Any]] = {}
+        self._cache = cache
+        self.metrics = ApiMetrics()
+        self.recorder = recorder
+        self._retry = RetryPolicy(RETRY_ATTEMPTS, RETRY_BASE_DELAY, RETRY_MAX_DELAY)
+        self._breakers: dict[str, CircuitBreaker] = {}
+        # Reîmprospătări în fundal ale intrărilor expirate din cache
+        self._refresh_tasks: dict[tuple[str, str], asyncio.Task] = {}
+        self._background_task_factory = background_task_factory or (
+            lambda coro, nume: asyncio.create_task(coro, name=nume)
+        )
 
     @property
     def authenticated(self) -> bool:
         """Verifică dacă sesiunea curentă este validă."""
-        return (time.monotonic() - self._token_time) < TOKEN_VALIDITY_SECONDS
+        # `_token_time` = 0: niciun login încă (monotonic poate fi mic la boot)
+        return bool(self._token_time) and (
+            time.monotonic() - self._token_time
+        ) < self._durata_sesiune
+
+    @property
+    def session_expires_in(self) -> float:
+        """Secunde până la expirarea (estimată) a sesiunii curente."""
+        if not self._token_time:
+            return 0.0
+        varsta = time.monotonic() - self._token_time
+        return max(0.0, self._durata_sesiune - varsta)
+
+    @property
+    def session_info(self) -> dict[str, Any]:
+        """Durata învățată a sesiunii și reînnoirile, pentru diagnostice."""
+        return {
+            "durata_sesiune_s": round(self._durata_sesiune),
+            "expira_in_s": round(self.session_expires_in),
+            "expirari_timpurii_s": [round(v) for v in self._expirari_timpurii],
+            "reinnoiri_fundal": self._reinnoiri,
+        }
+
+    # ------------------------------------------------------------------
+    #  Persistența sesiunii
+    # ------------------------------------------------------------------
+
+    def export_session(self) -> dict[str, Any] | None:
+        """Returnează cookie-ul JSESSIONID și momentul login-ului (epoch)."""
+        if not self.authenticated:
+            return None
+        cookie = self._session.cookie_jar.filter_cookies(
+            URL(self._url(URL_LOGIN))
+        ).get("JSESSIONID")
+        if cookie is None:
+            return None
+        varsta = time.monotonic() - self._token_time
+        return {
+            "jsessionid": cookie.value,
+            "token_time": time.time() - varsta,
+            "durata_sesiune": self._durata_sesiune,
+        }
+
+    def restore_session(self, data: dict[str, Any] | None) -> bool:
+        """Reîncarcă o sesiune salvată dacă e încă în durata sesiunii.
+
+        Returnează False dacă sesiunea lipsește sau a expirat. O sesiune
+        restaurată pe care serverul o respinge (401) este înlocuită automat
+        la prima cerere, prin re-autentificare.
+        """
+        if not data or not data.get("jsessionid"):
+            return False
+        durata = float(data.get("durata_sesiune", TOKEN_VALIDITY_SECONDS))
+        self._durata_sesiune = min(
+            max(durata, SESSION_LIFETIME_MIN), TOKEN_VALIDITY_SECONDS
+        )
+        varsta = time.time() - float(data.get("token_time", 0))
+        if not 0 <= varsta < self._durata_sesiune:
+            return False
+
+        self._session.cookie_jar.update_cookies(
+            {"JSESSIONID": data["jsessionid"]}, URL(self._url(URL_LOGIN))
+        )
+        self._token_time = time.monotonic() - varsta
+        _LOGGER.debug(
+            "Sesiune restaurată pentru %s (vârstă %d s)", self._username, varsta
+        )
+        return True
 
     # ------------------------------------------------------------------
     #  Autentificare
@@ -57,6 +222,11 @@ class ErovinietaAPI:
 
     async def authenticate(self) -> None:
         """Autentifică utilizatorul și stochează cookie-ul JSESSIONID."""
+        async with self._auth_lock:
+            await self._login()
+
+    async def _login(self) -> None:
+        """Execută POST-ul de login. Se apelează doar sub `_auth_lock`."""
         payload = {
             "username": self._username,
             "password": self._password,
@@ -64,36 +234,125 @@ class ErovinietaAPI:
         }
         self._session.cookie_jar.clear()
 
+        start = time.monotonic()
+        status: int | str = "?"
         try:
-            async with self._session.post(URL_LOGIN, json=payload) as resp:
+            async with self._session.post(
+                self._url(URL_LOGIN), json=payload, timeout=_TIMEOUT_CERERE
+            ) as resp:
+                status = resp.status
                 if resp.status != 200:
                     text = await resp.text()
                     raise ErovinietaAuthError(
                         f"Autentificare eșuată (HTTP {resp.status}): {text[:200]}"
                     )
+        except TimeoutError as err:
+            status = "timeout"
+            raise ErovinietaConnectionError(
+                "Timp de răspuns depășit la autentificare."
+            ) from err
         except aiohttp.ClientError as err:
+            status = type(err).__name__
             raise ErovinietaConnectionError(
                 f"Eroare de conexiune la autentificare: {err}"
             ) from err
+        finally:
+            self.metrics.record(ENDPOINT_LOGIN, status, time.monotonic() - start)
+            if self.recorder is not None:
+                self.recorder.inregistreaza(
+                    "POST",
+                    self._url(URL_LOGIN),
+                    start=start,
+                    status=status,
+                    cerere=payload,
+                )
 
         # Verificăm că JSESSIONID a fost setat de server
-        cookies = self._session.cookie_jar.filter_cookies(URL(URL_LOGIN))
+        cookies = self._session.cookie_jar.filter_cookies(
+            URL(self._url(URL_LOGIN))
+        )
         if "JSESSIONID" not in cookies:
             raise ErovinietaAuthError(
                 "Cookie-ul JSESSIONID nu a fost primit după autentificare."
             )
 
         self._token_time = time.monotonic()
+        self._auth_generation += 1
         _LOGGER.debug("Autentificare reușită pentru %s", self._username)
 
+        if self._session_listener is not None:
+            self._session_listener(self.export_session())
+
     # ------------------------------------------------------------------
     #  Cereri HTTP
     # ------------------------------------------------------------------
 
     async def _ensure_auth(self) -> None:
-        """Asigură autentificarea înainte de un apel API."""
-        if not self.authenticated:
-            await self.authenticate()
+        """Asigură autentificarea înainte de un apel API.
+
+        Cererile concurente care găsesc sesiunea expirată așteaptă
+        același login în loc să pornească fiecare câte unul.
+        """
+        if self.authenticated:
+            return
+        async with self._auth_lock:
+            if not self.authenticated:
+                await self._login()
+
+    async def renew_session(self) -> None:
+        """Reînnoiește sesiunea în avans (în fundal, în afara refresh-ului).
+
+        Dacă între timp a avut loc un login (ex: o cerere a găsit sesiunea
+        expirată), nu se mai face încă unul.
+        """
+        generation = self._auth_generation
+        async with self._auth_lock:
+            if generation != self._auth_generation:
+                return
+            await self._login()
+            self._reinnoiri += 1
+
+    def _observa_expirare(self, generation: int) -> None:
+        """Învață durata sesiunii dintr-un 401/403 primit înainte de termen.
+
+        O singură expirare timpurie poate fi accidentală (ex: restart al
+        serverului); durata se ajustează abia după SESSION_LEARN_SAMPLES
+        expirări timpurii.
+        """
+        if generation != self._auth_generation or not self._token_time:
+            return
+        varsta = time.monotonic() - self._token_time
+        if varsta >= self._durata_sesiune:
+            return
+        self._expirari_timpurii.append(varsta)
+        if len(self._expirari_timpurii) < SESSION_LEARN_SAMPLES:
+            return
+        durata = max(
+            SESSION_LIFETIME_MIN,
+            max(self._expirari_timpurii) * SESSION_LEARN_MARGIN,
+        )
+        self._expirari_timpurii.clear()
+        if durata < self._durata_sesiune:
+            _LOGGER.info(
+                "Sesiunile expiră după ~%d s (nu %d s); durata ajustată la %d s",
+                varsta,
+                self._durata_sesiune,
+                durata,
+            )
+            self._durata_sesiune = durata
+
+    async def _reauthenticate(self, generation: int, endpoint: str) -> None:
+        """Re-autentifică după un 401/403, o singură dată per sesiune expirată.
+
+        Dacă între timp alt apel a făcut deja login (generația s-a schimbat),
+        se refolosește sesiunea nouă fără un POST suplimentar.
+        """
+        self._observa_expirare(generation)
+        async with self._auth_lock:
+            if generation == self._auth_generation:
+                _LOGGER.debug("Token expirat, re-autentificare...")
+                self.metrics.record_relogin(endpoint)
+                await self._login()
 
     async def _request(
         self,
@@ -101,25 +360,130 @@ class ErovinietaAPI:
         url: str,
         json_data: dict | None = None,
         headers: dict | None = None,
-    ) -> dict | list:
-        """Execută o cerere HTTP cu re-autentificare automată."""
-        await self._ensure_auth()
+        *,
+        endpoint: str,
+        key: str | None = None,
+        amprentat: bool = False,
+        proiectie: Callable[[Any], Any] | None = None,
+    ) -> Any:
+        """Execută o cerere HTTP cu re-autentificare și reîncercări.
+
+        Cu `amprentat` (doar endpoint-urile interogate periodic), `endpoint`
+        (+ `key`, ex: numărul de înmatriculare) identifică răspunsul pentru
+        amprentare — vezi `_do_request`; cererile unice (ex: detaliile unei
+        facturi) nu sunt amprentate, ca să nu fie ținute în memorie. `proiectie`
+        (opțional) transformă răspunsul decodat într-o înregistrare
+        compactă (vezi models.py); dict-ul brut nu mai este păstrat.
+
+        Erorile temporare (conexiune, HTTP 5xx) sunt reîncercate cu backoff
+        și jitter. Cât timp circuitul endpoint-ului este deschis, cererea
+        nu mai pleacă: se ridică ErovinietaCircuitOpenError, iar apelantul
+        păstrează ultimele date cunoscute, marcate ca învechite.
+        """
+        if not amprentat:
+            fingerprint_key = None
+        else:
+            fingerprint_key = endpoint if key is None else f"{endpoint}:{key}"
+        breaker = self._breaker(endpoint)
+        if not breaker.allow():
+            raise _circuit_deschis(endpoint)
 
         try:
-            return await self._do_request(method, url, json_data, headers)
-        except ErovinietaAuthError:
-            _LOGGER.debug("Token expirat, re-autentificare...")
-            await self.authenticate()
-            return await self._do_request(method, url, json_data, headers)
+            await self._ensure_auth()
+            attempt = 0
+            while True:
+                generation = self._auth_generation
+                try:
+                    try:
+                        data = await self._do_request(
+                            method,
+                            url,
+                            json_data,
+                            headers,
+                            endpoint,
+                            fingerprint_key,
+                            proiectie,
+                        )
+                    except ErovinietaAuthError:
+                        await self._reauthenticate(generation, endpoint)
+                        self.metrics.record_retry(endpoint)
+                        data = await self._do_request(
+                            method,
+                            url,
+                            json_data,
+                            headers,
+                            endpoint,
+                            fingerprint_key,
+                            proiectie,
+                        )
+                except (ErovinietaConnectionError, ErovinietaServerError) as err:
+                    breaker.record_failure()
+                    attempt += 1
+                    if attempt >= self._retry.attempts or not breaker.allow():
+                        raise
+                    delay = self._retry.delay(attempt - 1)
+                    _LOGGER.debug(
+                        "Reîncercare %d/%d pentru %s în %.1f s: %s",
+                        attempt,
+                        self._retry.attempts - 1,
+                        endpoint,
+                        delay,
+                        err,
+                    )
+                    self.metrics.record_retry(endpoint)
+                    await asyncio.sleep(delay)
+                    continue
 
-    async def _do_request(
+                breaker.record_success()
+                return data
+        finally:
+            # Proba half_open încheiată altfel decât cu succes (anulare,
+            # 4xx, JSON invalid, autentificare) redeschide circuitul
+            breaker.release_probe()
+
+    @staticmethod
+    async def _verifica_status(resp: aiohttp.ClientResponse) -> None:
+        """Transformă un status HTTP neașteptat în excepția potrivită."""
+        if resp.status in (401, 403):
+            raise ErovinietaAuthError(f"HTTP {resp.status}")
+        if resp.status >= 500:
+            text = await resp.text()
+            raise ErovinietaServerError(
+                f"Eroare server (HTTP {resp.status}): {text[:200]}"
+            )
+        if 400 <= resp.status < 500:
+            text = await resp.text()
+            raise ErovinietaClientError(
+                f"Cerere respinsă (HTTP {resp.status}): {text[:200]}"
+            )
+        if resp.status != 200:
+            text = await resp.text()
+            raise ErovinietaApiError(
+                f"Eroare API (HTTP {resp.status}): {text[:200]}"
+            )
+
+    async def _stream_request(
         self,
         method: str,
         url: str,
         json_data: dict | None = None,
         headers: dict | None = None,
-    ) -> dict | list:
-        """Execută efectiv cererea HTTP."""
+        *,
+        endpoint: str,
+        array_key: str,
+    ) -> AsyncIterator[Any]:
+        """Execută o cerere și produce elementele array-ului `array_key` pe rând.
+
+        Corpul nu este bufferizat: elementele sunt decodate incremental din
+        flux (vezi `streaming.iter_json_array`). Re-autentificarea și
+        reîncercările se aplică doar înainte de primul element produs; o
+        eroare la mijlocul fluxului este propagată. Răspunsurile în flux nu
+        sunt amprentate.
+        """
+        breaker = self._breaker(endpoint)
+        if not breaker.allow():
+            raise _circuit_deschis(endpoint)
+
         kwargs: dict = {}
         if json_data is not None:
             kwargs["json"] = json_data
@@ -127,28 +491,286 @@ class ErovinietaAPI:
             kwargs["headers"] = headers
 
         try:
-            async with self._session.request(method, url, **kwargs) as resp:
-                if resp.status in (401, 403):
-                    raise ErovinietaAuthError(f"HTTP {resp.status}")
-                if resp.status != 200:
-                    text = await resp.text()
-                    raise ErovinietaApiError(
-                        f"Eroare API (HTTP {resp.status}): {text[:200]}"
+            await self._ensure_auth()
+            attempt = 0
+            relogin_facut = False
+            while True:
+                generation = self._auth_generation
+                start = time.monotonic()
+                status: int | str = "?"
+                octeti = 0
+                produse = 0
+                inregistrate: list[Any] | None = [] if self.recorder else None
+
+                async def _bucati(
+                    resp: aiohttp.ClientResponse,
+                ) -> AsyncIterator[bytes]:
+                    nonlocal octeti
+                    async for chunk in resp.content.iter_chunked(STREAM_CHUNK_SIZE):
+                        octeti += len(chunk)
+                        yield chunk
+
+                try:
+                    try:
+                        async with self._session.request(
+                            method, url, timeout=_TIMEOUT_FLUX, **kwargs
+                        ) as resp:
+                            status = resp.status
+                            await self._verifica_status(resp)
+                            async for element in iter_json_array(
+                                _bucati(resp), array_key
+                            ):
+                                produse += 1
+                                if inregistrate is not None:
+                                    inregistrate.append(element)
+                                yield element
+                    except TimeoutError as err:
+                        status = "timeout"
+                        raise ErovinietaConnectionError(
+                            f"Timp de răspuns depășit pentru {url}"
+                        ) from err
+                    except aiohttp.ClientError as err:
+                        status = type(err).__name__
+                        raise ErovinietaConnectionError(
+                            f"Cerere eșuată către {url}: {err}"
+                        ) from err
+                    except ValueError as err:
+                        raise ErovinietaApiError(
+                            f"Răspuns JSON invalid de la server: {err}"
+                        ) from err
+                    finally:
+                        self.metrics.record(
+                            endpoint, status, time.monotonic() - start, octeti
+                        )
+                        if self.recorder is not None and inregistrate is not None:
+                            self.recorder.inregistreaza(
+                                method,
+                                url,
+                                start=start,
+                                status=status,
+                                cerere=json_data,
+                                raspuns=(
+                                    {array_key: inregistrate}
+                                    if status == 200
+                                    else None
+                                ),
+                            )
+                except ErovinietaAuthError:
+                    if relogin_facut or produse:
+                        raise
+                    relogin_facut = True
+                    await self._reauthenticate(generation, endpoint)
+                    self.metrics.record_retry(endpoint)
+                    continue
+                except (ErovinietaConnectionError, ErovinietaServerError) as err:
+                    breaker.record_failure()
+                    attempt += 1
+                    if (
+                        produse
+                        or attempt >= self._retry.attempts
+                        or not breaker.allow()
+                    ):
+                        raise
+                    delay = self._retry.delay(attempt - 1)
+                    _LOGGER.debug(
+                        "Reîncercare %d/%d (flux) pentru %s în %.1f s: %s",
+                        attempt,
+                        self._retry.attempts - 1,
+                        endpoint,
+                        delay,
+                        err,
                     )
+                    self.metrics.record_retry(endpoint)
+                    await asyncio.sleep(delay)
+                    continue
 
-                data = await resp.json(content_type=None)
-                if data is None:
-                    raise ErovinietaApiError("Răspuns JSON gol de la server.")
-                return data
+                breaker.record_success()
+                return
+        finally:
+            # Proba half_open încheiată altfel decât cu succes (anulare,
+            # 4xx, JSON invalid, autentificare) redeschide circuitul
+            breaker.release_probe()
+
+    def _breaker(self, endpoint: str) -> CircuitBreaker:
+        """Circuit breaker-ul endpoint-ului (creat la prima utilizare)."""
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            breaker = self._breakers[endpoint] = CircuitBreaker(
+                endpoint, BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_TIMEOUT
+            )
+        return breaker
+
+    @property
+    def circuit_breakers(self) -> dict[str, dict]:
+        """Starea circuit breaker-elor, pentru diagnostice."""
+        return {
+            endpoint: breaker.as_dict()
+            for endpoint, breaker in sorted(self._breakers.items())
+        }
+
+    async def _do_request(
+        self,
+        method: str,
+        url: str,
+        json_data: dict | None = None,
+        headers: dict | None = None,
+        endpoint: str = "",
+        fingerprint_key: str | None = None,
+        proiectie: Callable[[Any], Any] | None = None,
+    ) -> Any:
+        """Execută efectiv cererea HTTP.
+
+        Cu `fingerprint_key`, corpul brut este amprentat (BLAKE2b). Dacă
+        amprenta coincide cu cea din ciclul anterior, se returnează același
+        obiect deja parsat (și proiectat), fără decodare JSON — apelanții pot
+        detecta „neschimbat” prin identitate.
+        Latența, dimensiunea și statusul sunt înregistrate în `metrics`.
+        """
+        kwargs: dict = {}
+        if json_data is not None:
+            kwargs["json"] = json_data
+        if headers is not None:
+            kwargs["headers"] = headers
+
+        start = time.monotonic()
+        status: int | str = "?"
+        raw = b""
+        try:
+            async with self._session.request(
+                method, url, timeout=_TIMEOUT_CERERE, **kwargs
+            ) as resp:
+                status = resp.status
+                await self._verifica_status(resp)
+                raw = await resp.read()
+        except TimeoutError as err:
+            status = "timeout"
+            raise ErovinietaConnectionError(
+                f"Timp de răspuns depășit pentru {url}"
+            ) from err
         except aiohttp.ClientError as err:
+            status = type(err).__name__
             raise ErovinietaConnectionError(
                 f"Cerere eșuată către {url}: {err}"
             ) from err
+        finally:
+            self.metrics.record(
+                endpoint, status, time.monotonic() - start, len(raw)
+            )
+            if self.recorder is not None:
+                self.recorder.inregistreaza(
+                    method,
+                    url,
+                    start=start,
+                    status=status,
+                    cerere=json_data,
+                    corp=raw,
+                )
+
+        digest = b""
+        if fingerprint_key is not None:
+            digest = hashlib.blake2b(raw, digest_size=16).digest()
+            anterior = self._fingerprints.get(fingerprint_key)
+            if anterior is not None and anterior[0] == digest:
+                _LOGGER.debug("Răspuns neschimbat: %s", fingerprint_key)
+                return anterior[1]
+
+        if not raw.strip():
+            raise ErovinietaApiError("Răspuns JSON gol de la server.")
+        try:
+            data = codec.loads(raw)
+        except ValueError as err:
+            raise ErovinietaApiError(
+                f"Răspuns JSON invalid de la server: {err}"
+            ) from err
+        if data is None:
+            raise ErovinietaApiError("Răspuns JSON gol de la server.")
+        if proiectie is not None:
+            data = proiectie(data)
+
+        if fingerprint_key is not None:
+            self._fingerprints[fingerprint_key] = (digest, data)
+        return data
+
+    # ------------------------------------------------------------------
+    #  Cache
+    # ------------------------------------------------------------------
+
+    async def _cached(
+        self,
+        endpoint: str,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Servește din cache sau execută `fetch` și stochează rezultatul.
+
+        O intrare expirată este returnată imediat, iar reîmprospătarea ei
+        rulează în fundal (o singură dată per cheie).
+        """
+        if self._cache is None or not self._cache.handles(endpoint):
+            return await fetch()
+
+        gasit, valoare, proaspat = self._cache.get(endpoint, key)
+        if gasit:
+            if not proaspat:
+                self._refresh_in_background(endpoint, key, fetch)
+            return valoare
+
+        valoare = await fetch()
+        self._cache.set(endpoint, key, valoare)
+        return valoare
+
+    def _din_cache(
+        self, endpoint: str, valoare: Any, conversie: Callable[[Any], Any]
+    ) -> Any:
+        """Proiecția unei valori din cache, refolosită cât valoarea e aceeași.
+
+        Cache-ul păstrează forma serializabilă (liste); înregistrările sunt
+        reconstruite doar când intrarea din cache se schimbă.
+        """
+        anterior = self._proiectii.get(endpoint)
+        if anterior is not None and anterior[0] is valoare:
+            return anterior[1]
+        proiectie = conversie(valoare)
+        self._proiectii[endpoint] = (valoare, proiectie)
+        return proiectie
+
+    def _refresh_in_background(
+        self,
+        endpoint: str,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> None:
+        """Pornește reîmprospătarea unei intrări expirate, dacă nu rulează deja."""
+        if (endpoint, key) in self._refresh_tasks:
+            return
+
+        async def _refresh() -> None:
+            try:
+                valoare = await fetch()
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.debug(
+                    "Reîmprospătarea cache-ului %s a eșuat: %s", endpoint, err
+                )
+            else:
+                if self._cache is not None:
+                    self._cache.set(endpoint, key, valoare)
+            finally:
+                self._refresh_tasks.pop((endpoint, key), None)
+
+        self._refresh_tasks[(endpoint, key)] = self._background_task_factory(
+            _refresh(), f"erovinieta_cache_refresh_{endpoint}"
+        )
 
     # ------------------------------------------------------------------
     #  Helper intern
     # ------------------------------------------------------------------
 
+    def _url(self, url: str) -> str:
+        """Aplică `base_url` (dacă este setat) peste un URL din const."""
+        if self._base_url is None or not url.startswith(BASE_URL):
+            return url
+        return self._base_url + url[len(BASE_URL) :]
+
     @staticmethod
     def _add_timestamp(base_url: str, first_param: bool = True) -> str:
         """Adaugă un timestamp unic la URL (cache-busting)."""
@@ -160,30 +782,139 @@ class ErovinietaAPI:
     #  Metode publice API
     # ------------------------------------------------------------------
 
-    async def get_user_data(self) -> dict:
-        """Obține datele utilizatorului."""
-        url = self._add_timestamp(URL_GET_USER_DATA)
-        return await self._request("GET", url)
+    async def get_user_data(self) -> ProfilUtilizator:
+        """Obține datele utilizatorului.
 
-    async def get_paginated_data(self, limit: int = 20, page: int = 0) -> dict:
+        Profilul (CNP, telefon, adresă) nu trece prin cache-ul de răspunsuri,
+        care este persistat și partajat de toate conturile; coordinatorul îl
+        reîmprospătează oricum rar (DOMAIN_INTERVALS).
+        """
+        url = self._add_timestamp(self._url(URL_GET_USER_DATA))
+        return await self._request(
+            "GET",
+            url,
+            endpoint=ENDPOINT_USER,
+            amprentat=True,
+            proiectie=ProfilUtilizator.din_raspuns,
+        )
+
+    async def get_paginated_data(
+        self, limit: int = 20, page: int = 0
+    ) -> PaginaVehicule:
         """Obține date paginate (vehicule)."""
-        base = f"{URL_GET_PAGINATED}?limit={limit}&page={page}"
+        base = f"{self._url(URL_GET_PAGINATED)}?limit={limit}&page={page}"
         url = self._add_timestamp(base, first_param=False)
-        return await self._request("GET", url)
+        return await self._request(
+            "GET",
+            url,
+            endpoint=ENDPOINT_PAGINATED,
+            key=f"{limit}:{page}",
+            amprentat=True,
+            proiectie=_proiecteaza_pagina,
+        )
+
+    async def iter_paginated_data(
+        self, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[Vehicul]:
+        """Parcurge toate paginile și produce vehiculele.
+
+        Oprirea se face pe baza totalului raportat de server (dacă există)
+        sau la prima pagină incompletă. Pagina următoare este cerută în
+        fundal cât timp pagina curentă este consumată.
+        """
+        page = 0
+        primite = 0
+        prima_cheie = None
+        task = asyncio.create_task(self.get_paginated_data(page_size, page))
+        try:
+            while task is not None:
+                pagina = await task
+                task = None
+                view = pagina.vehicule
+                total = pagina.total
+
+                # Protecție: serverul ignoră parametrul `page` și repetă pagina
+                cheie = (view[0].vin, view[0].plate_no) if view else None
+                if cheie == (None, None):
+                    cheie = None
+                if page > 0 and cheie is not None and cheie == prima_cheie:
+                    _LOGGER.warning(
+                        "Pagina %d repetă prima pagină — opresc paginarea", page
+                    )
+                    return
+                if page == 0:
+                    prima_cheie = cheie
+
+                primite += len(view)
+                mai_sunt = (
+                    primite < total
+                    if total is not None
+                    else len(view) >= page_size
+                )
+                if view and mai_sunt:
+                    page += 1
+                    task = asyncio.create_task(
+                        self.get_paginated_data(page_size, page)
+                    )
+
+                for item in view:
+                    yield item
+        finally:
+            if task is not None:
+                task.cancel()
 
-    async def get_countries(self) -> list:
-        """Obține lista țărilor disponibile."""
-        return await self._request("GET", URL_GET_COUNTRIES)
+    async def get_countries(self) -> tuple[Tara, ...]:
+        """Obține lista țărilor disponibile (partajată între conturi)."""
+        async def _fetch() -> list:
+            tari = await self._request(
+                "GET",
+                self._url(URL_GET_COUNTRIES),
+                endpoint=ENDPOINT_COUNTRIES,
+                proiectie=Tara.lista_din_raspuns,
+            )
+            return [list(tara) for tara in tari]
+
+        valoare = await self._cached(ENDPOINT_COUNTRIES, "", _fetch)
+        return self._din_cache(ENDPOINT_COUNTRIES, valoare, Tara.lista_din_cache)
 
     async def get_tranzactii(self, date_from: int, date_to: int) -> dict:
         """Obține lista de tranzacții într-un interval de timp."""
-        url = URL_TRANZACTII.format(dateFrom=date_from, dateTo=date_to)
-        return await self._request("GET", url)
+        url = self._url(URL_TRANZACTII).format(
+            dateFrom=date_from, dateTo=date_to
+        )
+        return await self._request(
+            "GET", url, endpoint=ENDPOINT_TRANSACTIONS, amprentat=True
+        )
 
-    async def get_detalii_tranzactie(self, series: str) -> dict:
-        """Obține detaliile unei tranzacții specifice."""
-        url = URL_DETALII_TRANZACTIE.format(series=series)
-        return await self._request("GET", url)
+    async def iter_tranzactii(
+        self, date_from: int, date_to: int
+    ) -> AsyncIterator[dict]:
+        """Produce tranzacțiile din interval pe rând, decodate în flux.
+
+        Folosit pentru sincronizările complete, unde răspunsul poate fi mare.
+        """
+        url = self._url(URL_TRANZACTII).format(
+            dateFrom=date_from, dateTo=date_to
+        )
+        async for item in self._stream_request(
+            "GET", url, endpoint=ENDPOINT_TRANSACTIONS, array_key="view"
+        ):
+            yield item
+
+    async def get_detalii_tranzactie(
+        self, series: str
+    ) -> tuple[PozitieFactura, ...]:
+        """Obține pozițiile (produs, valoare) unei tranzacții specifice."""
+        url = self._url(URL_DETALII_TRANZACTIE).format(series=series)
+        pozitii = await self._request(
+            "GET",
+            url,
+            endpoint=ENDPOINT_DETAILS,
+            proiectie=PozitieFactura.lista_din_raspuns,
+        )
+        if pozitii is None:
+            raise ErovinietaApiError(f"Detalii invalide pentru factura {series}.")
+        return pozitii
 
     async def get_treceri_pod(
         self,
@@ -193,30 +924,101 @@ class ErovinietaAPI:
         period: int = 4,
     ) -> dict:
         """Obține istoricul trecerilor de pod pentru un vehicul."""
-        payload = {
-            "vin": vin,
-            "plateNo": plate_no,
-            "certificateSeries": certificate_series,
-            "vehicleFleetEntity": {
-                "certificateSeries": certificate_series,
-                "plateNo": plate_no,
-                "vin": vin,
-            },
-            "period": period,
-        }
-        headers = {
-            "Accept": "application/json, text/plain, */*",
-            "Content-Type": "application/json;charset=UTF-8",
-        }
         return await self._request(
-            "POST", URL_TRECERI_POD, json_data=payload, headers=headers
+            "POST",
+            self._url(URL_TRECERI_POD),
+            json_data=_payload_treceri_pod(vin, plate_no, certificate_series, period),
+            headers=_HEADERS_JSON,
+            endpoint=ENDPOINT_BRIDGE,
+            key=plate_no,
+            amprentat=True,
         )
 
+    async def iter_treceri_pod(
+        self,
+        vin: str,
+        plate_no: str,
+        certificate_series: str,
+        period: int = 4,
+    ) -> AsyncIterator[dict]:
+        """Produce trecerile de pod ale vehiculului pe rând, decodate în flux.
+
+        Folosit pentru backfill-ul pe perioada lungă.
+        """
+        async for item in self._stream_request(
+            "POST",
+            self._url(URL_TRECERI_POD),
+            json_data=_payload_treceri_pod(vin, plate_no, certificate_series, period),
+            headers=_HEADERS_JSON,
+            endpoint=ENDPOINT_BRIDGE,
+            array_key="detectionList",
+        ):
+            yield item
+
     # ------------------------------------------------------------------
     #  Lifecycle
     # ------------------------------------------------------------------
 
+    def stop_background_tasks(self) -> None:
+        """Anulează task-urile din fundal (la descărcarea intrării)."""
+        for task in list(self._refresh_tasks.values()):
+            task.cancel()
+        self._refresh_tasks.clear()
+
     async def close(self) -> None:
         """Închide sesiunea HTTP."""
+        self.stop_background_tasks()
         if self._session and not self._session.closed:
             await self._session.close()
+
+
+_HEADERS_JSON = {
+    "Accept": "application/json, text/plain, */*",
+    "Content-Type": "application/json;charset=UTF-8",
+}
+
+
+def _circuit_deschis(endpoint: str) -> ErovinietaCircuitOpenError:
+    """Eroarea pentru o cerere oprită de circuitul deschis al endpoint-ului."""
+    return ErovinietaCircuitOpenError(
+        f"Endpoint-ul {endpoint} este temporar indisponibil (circuit deschis)."
+    )
+
+
+def _payload_treceri_pod(
+    vin: str, plate_no: str, certificate_series: str, period: int
+) -> dict:
+    """Corpul cererii getDetectionsAndPayments."""
+    return {
+        "vin": vin,
+        "plateNo": plate_no,
+        "certificateSeries": certificate_series,
+        "vehicleFleetEntity": {
+            "certificateSeries": certificate_series,
+            "plateNo": plate_no,
+            "vin": vin,
+        },
+        "period": period,
+    }
+
+
+def _extrage_total(data: dict | list) -> int | None:
+    """Returnează numărul total de înregistrări din metadatele paginii."""
+    if not isinstance(data, dict):
+        return None
+    for cheie in _CHEI_TOTAL_PAGINAT:
+        valoare = data.get(cheie)
+        if isinstance(valoare, int) and not isinstance(valoare, bool):
+            return valoare
+    return None
+
+
+def _proiecteaza_pagina(data: dict | list) -> PaginaVehicule:
+    """Proiectează o pagină getDataPaginated (totalul + vehiculele)."""
+    view = (data.get("view") or []) if isinstance(data, dict) else []
+    return PaginaVehicule(
+        total=_extrage_total(data),
+        vehicule=tuple(
+            Vehicul.din_raspuns(item) for item in view if isinstance(item, dict)
+        ),
+    )
@@ -0,0 +1,118 @@
+"""Cache de răspunsuri API pentru integrarea CNAIR eRovinieta.
+
+Cache LRU cu TTL configurat per endpoint. Intrările expirate nu sunt
+șterse imediat: sunt servite ca „stale” până când o reîmprospătare în
+fundal le înlocuiește, astfel încât un refresh nu așteaptă niciodată
+după un endpoint lent care se schimbă rar (ex: lista de țări).
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+# Marcaj pentru TTL infinit (date imuabile)
+NO_EXPIRY = None
+
+
+class ResponseCache:
+    """Cache LRU cu TTL per endpoint și contoare hit/miss."""
+
+    def __init__(
+        self,
+        ttl: dict[str, int | None],
+        max_entries: int,
+        on_change: Callable[[], None] | None = None,
+    ) -> None:
+        """Inițializează cache-ul.
+
+        `ttl` mapează endpoint → secunde (None = nu expiră). Endpoint-urile
+        care lipsesc din `ttl` nu sunt cache-uite. `on_change` este apelat
+        la fiecare modificare (folosit pentru persistență).
+        """
+        self._ttl = ttl
+        self._max_entries = max(1, max_entries)
+        self._on_change = on_change
+        # (endpoint, cheie) → (moment stocare epoch, valoare)
+        self._entries: OrderedDict[tuple[str, str], tuple[float, Any]] = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def handles(self, endpoint: str) -> bool:
+        """Verifică dacă endpoint-ul are o politică de cache."""
+        return endpoint in self._ttl
+
+    def get(self, endpoint: str, key: str) -> tuple[bool, Any, bool]:
+        """Caută o intrare. Returnează (găsit, valoare, proaspăt)."""
+        intrare = self._entries.get((endpoint, key))
+        if intrare is None:
+            self.misses += 1
+            return False, None, False
+
+        self._entries.move_to_end((endpoint, key))
+        stocat_la, valoare = intrare
+        ttl = self._ttl.get(endpoint)
+        proaspat = ttl is NO_EXPIRY or (time.time() - stocat_la) < ttl
+        if proaspat:
+            self.hits += 1
+        else:
+            self.stale_hits += 1
+        return True, valoare, proaspat
+
+    def set(self, endpoint: str, key: str, value: Any) -> None:
+        """Stochează o valoare și aplică limita LRU."""
+        self._entries[(endpoint, key)] = (time.time(), value)
+        self._entries.move_to_end((endpoint, key))
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        if self._on_change is not None:
+            self._on_change()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Contoare pentru diagnostice."""
+        return {
+            "intrari": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serializează intrările (pentru Store)."""
+        return {
+            "entries": [
+                [endpoint, key, stocat_la, valoare]
+                for (endpoint, key), (stocat_la, valoare) in self._entries.items()
+            ]
+        }
+
+    def load(self, data: dict[str, Any] | None) -> None:
+        """Reîncarcă intrările salvate (ignoră endpoint-urile necunoscute)."""
+        if not isinstance(data, dict):
+            return
+        ignorate = 0
+        for intrare in data.get("entries", []):
+            try:
+                endpoint, key, stocat_la, valoare = intrare
+            except (TypeError, ValueError):
+                ignorate += 1
+                continue
+            if endpoint in self._ttl:
+                self._entries[(endpoint, key)] = (float(stocat_la), valoare)
+            else:
+                ignorate += 1
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        # Intrările ignorate (ex: profiluri salvate de versiuni mai vechi)
+        # sunt șterse și de pe disc
+        if ignorate and self._on_change is not None:
+            self._on_change()
@@ -0,0 +1,138 @@
+"""Casete de trafic: înregistrarea cererilor văzute de ErovinietaAPI.
+
+Cu opțiunea „Înregistrare trafic” activă, fiecare cerere (metodă, URL,
+corp, status, durată, răspuns decodat) este adăugată într-o casetă salvată
+după fiecare refresh în `<config>/erovinieta_casete/<entry_id>.json`.
+Caseta poate fi redată offline cu tools/replay_portal.py.
+
+Datele trec prin `helpers.redact_data`. Valorile sensibile nu sunt șterse,
+ci înlocuite cu pseudonime stabile în interiorul casetei (același număr de
+înmatriculare → același pseudonim), ca legăturile dintre cereri (vehicul →
+treceri pod) să se păstreze la redare. Sarea pseudonimelor este aleatoare
+per casetă și nu este salvată.
+
+Răspunsurile decodate în flux sunt înregistrate ca `{array_key: [...]}`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import secrets
+import time
+from collections import deque
+from typing import Any
+
+from yarl import URL
+
+from . import codec
+from .const import CASSETTE_MAX_INTERACTIONS, CASSETTE_VERSION
+from .helpers import redact_data
+
+_LOGGER = logging.getLogger(__name__)
+
+# Corpul text al răspunsurilor de eroare este trunchiat (ca în excepții)
+_MAX_TEXT = 200
+
+
+class CassetteRecorder:
+    """Caseta unui cont: interacțiunile HTTP redactate, în ordine."""
+
+    def __init__(
+        self, path: str, max_interactiuni: int = CASSETTE_MAX_INTERACTIONS
+    ) -> None:
+        """Inițializează o casetă goală, salvată în `path`."""
+        self.path = path
+        self._interactiuni: deque[dict[str, Any]] = deque(maxlen=max_interactiuni)
+        self._sare = secrets.token_bytes(16)
+        self._start = time.monotonic()
+        self._creata = time.time()
+        self._nesalvata = False
+
+    def __len__(self) -> int:
+        """Numărul de interacțiuni păstrate."""
+        return len(self._interactiuni)
+
+    def _pseudonim(self, cheie: str, valoare: Any) -> Any:
+        """Pseudonim stabil (în casetă) pentru o valoare sensibilă."""
+        if valoare is None or valoare == "":
+            return valoare
+        digest = hashlib.blake2b(
+            str(valoare).encode(), digest_size=5, key=self._sare
+        ).hexdigest()
+        return f"{cheie}-{digest}"
+
+    def _redacteaza(self, data: Any) -> Any:
+        return redact_data(data, inlocuire=self._pseudonim)
+
+    def _url(self, url: str) -> str:
+        """Calea + query redactat, fără host și fără `timestamp`."""
+        adresa = URL(url)
+        query = {
+            cheie: valoare
+            for cheie, valoare in adresa.query.items()
+            if cheie != "timestamp"
+        }
+        return str(URL.build(path=adresa.path, query=self._redacteaza(query)))
+
+    def inregistreaza(
+        self,
+        metoda: str,
+        url: str,
+        *,
+        start: float,
+        status: int | str,
+        cerere: Any = None,
+        corp: bytes = b"",
+        raspuns: Any = None,
+    ) -> None:
+        """Adaugă o interacțiune (`start` = time.monotonic() la trimitere).
+
+        Răspunsul este dat fie ca octeți bruți (`corp`, decodați aici), fie
+        deja decodat (`raspuns`, pentru fluxuri).
+        """
+        interactiune: dict[str, Any] = {
+            "t": round(start - self._start, 3),
+            "durata": round(time.monotonic() - start, 3),
+            "metoda": metoda,
+            "url": self._url(url),
+            "status": status,
+        }
+        if cerere is not None:
+            interactiune["cerere"] = self._redacteaza(cerere)
+        if corp.strip():
+            try:
+                raspuns = codec.loads(corp)
+            except ValueError:
+                interactiune["text"] = corp[:_MAX_TEXT].decode(errors="replace")
+        if raspuns is not None:
+            interactiune["raspuns"] = self._redacteaza(raspuns)
+        self._interactiuni.append(interactiune)
+        self._nesalvata = True
+
+    def as_dict(self) -> dict[str, Any]:
+        """Conținutul casetei (formatul citit de tools/replay_portal.py)."""
+        return {
+            "versiune": CASSETTE_VERSION,
+            "creata": self._creata,
+            "interactiuni": list(self._interactiuni),
+        }
+
+    def salveaza(self) -> None:
+        """Scrie caseta pe disc (blocant — se rulează în executor)."""
+        if not self._nesalvata:
+            return
+        self._nesalvata = False
+        temporar = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(temporar, "wb") as fisier:
+                fisier.write(codec.dumps(self.as_dict()))
+            os.replace(temporar, self.path)
+        except OSError as err:
+            _LOGGER.warning("Caseta %s nu a putut fi salvată: %s", self.path, err)
+            return
+        _LOGGER.debug(
+            "Casetă salvată: %s (%d interacțiuni)", self.path, len(self)
+        )
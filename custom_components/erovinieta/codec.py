@@ -0,0 +1,36 @@
+"""Codec JSON pentru răspunsurile API eRovinieta.
+
+Folosește orjson dacă este instalat (Home Assistant îl include), altfel
+modulul standard `json`. Ambele variante primesc direct octeții
+răspunsului și aruncă o subclasă de `ValueError` pentru JSON invalid.
+
+Nu se folosește pentru mesajele semnate (licență, HMAC) și nici pentru
+cheile derivate din conținut (registrul de tranzacții): acolo contează
+exact forma octeților produsă de `json.dumps(..., sort_keys=True)`.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depinde de mediu
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(data: bytes | str) -> Any:
+    """Decodează un document JSON."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Codifică un obiect ca JSON compact (UTF-8)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
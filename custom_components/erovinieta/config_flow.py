@@ -20,6 +20,7 @@ from homeassistant import config_entries
 from homeassistant.config_entries import ConfigEntry, ConfigFlowResult
 from homeassistant.core import callback
 from homeassistant.helpers.selector import (
+    BooleanSelector,
     NumberSelector,
     NumberSelectorConfig,
     NumberSelectorMode,
@@ -29,18 +30,24 @@ from homeassistant.helpers.selector import (
 )
 
 from .api import ErovinietaAPI
+from .connection import async_get_connection_pool
 from .const import (
+    CONF_INREGISTRARE_TRAFIC,
     CONF_ISTORIC_TRANZACTII,
     CONF_LICENSE_KEY,
     CONF_PASSWORD,
+    CONF_REFRESH_DEADLINE,
     CONF_UPDATE_INTERVAL,
     CONF_USERNAME,
+    DEFAULT_REFRESH_DEADLINE,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
     ISTORIC_TRANZACTII_DEFAULT,
     LICENSE_DATA_KEY,
     LICENSE_PURCHASE_URL,
+    MAX_REFRESH_DEADLINE,
     MAX_UPDATE_INTERVAL,
+    MIN_REFRESH_DEADLINE,
     MIN_UPDATE_INTERVAL,
 )
 from .exceptions import ErovinietaAuthError, ErovinietaConnectionError
@@ -64,6 +71,15 @@ SELECTOR_INTERVAL = NumberSelector(
         mode=NumberSelectorMode.BOX,
     )
 )
+SELECTOR_DEADLINE = NumberSelector(
+    NumberSelectorConfig(
+        min=MIN_REFRESH_DEADLINE,
+        max=MAX_REFRESH_DEADLINE,
+        step=10,
+        unit_of_measurement="secunde",
+        mode=NumberSelectorMode.BOX,
+    )
+)
 SELECTOR_ISTORIC = NumberSelector(
     NumberSelectorConfig(
         min=1,
@@ -254,9 +270,13 @@ class ErovinietaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def _test_credentials(
         self, username: str, password: str
     ) -> dict[str, str]:
-        """Testează credentialele fără a păstra sesiunea."""
+        """Testează credentialele fără a păstra sesiunea.
+
+        Sesiunea temporară folosește pool-ul de conexiuni al domeniului,
+        deci conexiunea TLS deschisă aici e refolosită la setup.
+        """
         errors: dict[str, str] = {}
-        session = aiohttp.ClientSession(
+        session = async_get_connection_pool(self.hass).create_session(
             timeout=aiohttp.ClientTimeout(total=30)
         )
         try:
@@ -332,6 +352,9 @@ class ErovinietaOptionsFlow(config_entries.OptionsFlow):
                     CONF_ISTORIC_TRANZACTII, ISTORIC_TRANZACTII_DEFAULT
                 )
             )
+            deadline = int(
+                user_input.get(CONF_REFRESH_DEADLINE, DEFAULT_REFRESH_DEADLINE)
+            )
 
             if (
                 update_interval < MIN_UPDATE_INTERVAL
@@ -339,12 +362,19 @@ class ErovinietaOptionsFlow(config_entries.OptionsFlow):
             ):
                 errors[CONF_UPDATE_INTERVAL] = "invalid_update_interval"
 
+            if not MIN_REFRESH_DEADLINE <= deadline <= MAX_REFRESH_DEADLINE:
+                errors[CONF_REFRESH_DEADLINE] = "invalid_refresh_deadline"
+
             if not errors:
                 return self.async_create_entry(
                     title="",
                     data={
                         CONF_UPDATE_INTERVAL: update_interval,
                         CONF_ISTORIC_TRANZACTII: istoric,
+                        CONF_REFRESH_DEADLINE: deadline,
+                        CONF_INREGISTRARE_TRAFIC: bool(
+                            user_input.get(CONF_INREGISTRARE_TRAFIC, False)
+                        ),
                     },
                 )
 
@@ -363,6 +393,18 @@ class ErovinietaOptionsFlow(config_entries.OptionsFlow):
                         CONF_ISTORIC_TRANZACTII, ISTORIC_TRANZACTII_DEFAULT
                     ),
                 ): SELECTOR_ISTORIC,
+                vol.Required(
+                    CONF_REFRESH_DEADLINE,
+                    default=self.config_entry.options.get(
+                        CONF_REFRESH_DEADLINE, DEFAULT_REFRESH_DEADLINE
+                    ),
+                ): SELECTOR_DEADLINE,
+                vol.Required(
+                    CONF_INREGISTRARE_TRAFIC,
+                    default=self.config_entry.options.get(
+                        CONF_INREGISTRARE_TRAFIC, False
+                    ),
+                ): BooleanSelector(),
             }
         )
 
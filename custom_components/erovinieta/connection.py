@@ -0,0 +1,192 @@
+"""Pool de conexiuni dedicat host-ului eRovinieta.
+
+Un singur TCPConnector per domeniu, partajat de toate conturile și de
+config flow (testarea credențialelor). Fiecare utilizator primește propria
+ClientSession peste acest connector, cu cookie jar izolat — login-ul unui
+cont nu atinge JSESSIONID-ul altuia, dar conexiunile TLS sunt refolosite.
+
+Setări față de connector-ul generic al HA:
+- cache DNS cu TTL (rezolvarea host-ului nu se repetă la fiecare refresh);
+- keep-alive care acoperă o rafală de refresh (zeci de cereri la rând);
+- limită de conexiuni simultane către host.
+
+Un TraceConfig numără conexiunile noi vs. refolosite și hit-urile DNS,
+expuse în diagnostics.
+"""
+
+from __future__ import annotations
+
+import logging
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.util import ssl as ssl_util
+
+from .const import (
+    CONNECTION_POOL_DATA_KEY,
+    CONNECTOR_DNS_TTL,
+    CONNECTOR_KEEPALIVE,
+    CONNECTOR_LIMIT_PER_HOST,
+    DOMAIN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ConnectionStats:
+    """Contoare de refolosire a conexiunilor, alimentate de TraceConfig."""
+
+    def __init__(self) -> None:
+        """Inițializează contoarele și TraceConfig-ul asociat."""
+        self.cereri = 0
+        self.conexiuni_noi = 0
+        self.conexiuni_refolosite = 0
+        self.asteptari_pool = 0
+        self.dns_hit = 0
+        self.dns_miss = 0
+
+        self.trace_config = aiohttp.TraceConfig()
+        self.trace_config.on_request_start.append(self._on_request_start)
+        self.trace_config.on_connection_create_end.append(self._on_create)
+        self.trace_config.on_connection_reuseconn.append(self._on_reuse)
+        self.trace_config.on_connection_queued_start.append(self._on_queued)
+        self.trace_config.on_dns_cache_hit.append(self._on_dns_hit)
+        self.trace_config.on_dns_cache_miss.append(self._on_dns_miss)
+
+    async def _on_request_start(
+        self, _session: aiohttp.ClientSession, _ctx: SimpleNamespace, _params: Any
+    ) -> None:
+        self.cereri += 1
+
+    async def _on_create(
+        self, _session: aiohttp.ClientSession, _ctx: SimpleNamespace, _params: Any
+    ) -> None:
+        self.conexiuni_noi += 1
+
+    async def _on_reuse(
+        self, _session: aiohttp.ClientSession, _ctx: SimpleNamespace, _params: Any
+    ) -> None:
+        self.conexiuni_refolosite += 1
+
+    async def _on_queued(
+        self, _session: aiohttp.ClientSession, _ctx: SimpleNamespace, _params: Any
+    ) -> None:
+        self.asteptari_pool += 1
+
+    async def _on_dns_hit(
+        self, _session: aiohttp.ClientSession, _ctx: SimpleNamespace, _params: Any
+    ) -> None:
+        self.dns_hit += 1
+
+    async def _on_dns_miss(
+        self, _session: aiohttp.ClientSession, _ctx: SimpleNamespace, _params: Any
+    ) -> None:
+        self.dns_miss += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Contoare pentru diagnostice."""
+        conexiuni = self.conexiuni_noi + self.conexiuni_refolosite
+        return {
+            "cereri": self.cereri,
+            "conexiuni_noi": self.conexiuni_noi,
+            "conexiuni_refolosite": self.conexiuni_refolosite,
+            "rata_refolosire": (
+                round(self.conexiuni_refolosite / conexiuni, 3) if conexiuni else 0
+            ),
+            "asteptari_pool": self.asteptari_pool,
+            "dns_hit": self.dns_hit,
+            "dns_miss": self.dns_miss,
+        }
+
+
+class ErovinietaConnectionPool:
+    """Connector TCP partajat + fabrică de sesiuni cu cookie jar izolat."""
+
+    def __init__(self) -> None:
+        """Creează connector-ul (trebuie apelat din event loop)."""
+        self.stats = ConnectionStats()
+        self._connector = aiohttp.TCPConnector(
+            ssl=ssl_util.get_default_context(),
+            ttl_dns_cache=CONNECTOR_DNS_TTL,
+            keepalive_timeout=CONNECTOR_KEEPALIVE,
+            limit_per_host=CONNECTOR_LIMIT_PER_HOST,
+            enable_cleanup_closed=True,
+        )
+        # Ascultătorul EVENT_HOMEASSISTANT_CLOSE, anulat la închiderea pool-ului
+        self.unsub_inchidere: CALLBACK_TYPE | None = None
+
+    @property
+    def closed(self) -> bool:
+        """Verifică dacă connector-ul a fost închis."""
+        return self._connector.closed
+
+    def create_session(
+        self, timeout: aiohttp.ClientTimeout | None = None
+    ) -> aiohttp.ClientSession:
+        """Creează o sesiune nouă peste connector-ul partajat.
+
+        Sesiunea nu deține connector-ul: închiderea ei (obligatorie, de
+        către apelant) nu închide conexiunile celorlalte conturi.
+        """
+        kwargs: dict[str, Any] = {}
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        return aiohttp.ClientSession(
+            connector=self._connector,
+            connector_owner=False,
+            cookie_jar=aiohttp.CookieJar(),
+            trace_configs=[self.stats.trace_config],
+            **kwargs,
+        )
+
+    async def async_close(self) -> None:
+        """Închide connector-ul și toate conexiunile păstrate."""
+        if self.unsub_inchidere is not None:
+            self.unsub_inchidere()
+            self.unsub_inchidere = None
+        if not self._connector.closed:
+            await self._connector.close()
+            _LOGGER.debug("Pool conexiuni închis: %s", self.stats.as_dict())
+
+    def as_dict(self) -> dict[str, Any]:
+        """Configurație și contoare pentru diagnostice."""
+        return {
+            "ttl_dns_s": CONNECTOR_DNS_TTL,
+            "keepalive_s": CONNECTOR_KEEPALIVE,
+            "limita_per_host": CONNECTOR_LIMIT_PER_HOST,
+            **self.stats.as_dict(),
+        }
+
+
+@callback
+def async_get_connection_pool(hass: HomeAssistant) -> ErovinietaConnectionPool:
+    """Returnează pool-ul de conexiuni al domeniului (creat la nevoie)."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    pool: ErovinietaConnectionPool | None = domain_data.get(CONNECTION_POOL_DATA_KEY)
+    if pool is not None and not pool.closed:
+        return pool
+
+    pool = ErovinietaConnectionPool()
+    domain_data[CONNECTION_POOL_DATA_KEY] = pool
+
+    async def _inchide(_event: Event) -> None:
+        # Ascultătorul a rulat deja; nu mai trebuie (și nu poate fi) anulat
+        pool.unsub_inchidere = None
+        await pool.async_close()
+
+    pool.unsub_inchidere = hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_CLOSE, _inchide
+    )
+    return pool
+
+
+async def async_close_connection_pool(hass: HomeAssistant) -> None:
+    """Închide pool-ul domeniului (la descărcarea ultimului cont)."""
+    pool: ErovinietaConnectionPool | None = hass.data.get(DOMAIN, {}).pop(
+        CONNECTION_POOL_DATA_KEY, None
+    )
+    if pool is not None:
+        await pool.async_close()
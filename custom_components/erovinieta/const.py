@@ -25,6 +25,26 @@ URL_TRECERI_POD = (
     "getDetectionsAndPayments"
 )
 
+# Identificatori de endpoint (amprente răspuns, cache, metrici)
+ENDPOINT_LOGIN = "login"
+ENDPOINT_USER = "user"
+ENDPOINT_PAGINATED = "paginated"
+ENDPOINT_COUNTRIES = "countries"
+ENDPOINT_TRANSACTIONS = "transactions"
+ENDPOINT_DETAILS = "details"
+ENDPOINT_BRIDGE = "bridge"
+
+# Cache răspunsuri: TTL per endpoint (secunde; None = nu expiră). Cache-ul
+# este persistat și partajat de conturi — doar date publice, fără profil.
+CACHE_TTL: dict[str, int | None] = {
+    ENDPOINT_COUNTRIES: 7 * 86400,  # o săptămână
+}
+CACHE_MAX_ENTRIES = 512
+CACHE_DATA_KEY = "erovinieta_response_cache"
+# Stocările per cont (în afara hass.data[DOMAIN]: supraviețuiesc descărcării,
+# ca reîncărcarea și ștergerea să folosească aceeași instanță)
+ENTRY_STORES_DATA_KEY = "erovinieta_entry_stores"
+
 # Chei de configurare
 CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
@@ -37,6 +57,96 @@ MIN_UPDATE_INTERVAL = 300  # 5 minute (secunde)
 MAX_UPDATE_INTERVAL = 86400  # 1 zi (secunde)
 ISTORIC_TRANZACTII_DEFAULT = 2  # ani
 
+# Dimensiunea paginii pentru lista de vehicule (getDataPaginated)
+DEFAULT_PAGE_SIZE = 20
+
+# Număr maxim de cereri simultane către API (treceri pod per vehicul)
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+
+# Sincronizare incrementală tranzacții (milisecunde)
+TX_SYNC_OVERLAP_MS = 3 * 86400 * 1000  # suprapunere față de watermark
+TX_FULL_SYNC_INTERVAL_MS = 7 * 86400 * 1000  # resincronizare completă săptămânală
+# Detalii facturi: câte serii noi se descarcă cel mult într-un refresh
+TX_DETAILS_BATCH = 50
+# Detalii facturi eșuate: reîncercare cu backoff exponențial (milisecunde)
+TX_DETAILS_RETRY_BASE_MS = 3600 * 1000  # prima reîncercare după o oră
+TX_DETAILS_RETRY_MAX_MS = 7 * 86400 * 1000  # apoi cel mult săptămânal
+
+# Treceri pod: codul `period` trimis la getDetectionsAndPayments.
+# Backfill-ul folosește perioada lungă (valoarea istorică a integrării),
+# refresh-urile ulterioare doar perioada scurtă; detecțiile noi se adaugă
+# în registrul local per vehicul.
+BRIDGE_PERIOD_BACKFILL = 4
+BRIDGE_PERIOD_INCREMENTAL = 1
+BRIDGE_FULL_SYNC_INTERVAL_MS = 86400 * 1000  # backfill complet zilnic
+
+# Timeout per cerere HTTP (secunde)
+REQUEST_TIMEOUT = 30
+REQUEST_CONNECT_TIMEOUT = 10
+
+# Termen limită pentru un refresh complet (secunde), împărțit pe etape.
+# La expirare, etapele neterminate sunt anulate și păstrează ultimele date
+# cunoscute, marcate ca învechite.
+CONF_REFRESH_DEADLINE = "refresh_deadline"
+DEFAULT_REFRESH_DEADLINE = 120
+MIN_REFRESH_DEADLINE = 30
+MAX_REFRESH_DEADLINE = 600
+# Marjă pentru anularea etapelor peste termenul limită (plafon strict)
+REFRESH_DEADLINE_GRACE = 5
+# Ponderile etapelor (chei = secțiunile din coordinator.data). Lanțurile
+# de dependențe (vehicule → treceri pod, tranzacții → detalii facturi,
+# utilizator, țări) rulează concurent, fiecare cu tot termenul limită
+# împărțit între etapele lui; timpul neconsumat trece la etapa următoare
+REFRESH_STAGE_SHARES: dict[str, float] = {
+    "user_data": 1,
+    "paginated_data": 2,
+    "countries_data": 1,
+    "treceri_pod_per_vehicul": 4,
+    "transactions": 3,
+    "detalii_tranzactii": 1,
+}
+
+# Intervale de reîmprospătare per domeniu (secunde). Coordinatorul rulează
+# la cel mai scurt interval și reîmprospătează doar domeniile scadente;
+# celelalte păstrează datele din refresh-ul anterior. Vehiculele
+# (roviniete, sold) urmează intervalul configurat (CONF_UPDATE_INTERVAL):
+# trecerile de pod nu rar decât el, domeniile lente nu mai des.
+DOMAIN_INTERVALS: dict[str, int] = {
+    "treceri_pod_per_vehicul": 600,  # 10 minute
+    "user_data": 6 * 3600,
+    "transactions": 86400,  # zilnic
+    "countries_data": 7 * 86400,  # săptămânal
+}
+# Domeniile mai rapide decât intervalul configurat
+DOMAIN_INTERVALS_RAPIDE = frozenset({"treceri_pod_per_vehicul"})
+
+# Reîncercări cu backoff exponențial + jitter (secunde)
+RETRY_ATTEMPTS = 3  # include prima încercare
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 10.0
+
+# Circuit breaker per endpoint
+BREAKER_FAILURE_THRESHOLD = 5  # eșecuri consecutive până la deschidere
+BREAKER_RESET_TIMEOUT = 300  # secunde până la cererea de probă
+
+# Pool de conexiuni dedicat host-ului eRovinieta (partajat de conturi)
+CONNECTION_POOL_DATA_KEY = "erovinieta_connection_pool"
+CONNECTOR_DNS_TTL = 600  # secunde
+# Acoperă o rafală de refresh; între refresh-uri (minute/ore) serverul
+# închide oricum conexiunile inactive
+CONNECTOR_KEEPALIVE = 60  # secunde
+CONNECTOR_LIMIT_PER_HOST = 8
+
+# Răspunsuri mari decodate în flux (sincronizări complete, backfill pod)
+STREAM_CHUNK_SIZE = 16 * 1024  # octeți per bucată citită
+
+# Casete de trafic: cererile și răspunsurile API înregistrate (redactate)
+# pentru redare offline cu tools/replay_portal.py
+CONF_INREGISTRARE_TRAFIC = "inregistrare_trafic"
+CASSETTE_DIR = "erovinieta_casete"  # sub directorul de configurare HA
+CASSETTE_VERSION = 1
+CASSETTE_MAX_INTERACTIONS = 2000  # cele mai vechi sunt eliminate
+
 # Limită atribute de stare (previne > 16384 bytes recorder)
 MAX_ATTR_TRECERI = 20
 
@@ -46,6 +156,16 @@ PLATFORMS: list[str] = ["sensor"]
 # Validitate token (secunde) — puțin sub 1 oră
 TOKEN_VALIDITY_SECONDS = 3500
 
+# Durata reală a sesiunii este învățată din 401-urile primite înainte de
+# TOKEN_VALIDITY_SECONDS: după SESSION_LEARN_SAMPLES expirări timpurii,
+# durata devine cea mai mare vârstă observată × marja.
+SESSION_LEARN_SAMPLES = 2
+SESSION_LEARN_MARGIN = 0.9
+SESSION_LIFETIME_MIN = 300  # secunde
+# Reînnoirea sesiunii în fundal, cu atât înaintea refresh-ului programat
+# (doar dacă sesiunea ar expira până atunci)
+SESSION_RENEW_LEAD = 60  # secunde
+
 # ─────────────────────────────────────────────
 # Licențiere
 # ─────────────────────────────────────────────
@@ -2,30 +2,70 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections.abc import Callable
 from datetime import datetime, timedelta
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
+from homeassistant.util import dt as dt_util
 
 from .api import ErovinietaAPI
 from .const import (
     CONF_ISTORIC_TRANZACTII,
+    CONF_REFRESH_DEADLINE,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_REFRESH_DEADLINE,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
+    DOMAIN_INTERVALS,
+    DOMAIN_INTERVALS_RAPIDE,
     ISTORIC_TRANZACTII_DEFAULT,
     LICENSE_DATA_KEY,
+    REFRESH_DEADLINE_GRACE,
+    REFRESH_STAGE_SHARES,
+    SESSION_RENEW_LEAD,
+    TX_DETAILS_BATCH,
+)
+from .exceptions import (
+    ErovinietaAuthError,
+    ErovinietaCircuitOpenError,
+    ErovinietaClientError,
+    ErovinietaConnectionError,
 )
-from .exceptions import ErovinietaAuthError, ErovinietaConnectionError
 from .helpers import safe_get
+from .ledger import DetectionLedger, TransactionLedger
+from .models import PozitieFactura, ProfilUtilizator, Vehicul
+from .resilience import RefreshBudget
+from .storage import ErovinietaStore
 
 _LOGGER = logging.getLogger(__name__)
 
+# Indexuri din coordinator.data, construite o dată per refresh pentru
+# căutări O(1) în senzori (derivate din secțiunile sursă)
+_INDEXURI = frozenset({"vehicule_per_numar", "tari_per_id"})
+
+
+
+def intervale_domenii(update_interval: int) -> dict[str, int]:
+    """Intervalul (secunde) fiecărui domeniu pentru intervalul configurat."""
+    intervale = {"paginated_data": update_interval}
+    for domeniu, interval in DOMAIN_INTERVALS.items():
+        if domeniu in DOMAIN_INTERVALS_RAPIDE:
+            intervale[domeniu] = min(interval, update_interval)
+        else:
+            intervale[domeniu] = max(interval, update_interval)
+    return intervale
+
 
 class ErovinietaCoordinator(DataUpdateCoordinator[dict]):
     """Coordinator centralizat pentru datele din API-ul eRovinieta."""
@@ -38,16 +78,49 @@ class ErovinietaCoordinator(DataUpdateCoordinator[dict]):
         api: ErovinietaAPI,
         config_entry: ConfigEntry,
         update_interval: int = DEFAULT_UPDATE_INTERVAL,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        store: ErovinietaStore | None = None,
     ) -> None:
-        """Inițializează coordinatorul."""
+        """Inițializează coordinatorul.
+
+        `update_interval` este intervalul vehiculelor; celelalte domenii
+        au propriile intervale (DOMAIN_INTERVALS), iar coordinatorul
+        rulează la cel mai scurt dintre ele.
+        `store` (opțional) persistă registrele locale între restartări.
+        """
+        self.intervale = intervale_domenii(update_interval)
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_coordinator",
-            update_interval=timedelta(seconds=update_interval),
+            update_interval=timedelta(seconds=min(self.intervale.values())),
             config_entry=config_entry,
+            # Listenerii sunt notificați la fiecare refresh: senzorii scriu
+            # starea doar dacă s-au schimbat datele lor (`chei_modificate`)
+            # sau valorile dependente de ceas (expirare, ferestre de timp)
+            always_update=True,
         )
         self.api = api
+        self._max_concurrent = max(1, max_concurrent)
+        self._page_size = max(1, page_size)
+        # Cheile modificate de ultimul refresh: secțiuni sau, pentru datele
+        # per vehicul, "<secțiune>/<nr>". None = necunoscute (primul refresh,
+        # eroare) — senzorii se actualizează toți.
+        self.chei_modificate: frozenset[str] | None = None
+        # Secțiunile (sau "treceri_pod_per_vehicul/<nr>") servite din ultimele
+        # date cunoscute → momentul ultimei actualizări reușite (ISO) sau None
+        self.sectiuni_invechite: dict[str, str | None] = {}
+        self._actualizat_la: dict[str, str] = {}
+        self._esuate: set[str] = set()
+        # Domeniu → momentul (monotonic) de la care trebuie reîmprospătat
+        self._scadente: dict[str, float] = {}
+        # Index → (lista din care a fost construit, index); vezi `_indexeaza`
+        self._indexuri: dict[str, tuple[object, dict]] = {}
+        self._ledger = TransactionLedger(store)
+        self._detectii = DetectionLedger(store)
+        self._anuleaza_reinnoirea: Callable[[], None] | None = None
+        config_entry.async_on_unload(self._opreste_reinnoirea)
 
     async def _async_update_data(self) -> dict:
         """Actualizează datele periodic prin apeluri API.
@@ -56,15 +129,24 @@ class ErovinietaCoordinator(DataUpdateCoordinator[dict]):
         (declanșează reauth flow) și cele de conexiune în UpdateFailed
         (declanșează retry automat).
         """
+        self.chei_modificate = None
         # Verificare licență — nu fetchuim date dacă licența/trial nu e validă
         license_mgr = self.hass.data.get(DOMAIN, {}).get(LICENSE_DATA_KEY)
         if license_mgr and not license_mgr.is_valid:
             _LOGGER.debug("[eRovinieta] Licență invalidă — se omit apelurile API")
             return self.data or {}
 
+        deadline = self.config_entry.options.get(
+            CONF_REFRESH_DEADLINE, DEFAULT_REFRESH_DEADLINE
+        )
         try:
-            return await self._fetch_all_data()
+            # Plafon strict: etapele își împart `deadline`; marja acoperă
+            # doar anularea lor
+            async with asyncio.timeout(deadline + REFRESH_DEADLINE_GRACE):
+                data = await self._fetch_all_data(deadline)
         except ErovinietaAuthError as err:
+            # Credențiale respinse: nicio reînnoire cât timp reauth e în curs
+            self._opreste_reinnoirea()
             raise ConfigEntryAuthFailed(
                 f"Autentificare eșuată: {err}"
             ) from err
@@ -72,98 +154,607 @@ class ErovinietaCoordinator(DataUpdateCoordinator[dict]):
             raise UpdateFailed(
                 f"Eroare de conexiune: {err}"
             ) from err
+        except TimeoutError as err:
+            raise UpdateFailed(
+                f"Actualizarea a depășit termenul limită de {deadline} s"
+            ) from err
         except Exception as err:
             raise UpdateFailed(
                 f"Eroare neașteptată la actualizarea datelor: {err}"
             ) from err
+        finally:
+            # Caseta de trafic (dacă e activă) se salvează după fiecare refresh
+            if self.api.recorder is not None:
+                await self.hass.async_add_executor_job(self.api.recorder.salveaza)
+        # Doar după un refresh reușit sesiunea este validă și merită reînnoită
+        self._programeaza_reinnoirea()
+        return data
 
-    async def _fetch_all_data(self) -> dict:
-        """Obține toate datele necesare din API."""
-        # 1. Date utilizator
-        user_data = await self._safe_fetch(
-            self.api.get_user_data, {}, "date utilizator"
-        )
+    @callback
+    def seteaza_interval(self, update_interval: int) -> None:
+        """Aplică un nou interval configurat; toate domeniile devin scadente."""
+        self.intervale = intervale_domenii(update_interval)
+        self.update_interval = timedelta(seconds=min(self.intervale.values()))
+        self._scadente.clear()
 
-        # 2. Date paginate (vehicule)
-        paginated_data = await self._safe_fetch(
-            self.api.get_paginated_data, {}, "date vehicule"
-        )
-        vehicule = [
-            safe_get(v.get("entity"), {})
-            for v in safe_get(paginated_data.get("view"), [])
-        ]
+    @property
+    def domenii_info(self) -> dict[str, dict[str, int]]:
+        """Intervalul și secundele până la următoarea reîmprospătare."""
+        acum = time.monotonic()
+        return {
+            domeniu: {
+                "interval": interval,
+                "scadent_in": max(
+                    0, round(self._scadente.get(domeniu, acum) - acum)
+                ),
+            }
+            for domeniu, interval in self.intervale.items()
+        }
+
+    def _domenii_scadente(self) -> set[str]:
+        """Domeniile de reîmprospătat în acest refresh.
 
-        # 3. Lista de țări
-        countries_data = await self._safe_fetch(
-            self.api.get_countries, [], "lista de țări"
+        Se ține cont de întârzierea programării (jitter): un domeniu
+        scadent în primul sfert al intervalului coordinatorului rulează
+        acum, nu abia la refresh-ul următor.
+        """
+        toleranta = (
+            self.update_interval.total_seconds() / 4 if self.update_interval else 0
         )
+        prag = time.monotonic() + toleranta
+        return {
+            domeniu
+            for domeniu in self.intervale
+            if self._scadente.get(domeniu, 0) <= prag
+        }
+
+    def _reprogrameaza(self, rulate: set[str]) -> None:
+        """Programează următoarea reîmprospătare a domeniilor reușite.
 
-        # 4. Treceri de pod — per vehicul
-        treceri_per_vehicul: dict[str, list] = {}
-        for vehicul in vehicule:
-            vin = safe_get(vehicul.get("vin"))
-            plate_no = safe_get(vehicul.get("plateNo"))
-            cert = safe_get(vehicul.get("certificateSeries"))
-            if not all([vin, plate_no, cert]):
+        Un domeniu eșuat (inclusiv un singur vehicul la trecerile de pod)
+        rămâne scadent și este reîncercat la refresh-ul următor.
+        """
+        acum = time.monotonic()
+        for domeniu in rulate & self.intervale.keys():
+            if any(
+                cheie == domeniu or cheie.startswith(f"{domeniu}/")
+                for cheie in self._esuate
+            ):
                 continue
+            self._scadente[domeniu] = acum + self.intervale[domeniu]
 
-            try:
-                result = await self.api.get_treceri_pod(vin, plate_no, cert)
-                treceri_per_vehicul[plate_no] = safe_get(
-                    result.get("detectionList"), []
+    @callback
+    def _programeaza_reinnoirea(self) -> None:
+        """Programează reînnoirea sesiunii înaintea refresh-ului următor.
+
+        Dacă sesiunea ar expira până la refresh-ul programat, login-ul se
+        face în fundal cu SESSION_RENEW_LEAD secunde înainte, ca refresh-ul
+        să nu-l mai aștepte. Altfel nu se face niciun login suplimentar.
+        """
+        self._opreste_reinnoirea()
+        if self.update_interval is None:
+            return
+        interval = self.update_interval.total_seconds()
+        if self.api.session_expires_in > interval + SESSION_RENEW_LEAD:
+            return
+        self._anuleaza_reinnoirea = async_call_later(
+            self.hass,
+            max(0.0, interval - SESSION_RENEW_LEAD),
+            self._reinnoieste_sesiunea,
+        )
+
+    @callback
+    def _opreste_reinnoirea(self) -> None:
+        """Anulează reînnoirea programată (refresh nou sau descărcare)."""
+        if self._anuleaza_reinnoirea is not None:
+            self._anuleaza_reinnoirea()
+            self._anuleaza_reinnoirea = None
+
+    async def _reinnoieste_sesiunea(self, _now: datetime) -> None:
+        """Login în fundal; la eșec, refresh-ul se autentifică singur."""
+        self._anuleaza_reinnoirea = None
+        try:
+            await self.api.renew_session()
+        except (ErovinietaAuthError, ErovinietaConnectionError) as err:
+            _LOGGER.debug("Reînnoirea sesiunii în fundal a eșuat: %s", err)
+        else:
+            _LOGGER.debug(
+                "Sesiune reînnoită în fundal (expiră în %d s)",
+                self.api.session_expires_in,
+            )
+
+    async def _fetch_all_data(self, deadline: float) -> dict:
+        """Obține datele domeniilor scadente, în limita `deadline` (s).
+
+        Etapele formează un mic graf de dependențe, rulat ca lanțuri
+        concurente: vehicule → treceri pod, tranzacții → detalii facturi,
+        iar datele utilizatorului și lista de țări sunt independente.
+        Latența unui refresh este astfel cea a celui mai lung lanț.
+
+        Fiecare lanț dispune de tot termenul limită, împărțit între
+        etapele lui după REFRESH_STAGE_SHARES. O etapă care își depășește
+        bugetul este anulată și păstrează ultimele date cunoscute, marcate
+        în `sectiuni_invechite`. Domeniile nescadente păstrează valorile
+        din refresh-ul anterior, fără cereri. Detaliile facturilor rulează
+        după tranzacții sau cât timp registrul are serii de (re)încercat.
+        """
+        anterior = self.data or {}
+        rulate = self._domenii_scadente()
+        if "transactions" in rulate or self._ledger.serii_fara_detalii(_acum_ms()):
+            rulate.add("detalii_tranzactii")
+        self._esuate = set()
+        # Trecerile de pod și detaliile facturilor rulează simultan și își
+        # împart limita de cereri concurente
+        semafor = asyncio.Semaphore(self._max_concurrent)
+
+        def _buget(*etape: str) -> RefreshBudget:
+            """Bugetul unui lanț, pentru etapele lui care rulează."""
+            return RefreshBudget(
+                deadline,
+                {
+                    etapa: REFRESH_STAGE_SHARES[etapa]
+                    for etapa in etape
+                    if etapa in rulate
+                },
+            )
+
+        async def _utilizator() -> ProfilUtilizator:
+            if "user_data" not in rulate:
+                return anterior.get("user_data", ProfilUtilizator())
+            return await self._safe_fetch(
+                self.api.get_user_data,
+                ProfilUtilizator(),
+                "date utilizator",
+                "user_data",
+                _buget("user_data"),
+            )
+
+        async def _vehicule_si_treceri() -> tuple[tuple[Vehicul, ...], dict]:
+            buget = _buget("paginated_data", "treceri_pod_per_vehicul")
+            # Toate paginile getDataPaginated
+            if "paginated_data" in rulate:
+                vehicule = await self._safe_fetch(
+                    self._fetch_paginated_toate,
+                    (),
+                    "date vehicule",
+                    "paginated_data",
+                    buget,
                 )
-            except ErovinietaAuthError:
-                raise  # Propagăm erori de autentificare
-            except Exception as err:
-                _LOGGER.warning(
-                    "Eroare la obținerea trecerilor pentru %s: %s", plate_no, err
+            else:
+                vehicule = anterior.get("paginated_data", ())
+            # Per vehicul, în paralel (limitat de semafor)
+            if "treceri_pod_per_vehicul" not in rulate:
+                return vehicule, anterior.get("treceri_pod_per_vehicul", {})
+            return vehicule, await self._fetch_treceri_toate(
+                vehicule, semafor, buget.pentru("treceri_pod_per_vehicul")
+            )
+
+        async def _tari() -> tuple:
+            if "countries_data" not in rulate:
+                return anterior.get("countries_data", ())
+            return await self._safe_fetch(
+                self.api.get_countries,
+                (),
+                "lista de țări",
+                "countries_data",
+                _buget("countries_data"),
+            )
+
+        async def _tranzactii() -> list:
+            buget = _buget("transactions", "detalii_tranzactii")
+            # Sincronizare incrementală în registrul local
+            if "transactions" in rulate:
+                transactions = await self._sync_tranzactii(
+                    buget.pentru("transactions")
                 )
-                treceri_per_vehicul[plate_no] = []
+            else:
+                transactions = anterior.get("transactions", self._ledger.tranzactii)
+            # Detalii facturi — doar pentru seriile noi (o dată per factură)
+            if "detalii_tranzactii" in rulate:
+                await self._fetch_detalii_noi(
+                    semafor, buget.pentru("detalii_tranzactii")
+                )
+            return transactions
 
-        # 5. Tranzacții
-        istoric = self.config_entry.options.get(
-            CONF_ISTORIC_TRANZACTII, ISTORIC_TRANZACTII_DEFAULT
-        )
-        now = datetime.now()
-        date_from = int(
-            (now - timedelta(days=istoric * 365)).timestamp() * 1000
+        lanturi = [
+            asyncio.create_task(lant())
+            for lant in (_utilizator, _vehicule_si_treceri, _tari, _tranzactii)
+        ]
+        # Fiecare lanț se oprește singur la epuizarea bugetului; o eroare de
+        # autentificare le anulează pe celelalte și este propagată
+        await _asteapta_sau_anuleaza(lanturi, None)
+        user_data, (vehicule, treceri_per_vehicul), countries_data, transactions = (
+            lant.result() for lant in lanturi
         )
-        date_to = int(now.timestamp() * 1000)
 
-        try:
-            tx_result = await self.api.get_tranzactii(date_from, date_to)
-            transactions = safe_get(tx_result.get("view"), [])
-        except ErovinietaAuthError:
-            raise
-        except Exception as err:
-            _LOGGER.warning("Eroare la obținerea tranzacțiilor: %s", err)
-            transactions = []
+        self._actualizeaza_invechite(rulate, treceri_per_vehicul)
+        self._reprogrameaza(rulate)
 
         _LOGGER.debug(
-            "Actualizare completă: %d vehicule, %d treceri pod, %d tranzacții",
+            "Actualizare (%s): %d vehicule, %d treceri pod, %d tranzacții",
+            ", ".join(sorted(rulate)),
             len(vehicule),
             sum(len(v) for v in treceri_per_vehicul.values()),
             len(transactions),
         )
 
-        return {
+        data = {
             "user_data": user_data,
-            "paginated_data": paginated_data,
+            "paginated_data": vehicule,
+            "vehicule_per_numar": self._indexeaza(
+                "vehicule_per_numar",
+                vehicule,
+                lambda: {vehicul.plate_no: vehicul for vehicul in vehicule},
+            ),
             "countries_data": countries_data,
+            "tari_per_id": self._indexeaza(
+                "tari_per_id",
+                countries_data,
+                lambda: {tara.id: tara.denumire for tara in countries_data},
+            ),
             "transactions": transactions,
             "treceri_pod_per_vehicul": treceri_per_vehicul,
+            "detalii_tranzactii": self._ledger.detalii,
+            "sectiuni_invechite": self.sectiuni_invechite,
+        }
+        if anterior:
+            self.chei_modificate = _chei_modificate(anterior, data)
+            _LOGGER.debug("Chei modificate: %s", sorted(self.chei_modificate))
+        return data
+
+    def _indexeaza(
+        self, nume: str, sursa: object, construieste: Callable[[], dict]
+    ) -> dict:
+        """Indexul `nume` al listei `sursa`, reconstruit doar când ea se schimbă.
+
+        Secțiunile nescadente sau cu amprentă neschimbată păstrează
+        același obiect, deci indexul (tot același obiect) nu mai este
+        refăcut, iar senzorii îl văd neschimbat.
+        """
+        anterior = self._indexuri.get(nume)
+        if anterior is not None and anterior[0] is sursa:
+            return anterior[1]
+        index = construieste()
+        self._indexuri[nume] = (sursa, index)
+        return index
+
+    def _actualizeaza_invechite(
+        self, rulate: set[str], treceri: dict[str, list]
+    ) -> None:
+        """Reține momentul actualizării pentru secțiunile rulate și reușite.
+
+        Secțiunile nescadente nu sunt învechite: rămân cu marcajul lor
+        (de obicei niciunul) până la următoarea rulare.
+        """
+        acum = dt_util.utcnow().isoformat()
+        chei = set(rulate)
+        if "treceri_pod_per_vehicul" in rulate:
+            chei |= {f"treceri_pod_per_vehicul/{plate_no}" for plate_no in treceri}
+        for cheie in chei - self._esuate:
+            self._actualizat_la[cheie] = acum
+        invechite = {
+            cheie: moment
+            for cheie, moment in self.sectiuni_invechite.items()
+            if cheie.split("/", 1)[0] not in rulate
         }
+        invechite.update(
+            (cheie, self._actualizat_la.get(cheie)) for cheie in self._esuate
+        )
+        self.sectiuni_invechite = dict(sorted(invechite.items()))
+        if self.sectiuni_invechite:
+            _LOGGER.warning(
+                "Date învechite (ultimele valori cunoscute): %s",
+                ", ".join(self.sectiuni_invechite),
+            )
 
-    async def _safe_fetch(self, func, default, name: str):
-        """Execută un apel API cu protecție la erori.
+    async def _sync_tranzactii(self, timeout: float) -> list:
+        """Aduce doar tranzacțiile noi de la ultimul watermark.
+
+        Sincronizarea completă (răspuns mare) este decodată în flux,
+        direct în registru; cea incrementală folosește cererea obișnuită.
+        La eroare sau la depășirea bugetului (`timeout`, secunde) se
+        păstrează registrul existent, deci senzorul rămâne pe ultimele
+        date cunoscute.
+        """
+        istoric = self.config_entry.options.get(
+            CONF_ISTORIC_TRANZACTII, ISTORIC_TRANZACTII_DEFAULT
+        )
+        date_to = int(time.time() * 1000)
+        date_from = date_to - istoric * 365 * 86400 * 1000
+        sync_from, complet = self._ledger.interval_sincronizare(date_from, date_to)
+
+        try:
+            async with asyncio.timeout(timeout):
+                if complet:
+                    await self._ledger.aplica_flux(
+                        self.api.iter_tranzactii(sync_from, date_to),
+                        date_from,
+                        date_to,
+                        complet,
+                    )
+                    return self._ledger.tranzactii
+                tx_result = await self.api.get_tranzactii(sync_from, date_to)
+        except ErovinietaAuthError:
+            raise
+        except TimeoutError:
+            _LOGGER.warning(
+                "Tranzacțiile nu au sosit în %.1f s — se păstrează ultimele date",
+                timeout,
+            )
+            self._esuate.add("transactions")
+            return self._ledger.tranzactii
+        except Exception as err:
+            _LOGGER.warning("Eroare la obținerea tranzacțiilor: %s", err)
+            self._esuate.add("transactions")
+            return self._ledger.tranzactii
+
+        self._ledger.aplica(
+            safe_get(tx_result.get("view"), []), date_from, date_to, complet
+        )
+        return self._ledger.tranzactii
+
+    async def _fetch_detalii_noi(
+        self, semafor: asyncio.Semaphore, timeout: float
+    ) -> None:
+        """Descarcă detaliile facturilor noi, concurent și limitat (`semafor`).
+
+        Cel mult TX_DETAILS_BATCH serii per refresh; restul (ex: la prima
+        rulare pe un cont cu sute de facturi) continuă la refresh-urile
+        următoare. Seriile neterminate în `timeout` secunde sau oprite de
+        circuitul deschis sunt reîncercate data viitoare; celelalte eșecuri
+        sunt reținute în registru (backoff, iar HTTP 4xx definitiv).
+        """
+        acum_ms = _acum_ms()
+        serii = self._ledger.serii_fara_detalii(acum_ms)[:TX_DETAILS_BATCH]
+        if not serii:
+            return
+        noi: dict[str, tuple[PozitieFactura, ...]] = {}
+        esuate: dict[str, bool] = {}  # serie → respinsă definitiv
+
+        async def _detalii(serie: str) -> None:
+            async with semafor:
+                try:
+                    detalii = await self.api.get_detalii_tranzactie(serie)
+                except (ErovinietaAuthError, ErovinietaCircuitOpenError):
+                    raise
+                except ErovinietaClientError as err:
+                    _LOGGER.debug("Detalii respinse pentru %s: %s", serie, err)
+                    esuate[serie] = True
+                except Exception as err:
+                    _LOGGER.debug("Detalii indisponibile pentru %s: %s", serie, err)
+                    esuate[serie] = False
+                else:
+                    noi[serie] = detalii
+
+        tasks = [asyncio.create_task(_detalii(serie)) for serie in serii]
+        try:
+            terminate = await _asteapta_sau_anuleaza(tasks, timeout)
+        except ErovinietaCircuitOpenError:
+            terminate = []
+        if len(terminate) < len(tasks):
+            self._esuate.add("detalii_tranzactii")
+
+        self._ledger.aplica_detalii(noi, esuate, acum_ms)
+        _LOGGER.debug(
+            "Detalii facturi: %d descărcate, %d eșuate, %d rămase",
+            len(noi),
+            len(esuate),
+            len(self._ledger.serii_fara_detalii(acum_ms)),
+        )
+
+    async def _fetch_paginated_toate(self) -> tuple[Vehicul, ...]:
+        """Colectează vehiculele din toate paginile getDataPaginated."""
+        return tuple(
+            [
+                vehicul
+                async for vehicul in self.api.iter_paginated_data(self._page_size)
+            ]
+        )
+
+    async def _fetch_treceri_toate(
+        self,
+        vehicule: tuple[Vehicul, ...],
+        semafor: asyncio.Semaphore,
+        timeout: float,
+    ) -> dict[str, list]:
+        """Obține trecerile de pod pentru toate vehiculele, concurent.
+
+        Numărul de cereri simultane este limitat de `semafor`. Rezultatele
+        sunt returnate în ordinea vehiculelor din lista paginată.
+        Vehiculele neterminate în `timeout` secunde păstrează ultimele
+        detecții cunoscute.
+        """
+        tinte = [
+            (vehicul.vin, vehicul.plate_no, vehicul.certificate_series)
+            for vehicul in vehicule
+            if vehicul.identificabil
+        ]
+
+        # O listă de rezervă (etapa vehiculelor eșuată, ex: `()` după restart)
+        # nu trebuie să golească registrul persistent
+        if "paginated_data" not in self._esuate:
+            self._detectii.pastreaza({plate_no for _, plate_no, _ in tinte})
+        if not tinte:
+            self._detectii.salveaza()
+            return {}
+
+        tasks = [
+            asyncio.create_task(
+                self._fetch_treceri_vehicul(semafor, vin, plate_no, cert)
+            )
+            for vin, plate_no, cert in tinte
+        ]
+        terminate = await _asteapta_sau_anuleaza(tasks, timeout)
+
+        rezultate: dict[str, list] = {}
+        for (_, plate_no, _), task in zip(tinte, tasks):
+            if task in terminate:
+                rezultate[plate_no] = task.result()
+            else:
+                self._esuate.add(f"treceri_pod_per_vehicul/{plate_no}")
+                rezultate[plate_no] = self._detectii.detectii(plate_no)
+
+        self._detectii.salveaza()
+        return rezultate
+
+    async def _fetch_treceri_vehicul(
+        self,
+        semafor: asyncio.Semaphore,
+        vin: str,
+        plate_no: str,
+        cert: str,
+    ) -> list:
+        """Obține trecerile de pod noi pentru un singur vehicul.
+
+        Prima dată (și zilnic) se face backfill pe perioada lungă, decodat
+        în flux, apoi doar perioada scurtă; rezultatul e integrat în
+        registrul local.
+        Erorile de autentificare sunt propagate; restul sunt izolate
+        la nivel de vehicul (ultimele detecții cunoscute + avertisment).
+        """
+        now_ms = int(time.time() * 1000)
+        period, complet = self._detectii.perioada(plate_no, now_ms)
+        async with semafor:
+            try:
+                if complet:
+                    await self._detectii.aplica_flux(
+                        plate_no,
+                        self.api.iter_treceri_pod(vin, plate_no, cert, period=period),
+                        now_ms,
+                        complet,
+                    )
+                    return self._detectii.detectii(plate_no)
+                result = await self.api.get_treceri_pod(
+                    vin, plate_no, cert, period=period
+                )
+            except ErovinietaAuthError:
+                raise  # Propagăm erori de autentificare
+            except Exception as err:
+                _LOGGER.warning(
+                    "Eroare la obținerea trecerilor pentru %s: %s", plate_no, err
+                )
+                self._esuate.add(f"treceri_pod_per_vehicul/{plate_no}")
+                return self._detectii.detectii(plate_no)
+
+        self._detectii.aplica(
+            plate_no,
+            safe_get(result.get("detectionList"), []),
+            now_ms,
+            complet,
+        )
+        return self._detectii.detectii(plate_no)
+
+    async def _safe_fetch(
+        self, func, default, name: str, sectiune: str, buget: RefreshBudget
+    ):
+        """Execută o etapă a refresh-ului cu protecție la erori și buget.
 
         Erorile de autentificare sunt propagate (declanșează reauth).
-        Restul erorilor sunt loggate și returnează valoarea implicită.
+        La alte erori sau la depășirea bugetului se returnează ultima
+        valoare cunoscută a secțiunii (sau valoarea implicită).
         """
+        timeout = buget.pentru(sectiune)
         try:
-            return await func()
+            async with asyncio.timeout(timeout):
+                return await func()
         except ErovinietaAuthError:
             raise
+        except TimeoutError:
+            _LOGGER.warning(
+                "Termen depășit (%.1f s) la obținerea %s — se păstrează ultimele date",
+                timeout,
+                name,
+            )
         except Exception as err:
             _LOGGER.warning("Eroare la obținerea %s: %s", name, err)
-            return default
+        self._esuate.add(sectiune)
+        return (self.data or {}).get(sectiune, default)
+
+
+def _egale(vechi: object, nou: object) -> bool:
+    """Comparație ieftină: identitate, apoi `==`.
+
+    API-ul refolosește obiectul parsat când corpul brut are aceeași
+    amprentă, deci comparația este în mare parte pe identitate.
+    """
+    return vechi is nou or vechi == nou
+
+
+def _chei_per_vehicul(sectiune: str, vechi: dict, nou: dict) -> set[str]:
+    """Cheile "<secțiune>/<nr>" ale vehiculelor cu date diferite."""
+    return {
+        f"{sectiune}/{plate_no}"
+        for plate_no in vechi.keys() | nou.keys()
+        if plate_no not in vechi
+        or plate_no not in nou
+        or not _egale(vechi[plate_no], nou[plate_no])
+    }
+
+
+def _chei_modificate(anterior: dict, data: dict) -> frozenset[str]:
+    """Cheile modificate între două versiuni ale `coordinator.data`.
+
+    Vehiculele și trecerile de pod sunt comparate per vehicul, iar
+    marcajele de învechire per cheie — un senzor este notificat doar
+    când se schimbă ceva din ce afișează.
+    """
+    chei: set[str] = set()
+    for sectiune, valoare in data.items():
+        vechi = anterior.get(sectiune)
+        if _egale(vechi, valoare):
+            continue
+        if sectiune in _INDEXURI:
+            # Derivate din paginated_data / countries_data
+            continue
+        if sectiune == "paginated_data":
+            chei |= _chei_per_vehicul(
+                sectiune,
+                anterior.get("vehicule_per_numar") or {},
+                data["vehicule_per_numar"],
+            )
+        elif sectiune == "treceri_pod_per_vehicul":
+            chei |= _chei_per_vehicul(sectiune, vechi or {}, valoare)
+        elif sectiune == "sectiuni_invechite":
+            vechi = vechi or {}
+            chei |= vechi.keys() ^ valoare.keys()
+            chei |= {
+                cheie
+                for cheie in vechi.keys() & valoare.keys()
+                if vechi[cheie] != valoare[cheie]
+            }
+        else:
+            chei.add(sectiune)
+    return frozenset(chei)
+
+
+def _acum_ms() -> int:
+    """Momentul curent (epoch, milisecunde), ca în timestamp-urile API."""
+    return int(time.time() * 1000)
+
+
+async def _asteapta_sau_anuleaza(
+    tasks: list[asyncio.Task], timeout: float | None
+) -> set[asyncio.Task]:
+    """Așteaptă task-urile cel mult `timeout` secunde (None = fără limită).
+
+    Task-urile neterminate sunt anulate; o eroare (de autentificare) a
+    oricărui task le anulează pe celelalte și este propagată. Returnează
+    task-urile terminate cu succes.
+    """
+    try:
+        terminate, ramase = await asyncio.wait(
+            tasks, timeout=timeout, return_when=asyncio.FIRST_EXCEPTION
+        )
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+    for task in ramase:
+        task.cancel()
+    if ramase:
+        await asyncio.wait(ramase)
+    for task in terminate:
+        if task.exception() is not None:
+            raise task.exception()
+    return terminate
@@ -4,6 +4,9 @@ Diagnosticare pentru integrarea CNAIR eRovinieta.
 Exportă informații de diagnostic pentru support tickets:
 - Licență (fingerprint, status, cheie mascată)
 - Coordinator și date statistice
+- Cache răspunsuri API (hit/miss)
+- Pool conexiuni (conexiuni noi vs. refolosite, cache DNS)
+- Metrici API per endpoint (latență, octeți, coduri HTTP, reîncercări)
 - Starea senzorilor
 
 Datele sensibile (parolă, token-uri) sunt excluse.
@@ -16,7 +19,13 @@ from typing import Any
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN, LICENSE_DATA_KEY
+from . import codec
+from .const import (
+    CACHE_DATA_KEY,
+    CONNECTION_POOL_DATA_KEY,
+    DOMAIN,
+    LICENSE_DATA_KEY,
+)
 
 
 async def async_get_config_entry_diagnostics(
@@ -43,13 +52,19 @@ async def async_get_config_entry_diagnostics(
     if coordinator:
         coordinator_info = {
             "last_update_success": coordinator.last_update_success,
+            "codec_json": codec.BACKEND,
+            "metrici_api": coordinator.api.metrics.as_dict(),
+            "circuit_breakers": coordinator.api.circuit_breakers,
+            "sesiune": coordinator.api.session_info,
+            "sectiuni_invechite": coordinator.sectiuni_invechite,
+            "domenii": coordinator.domenii_info,
         }
         if coordinator.data:
-            paginated = coordinator.data.get("paginated_data", {}).get("view", [])
+            vehicule = coordinator.data.get("paginated_data", ())
             treceri = coordinator.data.get("treceri_pod_per_vehicul", {})
             transactions = coordinator.data.get("transactions", [])
             coordinator_info.update({
-                "vehicule_count": len(paginated),
+                "vehicule_count": len(vehicule),
                 "treceri_per_vehicul": {
                     plate: len(detections)
                     for plate, detections in treceri.items()
@@ -57,6 +72,14 @@ async def async_get_config_entry_diagnostics(
                 "transactions_count": len(transactions),
             })
 
+    # ── Cache răspunsuri API (partajat între conturi) ──
+    cache = hass.data.get(DOMAIN, {}).get(CACHE_DATA_KEY)
+    cache_info: dict[str, Any] = cache.stats if cache else {}
+
+    # ── Pool conexiuni (partajat între conturi și config flow) ──
+    pool = hass.data.get(DOMAIN, {}).get(CONNECTION_POOL_DATA_KEY)
+    conexiuni_info: dict[str, Any] = pool.as_dict() if pool else {}
+
     # ── Senzori activi ──
     senzori_activi = sorted(
         entitate.entity_id
@@ -75,6 +98,8 @@ async def async_get_config_entry_diagnostics(
         },
         "licenta": licenta_info,
         "coordinator": coordinator_info,
+        "cache": cache_info,
+        "conexiuni": conexiuni_info,
         "stare": {
             "senzori_activi": len(senzori_activi),
             "lista_senzori": senzori_activi,
@@ -15,5 +15,17 @@ class ErovinietaConnectionError(ErovinietaError):
     """Eroare de conexiune la API-ul eRovinieta."""
 
 
+class ErovinietaCircuitOpenError(ErovinietaConnectionError):
+    """Circuitul endpoint-ului este deschis — cererea nu a plecat."""
+
+
 class ErovinietaApiError(ErovinietaError):
     """Eroare generală la apelul API-ului eRovinieta."""
+
+
+class ErovinietaServerError(ErovinietaApiError):
+    """Eroare temporară a serverului (HTTP 5xx) — poate fi reîncercată."""
+
+
+class ErovinietaClientError(ErovinietaApiError):
+    """Cerere respinsă de server (HTTP 4xx) — reîncercarea nu o schimbă."""
@@ -2,10 +2,30 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
 from homeassistant.util import dt as dt_util
 
+# Chei ale căror valori nu apar în diagnostice și casete de trafic
+CHEI_SENSIBILE: frozenset[str] = frozenset(
+    {
+        "username",
+        "password",
+        "cnpCui",
+        "email",
+        "telefon",
+        "adresa",
+        "vin",
+        "certificateSeries",
+        "nume",
+        "cont",
+        "plateNo",
+        "paymentPlateNo",
+        "JSESSIONID",
+    }
+)
+
 
 def format_timestamp_ms(timestamp_millis: int | float | None) -> str:
     """Formatează un timestamp în milisecunde în format YYYY-MM-DD HH:MM:SS.
@@ -43,34 +63,29 @@ def capitalize_name(name: str) -> str:
     return " ".join(word.capitalize() for word in name.split())
 
 
-def redact_data(data: Any, keys_to_redact: set[str] | None = None) -> Any:
+def redact_data(
+    data: Any,
+    keys_to_redact: set[str] | frozenset[str] | None = None,
+    inlocuire: Callable[[str, Any], Any] | None = None,
+) -> Any:
     """Redactează date sensibile pentru diagnostice.
 
     Parcurge recursiv dict-uri și liste, înlocuind valorile
-    corespunzătoare cheilor sensibile cu '**REDACTED**'.
+    corespunzătoare cheilor sensibile cu '**REDACTED**' sau, dacă este dată,
+    cu `inlocuire(cheie, valoare)` (ex: pseudonime în casetele de trafic).
     """
     if keys_to_redact is None:
-        keys_to_redact = {
-            "username",
-            "password",
-            "cnpCui",
-            "email",
-            "telefon",
-            "adresa",
-            "vin",
-            "certificateSeries",
-            "nume",
-            "cont",
-            "plateNo",
-            "paymentPlateNo",
-            "JSESSIONID",
-        }
+        keys_to_redact = CHEI_SENSIBILE
 
     if isinstance(data, dict):
         return {
-            k: ("**REDACTED**" if k in keys_to_redact else redact_data(v, keys_to_redact))
+            k: (
+                ("**REDACTED**" if inlocuire is None else inlocuire(k, v))
+                if k in keys_to_redact
+                else redact_data(v, keys_to_redact, inlocuire)
+            )
             for k, v in data.items()
         }
     if isinstance(data, (list, tuple)):
-        return [redact_data(item, keys_to_redact) for item in data]
+        return [redact_data(item, keys_to_redact, inlocuire) for item in data]
     return data
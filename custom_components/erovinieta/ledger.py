@@ -0,0 +1,394 @@
+"""Registre locale pentru sincronizarea incrementală a datelor eRovinieta.
+
+TransactionLedger păstrează facturile contului (cheie: seria facturii)
+și un „watermark” — momentul până la care istoricul a fost descărcat.
+După prima sincronizare completă, fiecare refresh cere doar intervalul
+de la watermark (minus o mică suprapunere) până acum. Detaliile fiecărei
+facturi (imuabile) sunt păstrate permanent, deci se descarcă o singură dată.
+O serie ale cărei detalii eșuează este reîncercată cu backoff exponențial;
+una respinsă de server (HTTP 4xx) nu mai este cerută.
+
+DetectionLedger păstrează trecerile de pod per vehicul (cheie: moment
+detectare + bandă + direcție). După un backfill pe perioada lungă,
+refresh-urile cer doar perioada scurtă și adaugă detecțiile noi.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from collections.abc import AsyncIterable
+from typing import Any
+
+from .const import (
+    BRIDGE_FULL_SYNC_INTERVAL_MS,
+    BRIDGE_PERIOD_BACKFILL,
+    BRIDGE_PERIOD_INCREMENTAL,
+    TX_DETAILS_RETRY_BASE_MS,
+    TX_DETAILS_RETRY_MAX_MS,
+    TX_FULL_SYNC_INTERVAL_MS,
+    TX_SYNC_OVERLAP_MS,
+)
+from .models import PozitieFactura
+from .storage import ErovinietaStore
+
+_LOGGER = logging.getLogger(__name__)
+
+# Câmpuri posibile pentru seria facturii în răspunsul getTransaction
+_CHEI_SERIE = ("series", "serie", "seria", "invoiceSeries")
+
+
+def cheie_tranzactie(item: dict[str, Any]) -> str:
+    """Identitatea stabilă a unei tranzacții (seria facturii).
+
+    Dacă seria lipsește, se folosește un hash al înregistrării.
+    """
+    for camp in _CHEI_SERIE:
+        valoare = item.get(camp)
+        if valoare:
+            return str(valoare)
+    brut = json.dumps(item, sort_keys=True, default=str).encode()
+    return "h:" + hashlib.blake2b(brut, digest_size=12).hexdigest()
+
+
+def cheie_detectie(item: dict[str, Any]) -> str:
+    """Identitatea stabilă a unei detecții: moment, bandă, direcție."""
+    return (
+        f"{item.get('detectionTimestamp')}|{item.get('lane')}"
+        f"|{item.get('direction')}"
+    )
+
+
+class TransactionLedger:
+    """Registru de facturi cu watermark, persistat în ErovinietaStore."""
+
+    SECTIUNE = "tranzactii"
+
+    def __init__(self, store: ErovinietaStore | None = None) -> None:
+        """Încarcă registrul din stocare (dacă există)."""
+        self._store = store
+        stare = (store.get(self.SECTIUNE) if store else None) or {}
+        self._window_from: int | None = stare.get("window_from")
+        self._watermark: int | None = stare.get("watermark")
+        self._full_sync_at: int = stare.get("full_sync_at", 0)
+        self._records: dict[str, dict] = dict(stare.get("records", {}))
+        # Serie → pozițiile facturii, ca perechi [produs, valoare] (JSON)
+        self._detalii: dict[str, list[list]] = {
+            serie: [list(p) for p in PozitieFactura.lista_din_cache(detalii)]
+            for serie, detalii in stare.get("details", {}).items()
+        }
+        # Serie → [încercări eșuate, următoarea încercare (ms) sau None =
+        # respinsă definitiv]
+        self._esecuri: dict[str, list] = dict(stare.get("details_failures", {}))
+        self._lista: list[dict] | None = None
+
+    @property
+    def tranzactii(self) -> list[dict]:
+        """Tranzacțiile din registru (aceeași listă cât timp nu se schimbă)."""
+        if self._lista is None:
+            self._lista = list(self._records.values())
+        return self._lista
+
+    @property
+    def detalii(self) -> dict[str, list[list]]:
+        """Pozițiile [produs, valoare] descărcate, per serie de factură."""
+        return self._detalii
+
+    def serii_fara_detalii(self, acum_ms: int) -> list[str]:
+        """Seriile ale căror detalii trebuie descărcate (sau reîncercate) acum.
+
+        Sunt excluse seriile respinse definitiv și cele eșuate a căror
+        reîncercare nu este încă scadentă.
+        """
+        return [
+            serie
+            for serie in self._records
+            if serie not in self._detalii
+            and not serie.startswith("h:")
+            and self._reincercare_scadenta(serie, acum_ms)
+        ]
+
+    def _reincercare_scadenta(self, serie: str, acum_ms: int) -> bool:
+        """Seria nu a eșuat încă sau backoff-ul ei a expirat."""
+        esec = self._esecuri.get(serie)
+        if esec is None:
+            return True
+        urmatoarea = esec[1]
+        return urmatoarea is not None and urmatoarea <= acum_ms
+
+    def aplica_detalii(
+        self,
+        detalii: dict[str, tuple[PozitieFactura, ...]],
+        esuate: dict[str, bool],
+        acum_ms: int,
+    ) -> None:
+        """Stochează detaliile noi și eșecurile (serie → respinsă definitiv?).
+
+        Detaliile sunt păstrate permanent — facturile nu se modifică. O serie
+        eșuată temporar este reîncercată după TX_DETAILS_RETRY_BASE_MS,
+        intervalul dublându-se la fiecare eșec (până la TX_DETAILS_RETRY_MAX_MS).
+        """
+        if not detalii and not esuate:
+            return
+        if detalii:
+            self._detalii = {
+                **self._detalii,
+                **{
+                    serie: [list(p) for p in pozitii]
+                    for serie, pozitii in detalii.items()
+                },
+            }
+        for serie in detalii.keys() & self._esecuri.keys():
+            del self._esecuri[serie]
+        for serie, definitiv in esuate.items():
+            incercari = self._esecuri.get(serie, [0, None])[0] + 1
+            if definitiv:
+                urmatoarea = None
+            else:
+                urmatoarea = acum_ms + min(
+                    TX_DETAILS_RETRY_BASE_MS * 2 ** (incercari - 1),
+                    TX_DETAILS_RETRY_MAX_MS,
+                )
+            self._esecuri[serie] = [incercari, urmatoarea]
+        self._salveaza()
+
+    def interval_sincronizare(self, date_from: int, now_ms: int) -> tuple[int, bool]:
+        """Returnează (început interval, sincronizare completă?).
+
+        Sincronizarea este completă la prima rulare, când fereastra de
+        istoric a fost mărită sau periodic (TX_FULL_SYNC_INTERVAL_MS), ca
+        registrul să reflecte exact fereastra cerută.
+        """
+        if (
+            self._watermark is None
+            or self._window_from is None
+            or date_from < self._window_from
+            or now_ms - self._full_sync_at >= TX_FULL_SYNC_INTERVAL_MS
+        ):
+            return date_from, True
+        return max(date_from, self._watermark - TX_SYNC_OVERLAP_MS), False
+
+    def aplica(
+        self,
+        records: list[dict],
+        date_from: int,
+        date_to: int,
+        complet: bool,
+    ) -> int:
+        """Integrează rezultatul unei sincronizări. Returnează nr. de noutăți."""
+        noi = {cheie_tranzactie(r): r for r in records if isinstance(r, dict)}
+        return self._integreaza(noi, len(records), date_from, date_to, complet)
+
+    async def aplica_flux(
+        self,
+        records: AsyncIterable[dict],
+        date_from: int,
+        date_to: int,
+        complet: bool,
+    ) -> int:
+        """Ca `aplica`, dar consumă tranzacțiile pe măsură ce sunt decodate.
+
+        Registrul nu este modificat dacă fluxul eșuează la mijloc.
+        """
+        noi: dict[str, dict] = {}
+        primite = 0
+        async for record in records:
+            primite += 1
+            if isinstance(record, dict):
+                noi[cheie_tranzactie(record)] = record
+        return self._integreaza(noi, primite, date_from, date_to, complet)
+
+    def _integreaza(
+        self,
+        noi: dict[str, dict],
+        primite: int,
+        date_from: int,
+        date_to: int,
+        complet: bool,
+    ) -> int:
+        """Integrează tranzacțiile primite (deja indexate după serie)."""
+        if complet:
+            schimbari = sum(
+                1 for cheie, r in noi.items() if self._records.get(cheie) != r
+            ) + len(self._records.keys() - noi.keys())
+            self._records = noi
+            self._window_from = date_from
+            self._full_sync_at = date_to
+            # Detaliile facturilor ieșite din fereastră nu mai sunt necesare
+            self._detalii = {
+                serie: d for serie, d in self._detalii.items() if serie in noi
+            }
+            self._esecuri = {
+                serie: e for serie, e in self._esecuri.items() if serie in noi
+            }
+        else:
+            schimbari = 0
+            for cheie, record in noi.items():
+                if self._records.get(cheie) != record:
+                    self._records[cheie] = record
+                    schimbari += 1
+
+        self._watermark = date_to
+        if schimbari:
+            self._lista = None
+        self._salveaza()
+        _LOGGER.debug(
+            "Registru tranzacții: %s, %d primite, %d noutăți, total %d",
+            "complet" if complet else "incremental",
+            primite,
+            schimbari,
+            len(self._records),
+        )
+        return schimbari
+
+    def _salveaza(self) -> None:
+        """Programează salvarea registrului."""
+        if self._store is None:
+            return
+        self._store.async_set(
+            self.SECTIUNE,
+            {
+                "window_from": self._window_from,
+                "watermark": self._watermark,
+                "full_sync_at": self._full_sync_at,
+                "records": self._records,
+                "details": self._detalii,
+                "details_failures": self._esecuri,
+            },
+        )
+
+
+class DetectionLedger:
+    """Registru de treceri pod per vehicul, persistat în ErovinietaStore."""
+
+    SECTIUNE = "treceri"
+
+    def __init__(self, store: ErovinietaStore | None = None) -> None:
+        """Încarcă registrul din stocare (dacă există)."""
+        self._store = store
+        stare = (store.get(self.SECTIUNE) if store else None) or {}
+        # număr înmatriculare → {"full_sync_at": ms, "records": {cheie: detecție}}
+        self._vehicule: dict[str, dict[str, Any]] = {
+            plate_no: {
+                "full_sync_at": date.get("full_sync_at", 0),
+                "records": dict(date.get("records", {})),
+            }
+            for plate_no, date in stare.items()
+            if isinstance(date, dict)
+        }
+        self._liste: dict[str, list[dict]] = {}
+        # Registrul diferă de cel salvat (detecții noi, backfill, vehicul
+        # eliminat) — `salveaza` nu rescrie stocarea degeaba
+        self._modificat = False
+
+    def detectii(self, plate_no: str) -> list[dict]:
+        """Detecțiile vehiculului, cele mai recente primele.
+
+        Lista este sortată o singură dată per modificare și refolosită
+        (aceeași listă cât timp nu se schimbă) — senzorii doar o taie.
+        """
+        lista = self._liste.get(plate_no)
+        if lista is None:
+            vehicul = self._vehicule.get(plate_no)
+            lista = sorted(
+                vehicul["records"].values() if vehicul else (),
+                key=lambda d: d.get("detectionTimestamp") or 0,
+                reverse=True,
+            )
+            self._liste[plate_no] = lista
+        return lista
+
+    def perioada(self, plate_no: str, now_ms: int) -> tuple[int, bool]:
+        """Returnează (cod perioadă, backfill complet?) pentru vehicul."""
+        vehicul = self._vehicule.get(plate_no)
+        if (
+            vehicul is None
+            or now_ms - vehicul["full_sync_at"] >= BRIDGE_FULL_SYNC_INTERVAL_MS
+        ):
+            return BRIDGE_PERIOD_BACKFILL, True
+        return BRIDGE_PERIOD_INCREMENTAL, False
+
+    def aplica(
+        self,
+        plate_no: str,
+        detections: list[dict],
+        now_ms: int,
+        complet: bool,
+    ) -> int:
+        """Integrează detecțiile primite. Returnează nr. de noutăți.
+
+        Un backfill înlocuiește complet lista vehiculului; un refresh
+        incremental adaugă detecțiile noi și actualizează pe cele
+        existente (ex: status plată schimbat).
+        """
+        noi = {cheie_detectie(d): d for d in detections if isinstance(d, dict)}
+        return self._integreaza(plate_no, noi, now_ms, complet)
+
+    async def aplica_flux(
+        self,
+        plate_no: str,
+        detections: AsyncIterable[dict],
+        now_ms: int,
+        complet: bool,
+    ) -> int:
+        """Ca `aplica`, dar consumă detecțiile pe măsură ce sunt decodate.
+
+        Registrul nu este modificat dacă fluxul eșuează la mijloc.
+        """
+        noi: dict[str, dict] = {}
+        async for detectie in detections:
+            if isinstance(detectie, dict):
+                noi[cheie_detectie(detectie)] = detectie
+        return self._integreaza(plate_no, noi, now_ms, complet)
+
+    def _integreaza(
+        self,
+        plate_no: str,
+        noi: dict[str, dict],
+        now_ms: int,
+        complet: bool,
+    ) -> int:
+        """Integrează detecțiile primite (deja indexate după cheie)."""
+        vehicul = self._vehicule.setdefault(
+            plate_no, {"full_sync_at": 0, "records": {}}
+        )
+        existente: dict[str, dict] = vehicul["records"]
+
+        if complet:
+            schimbari = sum(
+                1 for cheie, d in noi.items() if existente.get(cheie) != d
+            ) + len(existente.keys() - noi.keys())
+            vehicul["records"] = noi
+            vehicul["full_sync_at"] = now_ms
+        else:
+            schimbari = 0
+            for cheie, detectie in noi.items():
+                if existente.get(cheie) != detectie:
+                    existente[cheie] = detectie
+                    schimbari += 1
+
+        if schimbari:
+            self._liste.pop(plate_no, None)
+        # Backfill-ul mută `full_sync_at` chiar fără detecții noi
+        if schimbari or complet:
+            self._modificat = True
+        return schimbari
+
+    def pastreaza(self, plates: set[str]) -> None:
+        """Elimină vehiculele care nu mai apar în cont."""
+        for plate_no in set(self._vehicule) - plates:
+            self._vehicule.pop(plate_no, None)
+            self._liste.pop(plate_no, None)
+            self._modificat = True
+
+    def salveaza(self) -> None:
+        """Programează salvarea registrului, doar dacă s-a modificat.
+
+        Stocarea per cont conține și sesiunea și registrul de tranzacții;
+        un refresh fără noutăți (ex: la fiecare 10 minute) nu o rescrie.
+        """
+        if self._store is None or not self._modificat:
+            return
+        self._modificat = False
+        self._store.async_set(self.SECTIUNE, self._vehicule)
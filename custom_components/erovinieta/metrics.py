@@ -0,0 +1,124 @@
+"""Metrici per endpoint pentru clientul API eRovinieta.
+
+Păstrează în memorie, cu dimensiune fixă:
+- per endpoint: număr cereri, histogramă latențe, octeți primiți,
+  coduri HTTP, reîncercări și re-autentificări;
+- un inel cu ultimele cereri (pentru a vedea ce a dominat un refresh).
+
+Expuse prin diagnostics (`async_get_config_entry_diagnostics`).
+"""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import Any
+
+# Limitele superioare ale bucket-urilor de latență (secunde)
+LATENCY_BUCKETS: tuple[float, ...] = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+RING_SIZE = 200
+
+
+class _EndpointStats:
+    """Statistici cumulate pentru un singur endpoint."""
+
+    __slots__ = (
+        "cereri",
+        "octeti",
+        "latenta_totala",
+        "latenta_max",
+        "histograma",
+        "statusuri",
+        "reincercari",
+        "relogin",
+    )
+
+    def __init__(self) -> None:
+        self.cereri = 0
+        self.octeti = 0
+        self.latenta_totala = 0.0
+        self.latenta_max = 0.0
+        # ultimul bucket = peste ultima limită
+        self.histograma = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.statusuri: dict[str, int] = {}
+        self.reincercari = 0
+        self.relogin = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        etichete = [f"<={limita}s" for limita in LATENCY_BUCKETS] + [
+            f">{LATENCY_BUCKETS[-1]}s"
+        ]
+        return {
+            "cereri": self.cereri,
+            "octeti": self.octeti,
+            "latenta_medie_ms": (
+                round(self.latenta_totala / self.cereri * 1000, 1)
+                if self.cereri
+                else 0
+            ),
+            "latenta_max_ms": round(self.latenta_max * 1000, 1),
+            "latenta_totala_s": round(self.latenta_totala, 3),
+            "histograma": dict(zip(etichete, self.histograma)),
+            "statusuri": dict(self.statusuri),
+            "reincercari": self.reincercari,
+            "relogin": self.relogin,
+        }
+
+
+class ApiMetrics:
+    """Colector de metrici pentru ErovinietaAPI."""
+
+    def __init__(self, ring_size: int = RING_SIZE) -> None:
+        """Inițializează colectorul."""
+        self._endpoints: dict[str, _EndpointStats] = {}
+        self._ring: deque[tuple[float, str, str, float, int]] = deque(
+            maxlen=ring_size
+        )
+
+    def _stats(self, endpoint: str) -> _EndpointStats:
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = self._endpoints[endpoint] = _EndpointStats()
+        return stats
+
+    def record(
+        self, endpoint: str, status: int | str, latency: float, size: int = 0
+    ) -> None:
+        """Înregistrează o cerere finalizată (status HTTP sau tip eroare)."""
+        stats = self._stats(endpoint)
+        stats.cereri += 1
+        stats.octeti += size
+        stats.latenta_totala += latency
+        stats.latenta_max = max(stats.latenta_max, latency)
+        stats.histograma[bisect_left(LATENCY_BUCKETS, latency)] += 1
+        cheie = str(status)
+        stats.statusuri[cheie] = stats.statusuri.get(cheie, 0) + 1
+        self._ring.append((time.time(), endpoint, cheie, latency, size))
+
+    def record_retry(self, endpoint: str) -> None:
+        """Înregistrează o reîncercare."""
+        self._stats(endpoint).reincercari += 1
+
+    def record_relogin(self, endpoint: str) -> None:
+        """Înregistrează o re-autentificare declanșată de un 401/403."""
+        self._stats(endpoint).relogin += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Rezumat pentru diagnostice."""
+        return {
+            "endpoints": {
+                endpoint: stats.as_dict()
+                for endpoint, stats in sorted(self._endpoints.items())
+            },
+            "ultimele_cereri": [
+                {
+                    "moment": round(moment, 3),
+                    "endpoint": endpoint,
+                    "status": status,
+                    "latenta_ms": round(latenta * 1000, 1),
+                    "octeti": octeti,
+                }
+                for moment, endpoint, status, latenta, octeti in self._ring
+            ],
+        }
@@ -0,0 +1,205 @@
+"""Înregistrări compacte pentru răspunsurile API eRovinieta.
+
+`ErovinietaAPI` proiectează răspunsurile în aceste înregistrări imediat
+după decodare: se păstrează doar câmpurile folosite de coordinator și
+senzori, iar dict-urile brute sunt eliberate. NamedTuple: fără `__dict__`
+per instanță, imuabile, comparabile prin `==` (detecția secțiunilor
+neschimbate) și convertibile în liste JSON pentru cache-ul persistent.
+
+Tranzacțiile și trecerile de pod rămân dict-uri: sunt păstrate în
+registrele locale persistente, în forma primită de la server. Din
+detaliile facturilor se păstrează doar pozițiile (produs, valoare).
+"""
+
+from __future__ import annotations
+
+from typing import Any, NamedTuple
+
+from .helpers import safe_get
+
+
+class Vigneta(NamedTuple):
+    """O rovinietă a vehiculului (timestamp-uri în milisecunde)."""
+
+    start: int | None = None
+    stop: int | None = None
+    categorie: str | None = None
+
+    @classmethod
+    def din_raspuns(cls, data: dict) -> Vigneta:
+        """Proiectează un element din `userDetailsVignettes`."""
+        return cls(
+            start=data.get("vignetteStartDate"),
+            stop=data.get("vignetteStopDate"),
+            categorie=data.get("vignetteCategory"),
+        )
+
+
+class Vehicul(NamedTuple):
+    """Un vehicul din lista paginată (getDataPaginated)."""
+
+    plate_no: str | None = None
+    vin: str | None = None
+    certificate_series: str | None = None
+    tara: int | None = None
+    vignete: tuple[Vigneta, ...] = ()
+    sold_peaje: int | float | None = 0
+
+    @classmethod
+    def din_raspuns(cls, item: dict) -> Vehicul:
+        """Proiectează un element din `view`."""
+        entity = safe_get(item.get("entity"), {})
+        sold = safe_get(item.get("detectionPaymentSum"), {})
+        return cls(
+            plate_no=entity.get("plateNo"),
+            vin=entity.get("vin"),
+            certificate_series=entity.get("certificateSeries"),
+            tara=entity.get("tara"),
+            vignete=tuple(
+                Vigneta.din_raspuns(v)
+                for v in safe_get(item.get("userDetailsVignettes"), [])
+                if isinstance(v, dict)
+            ),
+            sold_peaje=sold.get("soldPeajeNeexpirate", 0) if sold else 0,
+        )
+
+    @property
+    def identificabil(self) -> bool:
+        """Are identificatorii necesari pentru senzori și treceri pod."""
+        return bool(self.plate_no and self.vin and self.certificate_series)
+
+
+class PaginaVehicule(NamedTuple):
+    """O pagină getDataPaginated: totalul raportat și vehiculele ei."""
+
+    total: int | None
+    vehicule: tuple[Vehicul, ...]
+
+
+class ProfilUtilizator(NamedTuple):
+    """Datele contului (setariUtilizatorPortal).
+
+    Județul și localitatea sunt rezolvate la proiectare: nomenclatorul
+    pentru România, textul liber pentru celelalte țări.
+    """
+
+    id: int | str | None = None
+    nume: str | None = None
+    telefon: str | None = None
+    email: str | None = None
+    cnp_cui: str | None = None
+    pf: bool = False
+    accepta_corespondenta: bool = False
+    adresa: str | None = None
+    tara: str | None = None
+    judet: str | None = None
+    localitate: str | None = None
+
+    @classmethod
+    def din_raspuns(cls, data: Any) -> ProfilUtilizator:
+        """Proiectează răspunsul brut."""
+        if not isinstance(data, dict):
+            return cls()
+        utilizator = safe_get(data.get("utilizator"), {})
+        tara = safe_get(data.get("tara"), {}).get("denumire")
+        if (tara or "").lower() == "romania":
+            judet = safe_get(data.get("judet"), {}).get("nume")
+            localitate = safe_get(data.get("localitate"), {}).get("nume")
+        else:
+            judet = data.get("judetText")
+            localitate = data.get("localitateText")
+        return cls(
+            id=data.get("id"),
+            nume=utilizator.get("nume"),
+            telefon=utilizator.get("telefon"),
+            email=utilizator.get("email"),
+            cnp_cui=data.get("cnpCui"),
+            pf=bool(data.get("pf")),
+            accepta_corespondenta=bool(data.get("acceptaCorespondenta")),
+            adresa=data.get("adresa"),
+            tara=tara,
+            judet=judet,
+            localitate=localitate,
+        )
+
+
+class Tara(NamedTuple):
+    """O țară din nomenclator (getCountries)."""
+
+    id: int | None
+    denumire: str | None
+
+    @classmethod
+    def lista_din_raspuns(cls, data: Any) -> tuple[Tara, ...]:
+        """Proiectează lista de țări."""
+        if not isinstance(data, list):
+            return ()
+        return tuple(
+            cls(item.get("id"), item.get("denumire"))
+            for item in data
+            if isinstance(item, dict)
+        )
+
+    @classmethod
+    def lista_din_cache(cls, valoare: Any) -> tuple[Tara, ...]:
+        """Reconstruiește lista din cache (perechi sau răspuns brut vechi)."""
+        if isinstance(valoare, list) and all(
+            isinstance(item, list) for item in valoare
+        ):
+            return tuple(cls(*item) for item in valoare)
+        return cls.lista_din_raspuns(valoare)
+
+
+# Câmpuri posibile în răspunsul getTransactionDetails
+_CHEI_POZITII = ("items", "produse", "detalii", "lines")
+_CHEI_PRODUS = ("product", "produs", "denumire", "description", "name")
+_CHEI_VALOARE = ("value", "valoare", "valoareTotalaCuTva", "amount")
+
+
+class PozitieFactura(NamedTuple):
+    """O poziție din detaliile unei facturi (getTransactionDetails)."""
+
+    produs: str | None = None
+    valoare: float = 0.0
+
+    @classmethod
+    def lista_din_raspuns(cls, data: Any) -> tuple[PozitieFactura, ...] | None:
+        """Proiectează pozițiile facturii (None pentru un răspuns invalid)."""
+        if not isinstance(data, dict):
+            return None
+        pozitii = next(
+            (
+                data[cheie]
+                for cheie in _CHEI_POZITII
+                if isinstance(data.get(cheie), list)
+            ),
+            [],
+        )
+        return tuple(
+            cls(
+                produs=_primul(item, _CHEI_PRODUS),
+                valoare=_valoare(_primul(item, _CHEI_VALOARE)),
+            )
+            for item in pozitii
+            if isinstance(item, dict)
+        )
+
+    @classmethod
+    def lista_din_cache(cls, valoare: Any) -> tuple[PozitieFactura, ...]:
+        """Reconstruiește pozițiile din registru (perechi sau răspuns brut vechi)."""
+        if isinstance(valoare, list):
+            return tuple(cls(*item) for item in valoare if isinstance(item, list))
+        return cls.lista_din_raspuns(valoare) or ()
+
+
+def _primul(item: dict, chei: tuple[str, ...]) -> Any:
+    """Valoarea primului câmp prezent din `chei`."""
+    return next((item[cheie] for cheie in chei if item.get(cheie) is not None), None)
+
+
+def _valoare(valoare: Any) -> float:
+    """Suma unei poziții; 0 dacă lipsește sau nu este numerică."""
+    try:
+        return float(valoare)
+    except (TypeError, ValueError):
+        return 0.0
@@ -0,0 +1,142 @@
+"""Politici de reziliență pentru apelurile API eRovinieta.
+
+- RetryPolicy: reîncercări cu backoff exponențial și jitter complet
+  (evită ca mai multe cereri eșuate să revină simultan).
+- CircuitBreaker: după un număr de eșecuri consecutive, endpoint-ul este
+  „deschis” și apelurile sunt scurtcircuitate pentru o perioadă, în loc
+  să aștepte fiecare propriul timeout. După perioadă, o singură cerere
+  de probă decide dacă endpoint-ul și-a revenit.
+- RefreshBudget: termenul limită al unui refresh, împărțit pe etape.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class RetryPolicy:
+    """Backoff exponențial cu jitter complet."""
+
+    def __init__(self, attempts: int, base_delay: float, max_delay: float) -> None:
+        """Inițializează politica (`attempts` include prima încercare)."""
+        self.attempts = max(1, attempts)
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+
+    def delay(self, attempt: int) -> float:
+        """Pauza înainte de reîncercarea cu numărul `attempt` (de la 0)."""
+        plafon = min(self._max_delay, self._base_delay * (2**attempt))
+        return random.uniform(0, plafon)
+
+
+class RefreshBudget:
+    """Termen limită pentru un refresh, împărțit pe etape ponderate.
+
+    Fiecare etapă primește din timpul rămas o parte proporțională cu
+    ponderea ei față de etapele încă neîncepute — o etapă terminată
+    devreme lasă timpul neconsumat celor următoare.
+    """
+
+    def __init__(self, total: float, ponderi: dict[str, float]) -> None:
+        """Pornește cronometrul pentru `total` secunde."""
+        self.total = total
+        self._deadline = time.monotonic() + total
+        self._ponderi = dict(ponderi)
+
+    @property
+    def ramas(self) -> float:
+        """Secundele rămase până la termenul limită."""
+        return max(0.0, self._deadline - time.monotonic())
+
+    def pentru(self, etapa: str) -> float:
+        """Alocă bugetul (secunde) pentru etapa care începe acum."""
+        pondere = self._ponderi.pop(etapa, 0)
+        rest = sum(self._ponderi.values())
+        if pondere + rest <= 0:
+            return self.ramas
+        return self.ramas * pondere / (pondere + rest)
+
+
+class CircuitBreaker:
+    """Circuit breaker pentru un singur endpoint."""
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float) -> None:
+        """Inițializează breaker-ul în starea închisă."""
+        self.name = name
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probe_in_flight = False
+        self.short_circuits = 0
+
+    @property
+    def state(self) -> str:
+        """Starea curentă: closed, open sau half_open."""
+        if self._opened_at is None:
+            return STATE_CLOSED
+        if time.monotonic() - self._opened_at >= self._reset_timeout:
+            return STATE_HALF_OPEN
+        return STATE_OPEN
+
+    def allow(self) -> bool:
+        """Verifică dacă o cerere poate pleca acum.
+
+        În starea half_open este permisă o singură cerere de probă.
+        """
+        state = self.state
+        if state == STATE_CLOSED:
+            return True
+        if state == STATE_HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self.short_circuits += 1
+        return False
+
+    def record_success(self) -> None:
+        """Cerere reușită — închide breaker-ul."""
+        if self._opened_at is not None:
+            _LOGGER.info("Endpoint-ul %s și-a revenit — circuit închis", self.name)
+        self._failures = 0
+        self._opened_at = None
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Cerere eșuată — deschide breaker-ul la atingerea pragului."""
+        self._failures += 1
+        probe = self._probe_in_flight
+        self._probe_in_flight = False
+        if probe or self._failures >= self._failure_threshold:
+            if self._opened_at is None or probe:
+                _LOGGER.warning(
+                    "Endpoint-ul %s a eșuat de %d ori — circuit deschis %d s",
+                    self.name,
+                    self._failures,
+                    self._reset_timeout,
+                )
+            self._opened_at = time.monotonic()
+
+    def release_probe(self) -> None:
+        """Încheie proba half_open dacă nu s-a terminat cu succes.
+
+        Orice alt rezultat (inclusiv anularea) contează ca eșec și
+        redeschide circuitul; altfel endpoint-ul ar rămâne blocat.
+        """
+        if self._probe_in_flight:
+            self.record_failure()
+
+    def as_dict(self) -> dict[str, str | int]:
+        """Stare pentru diagnostice."""
+        return {
+            "stare": self.state,
+            "esecuri_consecutive": self._failures,
+            "scurtcircuitari": self.short_circuits,
+        }
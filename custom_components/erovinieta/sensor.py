@@ -11,12 +11,13 @@ Senzori disponibili:
 
 from __future__ import annotations
 
+import itertools
 import logging
 import time
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -33,6 +34,7 @@ from .const import (
 )
 from .coordinator import ErovinietaCoordinator
 from .helpers import capitalize_name, format_timestamp_ms, safe_get, sanitize_plate_no
+from .models import ProfilUtilizator, Vehicul
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,6 +50,13 @@ def _is_license_valid(hass: HomeAssistant) -> bool:
     return mgr is not None and mgr.is_valid
 
 
+def _id_utilizator(coordinator: ErovinietaCoordinator) -> str:
+    """Identificatorul utilizatorului folosit în unique_id (din nume)."""
+    profil = coordinator.data.get("user_data") or ProfilUtilizator()
+    nume = profil.nume if profil.nume is not None else "necunoscut"
+    return nume.replace(" ", "_").lower()
+
+
 # =====================================================================
 #  Setup
 # =====================================================================
@@ -105,14 +114,13 @@ async def async_setup_entry(
         sensors.append(DateUtilizatorSensor(coordinator, config_entry))
 
         # Senzori per vehicul
-        paginated = coordinator.data.get("paginated_data", {}).get("view", [])
-        for vehicul in paginated:
-            entity = vehicul.get("entity", {})
-            plate_no = entity.get("plateNo")
-            vin = entity.get("vin")
-            cert = entity.get("certificateSeries")
-
-            if not all([plate_no, vin, cert]):
+        vehicul: Vehicul
+        for vehicul in coordinator.data.get("paginated_data", ()):
+            plate_no = vehicul.plate_no
+            vin = vehicul.vin
+            cert = vehicul.certificate_series
+
+            if not vehicul.identificabil:
                 _LOGGER.warning(
                     "Date incomplete pentru vehicul: PlateNo=%s, VIN=%s", plate_no, vin
                 )
@@ -150,6 +158,8 @@ class ErovinietaBaseSensor(CoordinatorEntity[ErovinietaCoordinator], SensorEntit
 
     _attr_has_entity_name = True
     _attr_attribution = ATTRIBUTION
+    # Secțiunile din coordinator.data pe care se bazează senzorul
+    _sectiuni: tuple[str, ...] = ()
 
     def __init__(
         self,
@@ -165,6 +175,9 @@ class ErovinietaBaseSensor(CoordinatorEntity[ErovinietaCoordinator], SensorEntit
         self._attr_name = name
         self._attr_unique_id = unique_id
         self._attr_icon = icon
+        # (disponibil, licență validă, stare dependentă de ceas) la ultima
+        # scriere a stării
+        self._stare_scrisa: tuple | None = None
 
     @property
     def _license_valid(self) -> bool:
@@ -172,6 +185,55 @@ class ErovinietaBaseSensor(CoordinatorEntity[ErovinietaCoordinator], SensorEntit
         mgr = self.hass.data.get(DOMAIN, {}).get(LICENSE_DATA_KEY)
         return mgr is not None and mgr.is_valid
 
+    def _chei_invechire(self) -> tuple[str, ...]:
+        """Cheile din `sectiuni_invechite` relevante pentru senzor."""
+        return self._sectiuni
+
+    def _chei_dependente(self) -> tuple[str, ...]:
+        """Cheile din `coordinator.chei_modificate` care privesc senzorul."""
+        return self._chei_invechire()
+
+    def _stare_ceas(self) -> object:
+        """Partea afișată care depinde de ceas, nu doar de date.
+
+        Senzorii cu valori calculate față de momentul curent (expirare,
+        ferestre de timp) sau din opțiunile intrării o suprascriu, ca
+        schimbarea ei să fie scrisă chiar dacă datele portalului au rămas
+        aceleași.
+        """
+        return None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Scrie starea doar dacă s-a schimbat ceva afișat de senzor.
+
+        Pe o flotă mare, o trecere de pod nouă actualizează doar senzorii
+        vehiculului respectiv, nu toate entitățile contului.
+        """
+        stare = (self.available, self._license_valid, self._stare_ceas())
+        modificate = self.coordinator.chei_modificate
+        if (
+            modificate is not None
+            and stare == self._stare_scrisa
+            and modificate.isdisjoint(self._chei_dependente())
+        ):
+            return
+        self._stare_scrisa = stare
+        super()._handle_coordinator_update()
+
+    def _marcaj_invechire(self) -> dict:
+        """Atributul „Date învechite din” pentru un refresh parțial.
+
+        Prezent doar când senzorul afișează ultimele valori cunoscute
+        (termen limită depășit sau eroare la secțiunea lui).
+        """
+        invechite = (self.coordinator.data or {}).get("sectiuni_invechite") or {}
+        chei = [cheie for cheie in self._chei_invechire() if cheie in invechite]
+        if not chei:
+            return {}
+        momente = [invechite[cheie] for cheie in chei if invechite[cheie]]
+        return {"Date învechite din": min(momente) if momente else "necunoscut"}
+
     @property
     def device_info(self) -> DeviceInfo:
         """Informații despre dispozitiv.
@@ -232,15 +294,13 @@ class LicentaNecesaraSensor(ErovinietaBaseSensor):
 class DateUtilizatorSensor(ErovinietaBaseSensor):
     """Senzor cu datele contului utilizatorului."""
 
+    _sectiuni = ("user_data",)
+
     def __init__(
         self, coordinator: ErovinietaCoordinator, config_entry: ConfigEntry
     ) -> None:
         """Inițializare."""
-        user_data = coordinator.data.get("user_data", {})
-        utilizator = user_data.get("utilizator", {})
-        user_id = (
-            utilizator.get("nume", "necunoscut").replace(" ", "_").lower()
-        )
+        user_id = _id_utilizator(coordinator)
 
         super().__init__(
             coordinator=coordinator,
@@ -250,60 +310,45 @@ class DateUtilizatorSensor(ErovinietaBaseSensor):
             icon="mdi:account-details",
         )
 
+    def _profil(self) -> ProfilUtilizator | None:
+        """Profilul utilizatorului din coordinator."""
+        if not self.coordinator.data:
+            return None
+        return self.coordinator.data.get("user_data")
+
     @property
     def native_value(self) -> str:
         """Returnează ID-ul utilizatorului."""
         if not self._license_valid:
             return "Licență necesară"
-        if not self.coordinator.data or "user_data" not in self.coordinator.data:
+        profil = self._profil()
+        if profil is None or profil.id is None:
             return "nespecificat"
-        user_data = self.coordinator.data["user_data"]
-        user_id = user_data.get("id")
-        return str(user_id) if user_id is not None else "nespecificat"
+        return str(profil.id)
 
     @property
     def extra_state_attributes(self) -> dict:
         """Atribute suplimentare ale utilizatorului."""
         if not self._license_valid:
             return {"licență": "necesară"}
-        if not self.coordinator.data or "user_data" not in self.coordinator.data:
+        profil = self._profil()
+        if profil is None:
             return {}
 
-        user_data = self.coordinator.data["user_data"]
-        utilizator = user_data.get("utilizator", {})
-        tara_data = user_data.get("tara", {})
-        denumire_tara = tara_data.get("denumire", "nespecificat")
-
-        if denumire_tara.lower() == "romania":
-            judet = safe_get(
-                user_data.get("judet", {}).get("nume"), "nespecificat"
-            )
-            localitate = safe_get(
-                user_data.get("localitate", {}).get("nume"), "nespecificat"
-            )
-        else:
-            judet = safe_get(user_data.get("judetText"), "nespecificat")
-            localitate = safe_get(user_data.get("localitateText"), "nespecificat")
-
         return {
-            "Numele și prenumele": safe_get(
-                utilizator.get("nume"), ""
-            ).title(),
-            "CNP": safe_get(user_data.get("cnpCui"), "nespecificat"),
-            "Telefon de contact": safe_get(
-                utilizator.get("telefon"), "nespecificat"
-            ),
-            "Persoană fizică": "Da" if user_data.get("pf") else "Nu",
-            "Email utilizator": safe_get(
-                utilizator.get("email"), "nespecificat"
-            ),
+            "Numele și prenumele": safe_get(profil.nume, "").title(),
+            "CNP": safe_get(profil.cnp_cui, "nespecificat"),
+            "Telefon de contact": safe_get(profil.telefon, "nespecificat"),
+            "Persoană fizică": "Da" if profil.pf else "Nu",
+            "Email utilizator": safe_get(profil.email, "nespecificat"),
             "Acceptă corespondența": (
-                "Da" if user_data.get("acceptaCorespondenta") else "Nu"
+                "Da" if profil.accepta_corespondenta else "Nu"
             ),
-            "Adresa": safe_get(user_data.get("adresa"), "nespecificat"),
-            "Localitate": localitate,
-            "Județ": judet,
-            "Țară": capitalize_name(denumire_tara),
+            "Adresa": safe_get(profil.adresa, "nespecificat"),
+            "Localitate": safe_get(profil.localitate, "nespecificat"),
+            "Județ": safe_get(profil.judet, "nespecificat"),
+            "Țară": capitalize_name(safe_get(profil.tara, "nespecificat")),
+            **self._marcaj_invechire(),
         }
 
 
@@ -319,6 +364,8 @@ class VehiculSensor(ErovinietaBaseSensor):
     actualizare (nu mai folosim referință stale din __init__).
     """
 
+    _sectiuni = ("paginated_data", "countries_data")
+
     def __init__(
         self,
         coordinator: ErovinietaCoordinator,
@@ -336,84 +383,83 @@ class VehiculSensor(ErovinietaBaseSensor):
         )
         self._plate_no = plate_no
 
-    def _get_vehicle_data(self) -> dict:
+    def _chei_dependente(self) -> tuple[str, ...]:
+        return (*self._chei_invechire(), f"paginated_data/{self._plate_no}")
+
+    def _get_vehicle_data(self) -> Vehicul:
         """Obține datele actuale ale vehiculului din coordinator."""
         if not self.coordinator.data:
-            return {}
-        for item in self.coordinator.data.get("paginated_data", {}).get("view", []):
-            if item.get("entity", {}).get("plateNo") == self._plate_no:
-                return item
-        return {}
+            return Vehicul()
+        index = self.coordinator.data.get("vehicule_per_numar", {})
+        return index.get(self._plate_no) or Vehicul()
 
     @staticmethod
-    def _get_country_name(country_id, countries_data: list) -> str:
+    def _get_country_name(country_id, tari_per_id: dict) -> str:
         """Returnează denumirea țării pe baza ID-ului."""
-        if not country_id or not countries_data:
+        if not country_id or country_id not in tari_per_id:
             return "Necunoscut"
-        for country in countries_data:
-            if country.get("id") == country_id:
-                return capitalize_name(
-                    country.get("denumire", "Necunoscut")
-                )
-        return "Necunoscut"
+        return capitalize_name(safe_get(tari_per_id[country_id], "Necunoscut"))
 
     @property
     def native_value(self) -> str:
         """Returnează 'Da' dacă vehiculul are rovinietă activă, altfel 'Nu'."""
         if not self._license_valid:
             return "Licență necesară"
-        vehicle = self._get_vehicle_data()
-        vignettes = vehicle.get("userDetailsVignettes", [])
+        vignettes = self._get_vehicle_data().vignete
         if not vignettes:
             return "Nu"
 
-        stop_ts = vignettes[0].get("vignetteStopDate")
+        stop_ts = vignettes[0].stop
         if not stop_ts:
             return "Nu"
 
         now_ms = int(time.time() * 1000)
         return "Da" if stop_ts > now_ms else "Nu"
 
+    def _expira_peste(self) -> int | str:
+        """Zilele rămase până la expirarea rovinietei (sau "N/A")."""
+        vignettes = self._get_vehicle_data().vignete
+        stop_ts = vignettes[0].stop if vignettes else None
+        if not stop_ts or stop_ts <= 0:
+            return "N/A"
+        return (stop_ts // 1000 - int(time.time())) // 86400
+
+    def _stare_ceas(self) -> object:
+        return (self.native_value, self._expira_peste())
+
     @property
     def extra_state_attributes(self) -> dict:
         """Atribute suplimentare ale vehiculului și rovinietei."""
         if not self._license_valid:
             return {"licență": "necesară"}
         vehicle = self._get_vehicle_data()
-        entity = vehicle.get("entity", {})
-        vignettes = vehicle.get("userDetailsVignettes", [])
+        vignettes = vehicle.vignete
 
-        countries = self.coordinator.data.get("countries_data", [])
+        countries = self.coordinator.data.get("tari_per_id", {})
 
         attrs = {
-            "Număr de înmatriculare": entity.get("plateNo", "Necunoscut"),
-            "VIN": entity.get("vin", "Necunoscut"),
-            "Seria certificatului": entity.get(
-                "certificateSeries", "Necunoscut"
+            "Număr de înmatriculare": safe_get(vehicle.plate_no, "Necunoscut"),
+            "VIN": safe_get(vehicle.vin, "Necunoscut"),
+            "Seria certificatului": safe_get(
+                vehicle.certificate_series, "Necunoscut"
             ),
-            "Țara": self._get_country_name(entity.get("tara"), countries),
+            "Țara": self._get_country_name(vehicle.tara, countries),
         }
 
         if not vignettes:
             attrs["Rovinietă"] = "Nu există rovinietă"
         else:
             v = vignettes[0]
-            start_ts = v.get("vignetteStartDate")
-            stop_ts = v.get("vignetteStopDate")
+            start_ts = v.start
+            stop_ts = v.stop
 
-            attrs["Categorie vignietă"] = v.get(
-                "vignetteCategory", "Necunoscut"
-            )
+            attrs["Categorie vignietă"] = safe_get(v.categorie, "Necunoscut")
             attrs["Data început vignietă"] = format_timestamp_ms(start_ts)
             attrs["Data sfârșit vignietă"] = format_timestamp_ms(stop_ts)
 
-            if stop_ts and stop_ts > 0:
-                now_s = int(time.time())
-                days_left = (stop_ts // 1000 - now_s) // 86400
-                attrs["Expiră peste (zile)"] = days_left
-            else:
-                attrs["Expiră peste (zile)"] = "N/A"
+            attrs["Expiră peste (zile)"] = self._expira_peste()
 
+        attrs.update(self._marcaj_invechire())
         return attrs
 
 
@@ -428,6 +474,9 @@ class PlataTreceriPodSensor(ErovinietaBaseSensor):
     Filtrarea se face per vehicul (vin + plate_no).
     """
 
+    def _chei_invechire(self) -> tuple[str, ...]:
+        return (f"treceri_pod_per_vehicul/{self._plate_no}",)
+
     def __init__(
         self,
         coordinator: ErovinietaCoordinator,
@@ -459,18 +508,26 @@ class PlataTreceriPodSensor(ErovinietaBaseSensor):
         return []
 
     def _get_unpaid_detections(self) -> list:
-        """Returnează detecțiile neplătite din ultimele 24h."""
+        """Returnează detecțiile neplătite din ultimele 24h (recente primele).
+
+        Detecțiile vin sortate descrescător, deci fereastra de 24h este
+        un prefix al listei.
+        """
         detections = self._get_vehicle_detections()
-        now_ms = int(time.time() * 1000)
-        interval_ms = 24 * 60 * 60 * 1000  # 24 ore
+        prag_ms = int(time.time() * 1000) - 24 * 60 * 60 * 1000  # 24 ore
 
         return [
             d
-            for d in detections
+            for d in itertools.takewhile(
+                lambda d: (d.get("detectionTimestamp") or 0) >= prag_ms, detections
+            )
             if d.get("paymentStatus") is None
-            and now_ms - d.get("detectionTimestamp", 0) <= interval_ms
         ]
 
+    def _stare_ceas(self) -> object:
+        # Restanțele ies din fereastra de 24h fără date noi de la portal
+        return len(self._get_unpaid_detections())
+
     @property
     def native_value(self) -> str:
         """'Da' dacă există restanțe, altfel 'Nu'."""
@@ -485,14 +542,7 @@ class PlataTreceriPodSensor(ErovinietaBaseSensor):
             return {"licență": "necesară"}
         neplatite = self._get_unpaid_detections()
         total = len(neplatite)
-
-        # Sortăm descrescător și limităm
-        neplatite_sorted = sorted(
-            neplatite,
-            key=lambda d: d.get("detectionTimestamp", 0),
-            reverse=True,
-        )
-        limited = neplatite_sorted[:MAX_ATTR_TRECERI]
+        limited = neplatite[:MAX_ATTR_TRECERI]
 
         attrs: dict = {
             "Număr treceri neplătite": total,
@@ -521,6 +571,7 @@ class PlataTreceriPodSensor(ErovinietaBaseSensor):
                 detection.get("lane"), ""
             )
 
+        attrs.update(self._marcaj_invechire())
         return attrs
 
 
@@ -532,6 +583,9 @@ class PlataTreceriPodSensor(ErovinietaBaseSensor):
 class TreceriPodSensor(ErovinietaBaseSensor):
     """Senzor pentru istoricul complet al trecerilor de pod."""
 
+    def _chei_invechire(self) -> tuple[str, ...]:
+        return (f"treceri_pod_per_vehicul/{self._plate_no}",)
+
     def __init__(
         self,
         coordinator: ErovinietaCoordinator,
@@ -574,15 +628,10 @@ class TreceriPodSensor(ErovinietaBaseSensor):
         """Detalii treceri (limitate la MAX_ATTR_TRECERI, cele mai recente)."""
         if not self._license_valid:
             return {"licență": "necesară"}
+        # Sortate descrescător în registrul local (cele mai recente primele)
         detection_list = self._get_vehicle_detections()
         total = len(detection_list)
-
-        sorted_detections = sorted(
-            detection_list,
-            key=lambda d: d.get("detectionTimestamp", 0),
-            reverse=True,
-        )
-        limited = sorted_detections[:MAX_ATTR_TRECERI]
+        limited = detection_list[:MAX_ATTR_TRECERI]
 
         attrs: dict = {
             "Număr total treceri": total,
@@ -632,6 +681,7 @@ class TreceriPodSensor(ErovinietaBaseSensor):
                 format_timestamp_ms(valid_until)
             )
 
+        attrs.update(self._marcaj_invechire())
         return attrs
 
 
@@ -643,6 +693,8 @@ class TreceriPodSensor(ErovinietaBaseSensor):
 class SoldSensor(ErovinietaBaseSensor):
     """Senzor pentru soldul peajelor neexpirate."""
 
+    _sectiuni = ("paginated_data",)
+
     def __init__(
         self,
         coordinator: ErovinietaCoordinator,
@@ -660,17 +712,16 @@ class SoldSensor(ErovinietaBaseSensor):
         )
         self._plate_no = plate_no
 
+    def _chei_dependente(self) -> tuple[str, ...]:
+        return (*self._chei_invechire(), f"paginated_data/{self._plate_no}")
+
     def _get_sold(self) -> int | float:
         """Obține soldul din datele coordinator-ului."""
         if not self.coordinator.data:
             return 0
-        for item in self.coordinator.data.get("paginated_data", {}).get("view", []):
-            entity = item.get("entity", {})
-            if entity.get("plateNo") == self._plate_no:
-                payment_sum = item.get("detectionPaymentSum", {})
-                if payment_sum:
-                    return payment_sum.get("soldPeajeNeexpirate", 0)
-        return 0
+        index = self.coordinator.data.get("vehicule_per_numar", {})
+        vehicul = index.get(self._plate_no)
+        return vehicul.sold_peaje if vehicul is not None else 0
 
     @property
     def native_value(self) -> int | float | str:
@@ -686,6 +737,7 @@ class SoldSensor(ErovinietaBaseSensor):
             return {"licență": "necesară"}
         return {
             "Sold peaje neexpirate": self._get_sold(),
+            **self._marcaj_invechire(),
         }
 
 
@@ -697,15 +749,13 @@ class SoldSensor(ErovinietaBaseSensor):
 class RaportTranzactiiSensor(ErovinietaBaseSensor):
     """Senzor sumar pentru raportul de tranzacții."""
 
+    _sectiuni = ("transactions", "detalii_tranzactii")
+
     def __init__(
         self, coordinator: ErovinietaCoordinator, config_entry: ConfigEntry
     ) -> None:
         """Inițializare."""
-        user_data = coordinator.data.get("user_data", {})
-        utilizator = user_data.get("utilizator", {})
-        user_id = (
-            utilizator.get("nume", "necunoscut").replace(" ", "_").lower()
-        )
+        user_id = _id_utilizator(coordinator)
 
         super().__init__(
             coordinator=coordinator,
@@ -715,6 +765,16 @@ class RaportTranzactiiSensor(ErovinietaBaseSensor):
             icon="mdi:chart-bar-stacked",
         )
 
+    def _ani_istoric(self) -> int:
+        """Perioada de istoric configurată (ani)."""
+        return self._config_entry.options.get(
+            CONF_ISTORIC_TRANZACTII, ISTORIC_TRANZACTII_DEFAULT
+        )
+
+    def _stare_ceas(self) -> object:
+        # „Perioadă analizată” vine din opțiuni, nu din datele portalului
+        return self._ani_istoric()
+
     @property
     def native_value(self) -> int | str:
         """Numărul total de tranzacții."""
@@ -739,12 +799,27 @@ class RaportTranzactiiSensor(ErovinietaBaseSensor):
             if isinstance(item, dict)
         )
 
-        years = self._config_entry.options.get(
-            CONF_ISTORIC_TRANZACTII, ISTORIC_TRANZACTII_DEFAULT
-        )
+        years = self._ani_istoric()
+
+        detalii = self.coordinator.data.get("detalii_tranzactii", {})
+
+        # Defalcarea pe produse, din pozițiile facturilor cu detalii
+        per_produs: dict[str, float] = {}
+        for pozitii in detalii.values():
+            for produs, valoare in pozitii:
+                cheie = produs or "Nespecificat"
+                per_produs[cheie] = per_produs.get(cheie, 0.0) + valoare
 
         return {
             "Perioadă analizată": f"Ultimii {years} ani",
             "Număr facturi": len(transactions),
+            "Facturi cu detalii": len(detalii),
             "Suma totală plătită": f"{total_sum:.2f} RON",
+            "Defalcare pe produse": {
+                produs: f"{suma:.2f} RON"
+                for produs, suma in sorted(
+                    per_produs.items(), key=lambda item: item[1], reverse=True
+                )
+            },
+            **self._marcaj_invechire(),
         }
@@ -0,0 +1,128 @@
+"""Stocare persistentă pentru integrarea CNAIR eRovinieta.
+
+Fiecare config entry are propriul fișier în `.storage/erovinieta.<entry_id>`,
+împărțit pe secțiuni (ex: `sesiune`). Cache-ul de răspunsuri API este
+partajat de toate conturile (`.storage/erovinieta_response_cache`).
+Scrierile sunt amânate și grupate prin `async_delay_save`, ca să nu
+atingem discul la fiecare refresh.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .cache import ResponseCache
+from .const import (
+    CACHE_DATA_KEY,
+    CACHE_MAX_ENTRIES,
+    CACHE_TTL,
+    DOMAIN,
+    ENTRY_STORES_DATA_KEY,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 10  # secunde
+CACHE_STORAGE_KEY = f"{DOMAIN}_response_cache"
+CACHE_SAVE_DELAY = 60  # secunde
+
+
+class ErovinietaStore:
+    """Date persistente ale unui cont, grupate pe secțiuni."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Inițializează stocarea pentru o intrare de configurare."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self._data: dict[str, Any] = {}
+
+    async def async_load(self) -> None:
+        """Încarcă datele de pe disc (o singură dată, la setup)."""
+        data = await self._store.async_load()
+        self._data = data if isinstance(data, dict) else {}
+        _LOGGER.debug(
+            "Stocare încărcată: secțiuni=%s", sorted(self._data) or "niciuna"
+        )
+
+    def get(self, sectiune: str, default: Any = None) -> Any:
+        """Returnează conținutul unei secțiuni."""
+        return self._data.get(sectiune, default)
+
+    @callback
+    def async_set(self, sectiune: str, valoare: Any) -> None:
+        """Actualizează o secțiune și programează salvarea."""
+        if valoare is None:
+            self._data.pop(sectiune, None)
+        else:
+            self._data[sectiune] = valoare
+        self._store.async_delay_save(lambda: self._data, SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Șterge fișierul de stocare (la eliminarea integrării).
+
+        Anulează și salvarea amânată a acestei instanțe.
+        """
+        self._data = {}
+        await self._store.async_remove()
+
+
+async def async_get_entry_store(hass: HomeAssistant, entry_id: str) -> ErovinietaStore:
+    """Returnează stocarea contului, aceeași instanță pe toată durata HA.
+
+    O instanță nouă ar citi de pe disc date fără scrierile încă amânate
+    ale celei vechi, iar salvarea amânată a celei vechi ar putea rescrie
+    fișierul după ștergere.
+    """
+    stocari: dict[str, ErovinietaStore] = hass.data.setdefault(
+        ENTRY_STORES_DATA_KEY, {}
+    )
+    store = stocari.get(entry_id)
+    if store is None:
+        store = stocari[entry_id] = ErovinietaStore(hass, entry_id)
+        await store.async_load()
+    return store
+
+
+async def async_remove_entry_store(hass: HomeAssistant, entry_id: str) -> None:
+    """Șterge stocarea contului prin instanța ei (anulează salvarea amânată)."""
+    store = hass.data.get(ENTRY_STORES_DATA_KEY, {}).pop(entry_id, None)
+    if store is None:
+        store = ErovinietaStore(hass, entry_id)
+    await store.async_remove()
+
+
+async def async_get_response_cache(hass: HomeAssistant) -> ResponseCache:
+    """Returnează cache-ul de răspunsuri partajat de toate conturile.
+
+    Creat o singură dată per domeniu și reîncărcat din `.storage` la
+    prima utilizare; modificările sunt salvate amânat.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    cache: ResponseCache | None = domain_data.get(CACHE_DATA_KEY)
+    if cache is not None:
+        return cache
+
+    store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, CACHE_STORAGE_KEY)
+
+    @callback
+    def _programeaza_salvare() -> None:
+        store.async_delay_save(cache.as_dict, CACHE_SAVE_DELAY)
+
+    cache = ResponseCache(CACHE_TTL, CACHE_MAX_ENTRIES, _programeaza_salvare)
+    # Referința se setează ÎNAINTE de await — entry-urile concurente
+    # trebuie să primească aceeași instanță
+    domain_data[CACHE_DATA_KEY] = cache
+    cache.load(await store.async_load())
+    _LOGGER.debug("Cache răspunsuri încărcat: %s", cache.stats)
+    return cache
+
+
+async def async_remove_response_cache(hass: HomeAssistant) -> None:
+    """Șterge cache-ul persistent (la eliminarea ultimei intrări)."""
+    await Store(hass, STORAGE_VERSION, CACHE_STORAGE_KEY).async_remove()
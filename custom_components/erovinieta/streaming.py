@@ -0,0 +1,135 @@
+"""Decodare JSON incrementală pentru răspunsurile mari ale API-ului eRovinieta.
+
+`iter_json_array` citește un răspuns bucată cu bucată și produce, pe rând,
+elementele unui array (ex: `view` din getTransaction sau `detectionList`
+din getDetectionsAndPayments), fără a ține în memorie tot corpul ca șir și
+tot arborele de obiecte în același timp. Buffer-ul păstrează doar textul
+încă neconsumat.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any
+
+_WHITESPACE = " \t\n\r"
+# Caractere care pot urma legitim după o valoare JSON
+_DELIMITATORI = _WHITESPACE + ",]}:"
+# Textul deja consumat este eliminat din buffer peste acest prag (caractere)
+_TRIM_THRESHOLD = 64 * 1024
+
+_DECODER = json.JSONDecoder()
+
+
+class _Cititor:
+    """Buffer de text alimentat din bucăți de octeți (UTF-8)."""
+
+    def __init__(self, chunks: AsyncIterable[bytes]) -> None:
+        self._chunks = chunks.__aiter__()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    async def mai_mult(self) -> bool:
+        """Adaugă următoarea bucată în buffer. False la sfârșitul fluxului."""
+        if self.eof:
+            return False
+        if self.pos > _TRIM_THRESHOLD:
+            self.buf = self.buf[self.pos :]
+            self.pos = 0
+        try:
+            chunk = await self._chunks.__anext__()
+        except StopAsyncIteration:
+            self.eof = True
+            self.buf += self._utf8.decode(b"", final=True)
+            return False
+        self.buf += self._utf8.decode(chunk)
+        return True
+
+    async def caracter(self) -> str:
+        """Sare peste spații și returnează caracterul curent ('' la EOF)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not await self.mai_mult():
+                return ""
+
+    async def valoare(self) -> Any:
+        """Decodează o valoare JSON completă de la poziția curentă.
+
+        O valoare este considerată completă doar dacă după ea urmează un
+        delimitator (sau fluxul s-a terminat) — altfel un număr tăiat între
+        două bucăți (ex: `-12` din `-12.5`) ar fi decodat greșit.
+        """
+        await self.caracter()
+        while True:
+            try:
+                valoare, sfarsit = _DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not await self.mai_mult():
+                    raise
+                continue
+            if self.eof or (
+                sfarsit < len(self.buf) and self.buf[sfarsit] in _DELIMITATORI
+            ):
+                self.pos = sfarsit
+                return valoare
+            await self.mai_mult()
+
+    async def asteapta(self, asteptat: str) -> str:
+        """Consumă unul dintre caracterele așteptate și îl returnează."""
+        caracter = await self.caracter()
+        if not caracter or caracter not in asteptat:
+            raise json.JSONDecodeError(
+                f"Se aștepta unul dintre {asteptat!r}", self.buf, self.pos
+            )
+        self.pos += 1
+        return caracter
+
+
+async def iter_json_array(
+    chunks: AsyncIterable[bytes], key: str
+) -> AsyncIterator[Any]:
+    """Produce elementele array-ului `key` din obiectul JSON de nivel superior.
+
+    Dacă documentul este el însuși un array, sunt produse elementele lui.
+    Celelalte chei ale obiectului sunt decodate și ignorate. Aruncă
+    `json.JSONDecodeError` pentru JSON invalid sau trunchiat.
+    """
+    cititor = _Cititor(chunks)
+    deschidere = await cititor.asteapta("{[")
+
+    if deschidere == "[":
+        async for element in _elemente(cititor):
+            yield element
+        return
+
+    if await cititor.caracter() == "}":
+        return
+    while True:
+        cheie = await cititor.valoare()
+        await cititor.asteapta(":")
+        if cheie == key and await cititor.caracter() == "[":
+            cititor.pos += 1
+            async for element in _elemente(cititor):
+                yield element
+        else:
+            await cititor.valoare()
+        if await cititor.asteapta(",}") == "}":
+            return
+
+
+async def _elemente(cititor: _Cititor) -> AsyncIterator[Any]:
+    """Produce elementele unui array deja deschis ('[' consumat)."""
+    if await cititor.caracter() == "]":
+        cititor.pos += 1
+        return
+    while True:
+        yield await cititor.valoare()
+        if await cititor.asteapta(",]") == "]":
+            return
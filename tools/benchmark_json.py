@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Benchmark JSON: modulul standard `json` vs orjson (dacă este instalat).
+
+Măsoară decodarea (octeți → obiecte, ca în `ErovinietaAPI._do_request`) și
+codarea pe payload-uri sintetice cu forma răspunsurilor reale eRovinieta:
+lista paginată de vehicule, tranzacțiile contului și trecerile de pod.
+
+Utilizare:
+    python tools/benchmark_json.py [--repeat 20] [--vehicule 50] [--tranzactii 2000]
+
+Rezultatul este afișat ca JSON (timpi median, în milisecunde).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _vehicul(i: int) -> dict[str, Any]:
+    return {
+        "entity": {
+            "plateNo": f"B{100 + i:03d}ABC",
+            "vin": f"WVWZZZ1JZXW{i:06d}",
+            "certificateSeries": f"C{i:07d}",
+        },
+        "userDetailsVignettes": [
+            {
+                "vignetteStartDate": 1700000000000 + i * 86400000,
+                "vignetteStopDate": 1731536000000 + i * 86400000,
+                "categoryDescription": "A - Autoturisme",
+                "series": f"RO{i:010d}",
+            }
+        ],
+        "plateNo": f"B{100 + i:03d}ABC",
+        "vin": f"WVWZZZ1JZXW{i:06d}",
+        "certificateSeries": f"C{i:07d}",
+    }
+
+
+def _tranzactie(i: int) -> dict[str, Any]:
+    return {
+        "series": f"FCT{i:08d}",
+        "createdDate": 1700000000000 + i * 3600000,
+        "valoareTotalaCuTva": round(random.uniform(10, 500), 2),
+        "paymentMethod": "CARD",
+        "partner": "CNAIR — Compania Națională de Administrare a Infrastructurii",
+        "plateNo": f"B{100 + i % 50:03d}ABC",
+    }
+
+
+def _detectie(i: int) -> dict[str, Any]:
+    return {
+        "detectionTimestamp": 1700000000000 + i * 7200000,
+        "lane": random.choice([1, 2]),
+        "direction": random.choice(["Fetești-Cernavodă", "Cernavodă-Fetești"]),
+        "detectionCategory": "A",
+        "paymentStatus": "PAID",
+        "detectionPaymentSum": 6.1,
+        "validUntilTimestamp": 1700000000000 + i * 7200000 + 86400000,
+    }
+
+
+def payloads(vehicule: int, tranzactii: int, detectii: int) -> dict[str, Any]:
+    """Payload-uri sintetice cu forma răspunsurilor API."""
+    random.seed(0)
+    return {
+        "paginated": {
+            "total": vehicule,
+            "view": [_vehicul(i) for i in range(vehicule)],
+        },
+        "transactions": {"view": [_tranzactie(i) for i in range(tranzactii)]},
+        "bridge": {"detectionList": [_detectie(i) for i in range(detectii)]},
+    }
+
+
+def _median_ms(func: Callable[[], Any], repeat: int) -> float:
+    timpi = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timpi.append(time.perf_counter() - start)
+    return round(statistics.median(timpi) * 1000, 3)
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--vehicule", type=int, default=50)
+    parser.add_argument("--tranzactii", type=int, default=2000)
+    parser.add_argument("--detectii", type=int, default=1000)
+    args = parser.parse_args()
+
+    rezultate: dict[str, Any] = {
+        "orjson": orjson.__version__ if orjson is not None else None,
+        "payloads": {},
+    }
+    for nume, obj in payloads(args.vehicule, args.tranzactii, args.detectii).items():
+        raw = _stdlib_dumps(obj)
+        rand: dict[str, Any] = {
+            "octeti": len(raw),
+            "json_loads_ms": _median_ms(lambda: json.loads(raw), args.repeat),
+            "json_dumps_ms": _median_ms(lambda: _stdlib_dumps(obj), args.repeat),
+        }
+        if orjson is not None:
+            if orjson.loads(raw) != json.loads(raw):
+                print(f"Rezultate diferite pentru {nume}", file=sys.stderr)
+                return 1
+            rand["orjson_loads_ms"] = _median_ms(lambda: orjson.loads(raw), args.repeat)
+            rand["orjson_dumps_ms"] = _median_ms(lambda: orjson.dumps(obj), args.repeat)
+            rand["accelerare_loads"] = round(
+                rand["json_loads_ms"] / max(rand["orjson_loads_ms"], 1e-6), 1
+            )
+        rezultate["payloads"][nume] = rand
+
+    print(json.dumps(rezultate, indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""Benchmark end-to-end: refresh ErovinietaCoordinator + randarea senzorilor.
+
+Pentru fiecare combinație (vehicule × detecții per vehicul × ani de
+tranzacții) pornește portalul fals (tools/fake_portal.py) într-un proces
+separat — ca memoria lui să nu intre în măsurători — și rulează
+`ErovinietaCoordinator._async_update_data` de două ori:
+
+- „rece”: primul refresh (backfill treceri, sincronizare completă
+  tranzacții, detalii facturi);
+- „cald”: refresh-ul următor (incremental), cu toate domeniile scadente.
+
+După fiecare refresh sunt creați senzorii (`sensor.async_setup_entry`) și
+sunt calculate starea și atributele fiecăruia. Se raportează: timp total,
+din care timp de randare, vârf de memorie (tracemalloc), cereri HTTP
+(numărate de portal), blocuri de memorie alocate și obiecte gc nou create.
+
+Cu `--caseta` (înregistrată de integrare, vezi tools/replay_portal.py)
+flota sintetică este înlocuită de traficul real redat, pentru fiecare
+valoare din `--ani`; `--viteza` scalează latențele înregistrate.
+
+Utilizare:
+    python tools/benchmark_refresh.py --vehicule 1,10,50 --detectii 50,500 \\
+        --ani 1,5 --output rezultate.json
+    python tools/benchmark_refresh.py --caseta caseta.json --viteza 0
+
+Necesită Home Assistant instalat (aceeași versiune ca integrarea).
+Rezultatele sunt scrise ca JSON, pentru comparații între rulări.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import inspect
+import itertools
+import json
+import platform
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+
+RADACINA = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RADACINA))
+
+from homeassistant.config_entries import ConfigEntry  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers import device_registry as dr  # noqa: E402
+from homeassistant.helpers import entity_registry as er  # noqa: E402
+
+from custom_components.erovinieta import codec, sensor  # noqa: E402
+from custom_components.erovinieta.api import ErovinietaAPI  # noqa: E402
+from custom_components.erovinieta.const import (  # noqa: E402
+    CONF_ISTORIC_TRANZACTII,
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    DOMAIN,
+    LICENSE_DATA_KEY,
+)
+from custom_components.erovinieta.coordinator import (  # noqa: E402
+    ErovinietaCoordinator,
+)
+
+PREFIX = "/vignettes-portal-web"
+
+
+class _LicentaBenchmark:
+    """Licență validă pentru benchmark (senzorii verifică `is_valid`)."""
+
+    is_valid = True
+
+
+def _port_liber() -> int:
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+def _config_entry(**kwargs: Any) -> ConfigEntry:
+    """Creează un ConfigEntry compatibil cu versiunea HA instalată."""
+    parametri = inspect.signature(ConfigEntry).parameters
+    if "minor_version" in parametri:
+        kwargs.setdefault("minor_version", 1)
+    if "discovery_keys" in parametri:
+        kwargs.setdefault("discovery_keys", {})
+    if "subentries_data" in parametri:
+        kwargs.setdefault("subentries_data", None)
+    return ConfigEntry(**kwargs)
+
+
+class PortalLocal:
+    """Portalul fals sau redarea unei casete, rulate într-un subproces."""
+
+    def __init__(self, script: str, *argumente: str) -> None:
+        self.port = _port_liber()
+        self.base_url = f"http://localhost:{self.port}{PREFIX}"
+        self._cmd = [
+            sys.executable,
+            str(RADACINA / "tools" / script),
+            "--port",
+            str(self.port),
+            *argumente,
+        ]
+        self._proces: subprocess.Popen | None = None
+
+    @classmethod
+    def fals(
+        cls, args: argparse.Namespace, vehicule: int, detectii: int, ani: int
+    ) -> PortalLocal:
+        """Portalul fals cu o flotă sintetică."""
+        return cls(
+            "fake_portal.py",
+            *("--vehicule", str(vehicule), "--detectii", str(detectii)),
+            *("--tranzactii", str(args.tranzactii_pe_an * ani)),
+            *("--ani-istoric", str(ani), "--latenta-ms", str(args.latenta_ms)),
+            *("--seed", str(args.seed)),
+        )
+
+    @classmethod
+    def caseta(cls, args: argparse.Namespace) -> PortalLocal:
+        """Redarea casetei din `--caseta`."""
+        return cls(
+            "replay_portal.py", str(args.caseta), "--viteza", str(args.viteza)
+        )
+
+    async def __aenter__(self) -> PortalLocal:
+        self._proces = subprocess.Popen(self._cmd, stdout=subprocess.DEVNULL)
+        async with aiohttp.ClientSession() as session:
+            for _ in range(100):
+                try:
+                    await self.cereri(session)
+                    return self
+                except aiohttp.ClientError:
+                    await asyncio.sleep(0.1)
+        raise RuntimeError("Portalul fals nu a pornit")
+
+    async def __aexit__(self, *exc: object) -> None:
+        if self._proces is not None:
+            self._proces.terminate()
+            self._proces.wait()
+
+    async def cereri(self, session: aiohttp.ClientSession) -> int:
+        """Numărul total de cereri primite de portal."""
+        url = f"http://localhost:{self.port}/_fake/stats"
+        async with session.get(url) as resp:
+            stats = await resp.json()
+        return sum(
+            numar for ruta, numar in stats["cereri"].items() if ruta.startswith("/")
+        )
+
+
+async def _randare(
+    hass: HomeAssistant, coordinator: ErovinietaCoordinator, entry: ConfigEntry
+) -> int:
+    """Creează senzorii și calculează starea + atributele fiecăruia."""
+    senzori: list[Any] = []
+    await sensor.async_setup_entry(hass, entry, lambda noi: senzori.extend(noi))
+    for senzor in senzori:
+        senzor.hass = hass
+        senzor.native_value  # noqa: B018
+        senzor.extra_state_attributes  # noqa: B018
+    return len(senzori)
+
+
+async def _masoara(
+    hass: HomeAssistant,
+    coordinator: ErovinietaCoordinator,
+    entry: ConfigEntry,
+    portal: PortalLocal,
+    control: aiohttp.ClientSession,
+) -> dict[str, Any]:
+    """Un refresh complet + randare, cu măsurători."""
+    # Toate domeniile scadente (altfel refresh-ul „cald” n-ar aduce nimic)
+    coordinator._scadente.clear()
+    cereri_inainte = await portal.cereri(control)
+    gc.collect()
+    obiecte_inainte = len(gc.get_objects())
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    coordinator.data = await coordinator._async_update_data()
+    start_randare = time.perf_counter()
+    senzori = await _randare(hass, coordinator, entry)
+    sfarsit = time.perf_counter()
+
+    snapshot = tracemalloc.take_snapshot()
+    blocuri = sum(stat.count for stat in snapshot.statistics("filename"))
+    _, varf = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    obiecte_dupa = len(gc.get_objects())
+
+    return {
+        "timp_s": round(sfarsit - start, 4),
+        "timp_randare_s": round(sfarsit - start_randare, 4),
+        "varf_memorie_kib": round(varf / 1024, 1),
+        "blocuri_alocate": blocuri,
+        "obiecte_gc_noi": obiecte_dupa - obiecte_inainte,
+        "cereri_http": await portal.cereri(control) - cereri_inainte,
+        "senzori": senzori,
+        "treceri": sum(
+            len(treceri)
+            for treceri in coordinator.data.get("treceri_pod_per_vehicul", {}).values()
+        ),
+        "tranzactii": len(coordinator.data.get("transactions", [])),
+    }
+
+
+async def _configuratie(portal_local: PortalLocal, ani: int) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        await dr.async_load(hass)
+        await er.async_load(hass)
+        hass.data[DOMAIN] = {LICENSE_DATA_KEY: _LicentaBenchmark()}
+
+        async with portal_local as portal:
+            entry = _config_entry(
+                version=1,
+                domain=DOMAIN,
+                title="benchmark",
+                data={CONF_USERNAME: "benchmark@example.ro", CONF_PASSWORD: "x"},
+                options={CONF_ISTORIC_TRANZACTII: ani},
+                source="user",
+            )
+            async with aiohttp.ClientSession(
+                cookie_jar=aiohttp.CookieJar()
+            ) as session, aiohttp.ClientSession() as control:
+                api = ErovinietaAPI(
+                    session,
+                    entry.data[CONF_USERNAME],
+                    entry.data[CONF_PASSWORD],
+                    base_url=portal.base_url,
+                )
+                coordinator = ErovinietaCoordinator(
+                    hass, api, config_entry=entry, update_interval=3600
+                )
+                hass.data[DOMAIN][entry.entry_id] = coordinator
+                rece = await _masoara(hass, coordinator, entry, portal, control)
+                cald = await _masoara(hass, coordinator, entry, portal, control)
+                await api.close()
+
+        await hass.async_stop(force=True)
+
+    return {"ani_tranzactii": ani, "rece": rece, "cald": cald}
+
+
+def _lista(valoare: str) -> list[int]:
+    return [int(x) for x in valoare.split(",") if x.strip()]
+
+
+def _configuratii(
+    args: argparse.Namespace,
+) -> Iterator[tuple[dict[str, Any], PortalLocal, int]]:
+    """(descriere, portal, ani) pentru fiecare punct din baleiaj."""
+    if args.caseta:
+        for ani in args.ani:
+            yield {"caseta": str(args.caseta)}, PortalLocal.caseta(args), ani
+        return
+    for vehicule, detectii, ani in itertools.product(
+        args.vehicule, args.detectii, args.ani
+    ):
+        descriere = {"vehicule": vehicule, "detectii_per_vehicul": detectii}
+        yield descriere, PortalLocal.fals(args, vehicule, detectii, ani), ani
+
+
+async def _main(args: argparse.Namespace) -> int:
+    rezultate = []
+    for descriere, portal, ani in _configuratii(args):
+        rezultat = {**descriere, **await _configuratie(portal, ani)}
+        rezultate.append(rezultat)
+        eticheta = " ".join(f"{cheie}={val}" for cheie, val in descriere.items())
+        print(
+            f"{eticheta} ani={ani:<2} "
+            f"rece: {rezultat['rece']['timp_s']:.3f}s "
+            f"{rezultat['rece']['varf_memorie_kib']:.0f} KiB "
+            f"{rezultat['rece']['cereri_http']} cereri | "
+            f"cald: {rezultat['cald']['timp_s']:.3f}s "
+            f"{rezultat['cald']['varf_memorie_kib']:.0f} KiB "
+            f"{rezultat['cald']['cereri_http']} cereri",
+            file=sys.stderr,
+        )
+
+    raport = {
+        "meta": {
+            "moment": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platforma": platform.platform(),
+            "codec_json": codec.BACKEND,
+            "latenta_ms": args.latenta_ms,
+            "tranzactii_pe_an": args.tranzactii_pe_an,
+            "seed": args.seed,
+            "viteza_caseta": args.viteza if args.caseta else None,
+        },
+        "rezultate": rezultate,
+    }
+    Path(args.output).write_text(
+        json.dumps(raport, indent=2, ensure_ascii=False), encoding="utf-8"
+    )
+    print(f"Rezultate scrise în {args.output}", file=sys.stderr)
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vehicule", type=_lista, default=[1, 10, 50])
+    parser.add_argument("--detectii", type=_lista, default=[50, 500])
+    parser.add_argument("--ani", type=_lista, default=[1, 5])
+    parser.add_argument("--tranzactii-pe-an", type=int, default=50)
+    parser.add_argument("--latenta-ms", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--caseta", type=Path, default=None)
+    parser.add_argument("--viteza", type=float, default=1.0)
+    parser.add_argument("--output", default="benchmark_refresh.json")
+    return asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
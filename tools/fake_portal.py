@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""Portal eRovinieta local (fals) pentru teste de performanță offline.
+
+Implementează toate URL-urile din `const.py`, sub același prefix
+(`/vignettes-portal-web`):
+
+- POST /login                                   → cookie JSESSIONID
+- GET  /rest/setariUtilizatorPortal             → date utilizator
+- GET  /rest/desktop/home/getDataPaginated      → vehicule (limit/page)
+- GET  /rest/anonymous/getCountries             → lista de țări
+- GET  /rest/transaction/getTransaction         → facturi (dateFrom/dateTo)
+- GET  /rest/transaction/getTransactionDetails  → detalii factură (series)
+- POST /rest/anonymous/bridge/detectionsAndPayments/getDetectionsAndPayments
+
+Fiecare utilizator primește o flotă sintetică deterministă (aceleași date
+pentru același username și seed; momentele sunt relative la prima cerere
+a contului). Latența și rata de erori (HTTP 503)
+sunt configurabile. Endpoint-ul auxiliar GET /_fake/stats returnează
+numărul de cereri per rută.
+
+Utilizare:
+    python tools/fake_portal.py --port 8080 --vehicule 20 --detectii 500
+
+Clientul se conectează prin `ErovinietaAPI(..., base_url=
+"http://localhost:8080/vignettes-portal-web")`.
+
+Perioadele cererii de treceri pod (`period`) nu sunt documentate public;
+portalul fals le interpretează ca 1 → 30 zile, 2 → 90, 3 → 180, 4 → 365.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import random
+import secrets
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+from aiohttp import web
+
+PREFIX = "/vignettes-portal-web"
+ZI_MS = 86400 * 1000
+PERIOADE_ZILE = {1: 30, 2: 90, 3: 180, 4: 365}
+
+_TARI = [
+    (1, "ROMANIA"),
+    (2, "BULGARIA"),
+    (3, "UNGARIA"),
+    (4, "REPUBLICA MOLDOVA"),
+    (5, "GERMANIA"),
+    (6, "ITALIA"),
+]
+_JUDETE = ["BUCURESTI", "CLUJ", "CONSTANTA", "IASI", "TIMIS", "BRASOV"]
+_DIRECTII = ["Fetești-Cernavodă", "Cernavodă-Fetești"]
+
+
+@dataclass
+class FakePortalConfig:
+    """Parametrii portalului fals."""
+
+    vehicule: int = 5
+    detectii: int = 200  # per vehicul, distribuite pe ultimul an
+    tranzactii: int = 100  # per cont, distribuite pe `ani_istoric`
+    ani_istoric: int = 2
+    latenta_ms: float = 0.0
+    jitter_ms: float = 0.0
+    rata_erori: float = 0.0  # probabilitatea unui HTTP 503, 0..1
+    durata_sesiune: float | None = None  # secunde; None = nu expiră
+    seed: int = 0
+
+
+class Flota:
+    """Datele sintetice ale unui cont (generate o singură dată)."""
+
+    def __init__(self, username: str, config: FakePortalConfig) -> None:
+        amprenta = hashlib.sha256(f"{config.seed}:{username}".encode()).digest()
+        rng = random.Random(int.from_bytes(amprenta[:8], "big"))
+        acum = int(time.time() * 1000)
+
+        self.user = {
+            "id": rng.randint(10_000, 99_999),
+            "utilizator": {
+                "nume": f"UTILIZATOR {username.split('@')[0].upper()}",
+                "telefon": f"07{rng.randint(10_000_000, 99_999_999)}",
+                "email": username,
+            },
+            "cnpCui": str(rng.randint(1_000_000_000_000, 2_999_999_999_999)),
+            "pf": True,
+            "acceptaCorespondenta": rng.random() < 0.5,
+            "adresa": f"Str. Exemplu nr. {rng.randint(1, 200)}",
+            "tara": {"id": 1, "denumire": "ROMANIA"},
+            "judet": {"nume": rng.choice(_JUDETE)},
+            "localitate": {"nume": "LOCALITATE"},
+        }
+
+        self.vehicule: list[dict[str, Any]] = []
+        self.detectii: dict[str, list[dict[str, Any]]] = {}
+        for i in range(config.vehicule):
+            plate_no = f"B{rng.randint(10, 999):03d}{_litere(rng)}"
+            start = acum - rng.randint(0, 300) * ZI_MS
+            entity = {
+                "plateNo": plate_no,
+                "vin": f"WVWZZZ{rng.randint(10**10, 10**11 - 1)}",
+                "certificateSeries": f"C{rng.randint(10**6, 10**7 - 1)}",
+                "tara": rng.choice(_TARI)[0],
+            }
+            self.vehicule.append(
+                {
+                    "entity": entity,
+                    "userDetailsVignettes": [
+                        {
+                            "vignetteStartDate": start,
+                            "vignetteStopDate": start + 365 * ZI_MS,
+                            "vignetteCategory": "A",
+                        }
+                    ],
+                    "detectionPaymentSum": {
+                        "soldPeajeNeexpirate": round(rng.uniform(0, 60), 2)
+                    },
+                }
+            )
+            detectii = []
+            for _ in range(config.detectii):
+                ts = acum - rng.randint(0, 365 * ZI_MS)
+                platita = rng.random() < 0.95
+                detectii.append(
+                    {
+                        "detectionTimestamp": ts,
+                        "lane": rng.randint(1, 2),
+                        "direction": rng.choice(_DIRECTII),
+                        "detectionCategory": "A",
+                        "paymentStatus": "PAID" if platita else None,
+                        "value": 6.1,
+                        "paymentPlateNo": plate_no,
+                        "taxName": "Trecere pod Fetești-Cernavodă",
+                        "validUntilTimestamp": ts + ZI_MS,
+                    }
+                )
+            detectii.sort(key=lambda d: d["detectionTimestamp"], reverse=True)
+            self.detectii[plate_no] = detectii
+
+        self.tranzactii: list[dict[str, Any]] = []
+        for i in range(config.tranzactii):
+            self.tranzactii.append(
+                {
+                    "series": f"EROV{amprenta[:3].hex().upper()}{i:06d}",
+                    "createdDate": acum
+                    - rng.randint(0, config.ani_istoric * 365 * ZI_MS),
+                    "valoareTotalaCuTva": round(rng.uniform(10, 500), 2),
+                    "paymentMethod": "CARD",
+                }
+            )
+        self.tranzactii.sort(key=lambda t: t["createdDate"], reverse=True)
+        self._tranzactii_dupa_serie = {t["series"]: t for t in self.tranzactii}
+
+    def detalii(self, serie: str) -> dict[str, Any] | None:
+        """Detaliile unei facturi (derivate determinist din factură)."""
+        factura = self._tranzactii_dupa_serie.get(serie)
+        if factura is None:
+            return None
+        return {
+            "series": serie,
+            "createdDate": factura["createdDate"],
+            "valoareTotalaCuTva": factura["valoareTotalaCuTva"],
+            "items": [
+                {
+                    "product": "Rovinietă 12 luni",
+                    "value": factura["valoareTotalaCuTva"],
+                }
+            ],
+        }
+
+
+def _litere(rng: random.Random) -> str:
+    return "".join(rng.choice("ABCDEFGHJKLMNPRSTUVWXYZ") for _ in range(3))
+
+
+class FakePortal:
+    """Starea portalului: configurație, sesiuni, flote, contoare."""
+
+    def __init__(self, config: FakePortalConfig) -> None:
+        self.config = config
+        self.sesiuni: dict[str, tuple[str, float]] = {}
+        self.flote: dict[str, Flota] = {}
+        self.cereri: Counter[str] = Counter()
+        self._rng = random.Random(config.seed)
+
+    def flota(self, username: str) -> Flota:
+        flota = self.flote.get(username)
+        if flota is None:
+            flota = self.flote[username] = Flota(username, self.config)
+        return flota
+
+    def utilizator(self, request: web.Request) -> str | None:
+        """Username-ul sesiunii din cookie (None dacă lipsește/expirată)."""
+        sid = request.cookies.get("JSESSIONID")
+        sesiune = self.sesiuni.get(sid) if sid else None
+        if sesiune is None:
+            return None
+        username, creata = sesiune
+        durata = self.config.durata_sesiune
+        if durata is not None and time.monotonic() - creata > durata:
+            self.sesiuni.pop(sid, None)
+            return None
+        return username
+
+    @web.middleware
+    async def middleware(
+        self, request: web.Request, handler: Any
+    ) -> web.StreamResponse:
+        """Latență injectată, erori injectate și numărarea cererilor."""
+        if request.path.startswith("/_fake/"):
+            return await handler(request)
+        ruta = request.path.removeprefix(PREFIX)
+        self.cereri[ruta] += 1
+        config = self.config
+        if config.latenta_ms or config.jitter_ms:
+            intarziere = config.latenta_ms + self._rng.uniform(
+                -config.jitter_ms, config.jitter_ms
+            )
+            await asyncio.sleep(max(0.0, intarziere) / 1000)
+        if config.rata_erori and self._rng.random() < config.rata_erori:
+            self.cereri["_erori_injectate"] += 1
+            return web.Response(status=503, text="Service Unavailable (injectat)")
+        return await handler(request)
+
+    # ── Rute ──
+
+    async def login(self, request: web.Request) -> web.Response:
+        data = await request.json()
+        username = data.get("username")
+        parola = data.get("password")
+        if not username or not parola or parola == "gresit":
+            return web.Response(status=401, text="Bad credentials")
+        sid = secrets.token_hex(16).upper()
+        self.sesiuni[sid] = (username, time.monotonic())
+        raspuns = web.json_response({"success": True})
+        raspuns.set_cookie("JSESSIONID", sid, path="/")
+        return raspuns
+
+    def _autentificat(self, request: web.Request) -> Flota:
+        username = self.utilizator(request)
+        if username is None:
+            raise web.HTTPUnauthorized(text="Sesiune invalidă")
+        return self.flota(username)
+
+    async def user(self, request: web.Request) -> web.Response:
+        return web.json_response(self._autentificat(request).user)
+
+    async def paginated(self, request: web.Request) -> web.Response:
+        flota = self._autentificat(request)
+        limit = max(1, int(request.query.get("limit", 20)))
+        page = max(0, int(request.query.get("page", 0)))
+        view = flota.vehicule[page * limit : (page + 1) * limit]
+        return web.json_response({"total": len(flota.vehicule), "view": view})
+
+    async def countries(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            [{"id": id_tara, "denumire": nume} for id_tara, nume in _TARI]
+        )
+
+    async def transactions(self, request: web.Request) -> web.Response:
+        flota = self._autentificat(request)
+        date_from = int(request.query.get("dateFrom", 0))
+        date_to = int(request.query.get("dateTo", 2**62))
+        view = [
+            t for t in flota.tranzactii if date_from <= t["createdDate"] <= date_to
+        ]
+        return web.json_response({"view": view})
+
+    async def transaction_details(self, request: web.Request) -> web.Response:
+        flota = self._autentificat(request)
+        detalii = flota.detalii(request.query.get("series", ""))
+        if detalii is None:
+            raise web.HTTPNotFound(text="Factură inexistentă")
+        return web.json_response(detalii)
+
+    async def bridge(self, request: web.Request) -> web.Response:
+        data = await request.json()
+        plate_no = data.get("plateNo")
+        # Endpoint anonim: flota este căutată în toate conturile cunoscute
+        detectii: list[dict[str, Any]] | None = None
+        for flota in self.flote.values():
+            detectii = flota.detectii.get(plate_no)
+            if detectii is not None:
+                break
+        zile = PERIOADE_ZILE.get(int(data.get("period", 4)), 365)
+        prag = int(time.time() * 1000) - zile * ZI_MS
+        lista = [d for d in detectii or [] if d["detectionTimestamp"] >= prag]
+        return web.json_response({"detectionList": lista})
+
+    async def stats(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"cereri": dict(self.cereri), "sesiuni": len(self.sesiuni)}
+        )
+
+
+def create_app(config: FakePortalConfig | None = None) -> web.Application:
+    """Construiește aplicația aiohttp a portalului fals."""
+    portal = FakePortal(config or FakePortalConfig())
+    app = web.Application(middlewares=[portal.middleware])
+    app["portal"] = portal
+    app.router.add_post(f"{PREFIX}/login", portal.login)
+    app.router.add_get(f"{PREFIX}/rest/setariUtilizatorPortal", portal.user)
+    app.router.add_get(
+        f"{PREFIX}/rest/desktop/home/getDataPaginated", portal.paginated
+    )
+    app.router.add_get(f"{PREFIX}/rest/anonymous/getCountries", portal.countries)
+    app.router.add_get(
+        f"{PREFIX}/rest/transaction/getTransaction", portal.transactions
+    )
+    app.router.add_get(
+        f"{PREFIX}/rest/transaction/getTransactionDetails",
+        portal.transaction_details,
+    )
+    app.router.add_post(
+        f"{PREFIX}/rest/anonymous/bridge/detectionsAndPayments/"
+        "getDetectionsAndPayments",
+        portal.bridge,
+    )
+    app.router.add_get("/_fake/stats", portal.stats)
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--vehicule", type=int, default=5)
+    parser.add_argument("--detectii", type=int, default=200, help="per vehicul")
+    parser.add_argument("--tranzactii", type=int, default=100, help="per cont")
+    parser.add_argument("--ani-istoric", type=int, default=2)
+    parser.add_argument("--latenta-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rata-erori", type=float, default=0.0)
+    parser.add_argument("--durata-sesiune", type=float, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    config = FakePortalConfig(
+        vehicule=args.vehicule,
+        detectii=args.detectii,
+        tranzactii=args.tranzactii,
+        ani_istoric=args.ani_istoric,
+        latenta_ms=args.latenta_ms,
+        jitter_ms=args.jitter_ms,
+        rata_erori=args.rata_erori,
+        durata_sesiune=args.durata_sesiune,
+        seed=args.seed,
+    )
+    print(f"Portal fals: http://{args.host}:{args.port}{PREFIX}")
+    web.run_app(create_app(config), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
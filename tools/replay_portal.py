@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Redare offline a unei casete de trafic eRovinieta.
+
+Servește răspunsurile dintr-o casetă înregistrată de integrare (opțiunea
+„Înregistrare trafic”, fișierele din `<config>/erovinieta_casete/`), cu
+duratele originale împărțite la `--viteza` (1 = timp real, 2 = de două ori
+mai repede, 0 = fără întârzieri).
+
+Potrivirea cererilor:
+1. exact — metodă + cale + query (fără `timestamp`) + corpul JSON; valorile
+   sensibile din casetă sunt pseudonime, iar clientul le primește înapoi
+   din răspunsurile redate (ex: numerele de înmatriculare din lista de
+   vehicule), deci cererile per vehicul se potrivesc;
+2. altfel — metodă + cale (ex: tranzacțiile, al căror interval depinde de
+   momentul rulării; login-ul).
+
+Interacțiunile cu aceeași cheie sunt servite în ordinea înregistrării, apoi
+de la capăt — refresh-uri repetate redau aceeași secvență (inclusiv
+erorile înregistrate). Login-ul reușit setează un cookie JSESSIONID nou.
+GET /_fake/stats returnează cererile per rută (același format ca
+tools/fake_portal.py), plus cererile fără corespondent în casetă.
+
+Utilizare:
+    python tools/replay_portal.py caseta.json --port 8080 --viteza 1
+
+Clientul se conectează prin `ErovinietaAPI(..., base_url=
+"http://localhost:8080/vignettes-portal-web")`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import secrets
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any
+
+from aiohttp import web
+from yarl import URL
+
+PREFIX = "/vignettes-portal-web"
+
+
+def _query(query: Any) -> str:
+    return "&".join(
+        f"{cheie}={valoare}"
+        for cheie, valoare in sorted(query.items())
+        if cheie != "timestamp"
+    )
+
+
+def _corp(corp: Any) -> str:
+    return json.dumps(corp, sort_keys=True, ensure_ascii=False)
+
+
+class ReplayPortal:
+    """Indexul casetei + starea redării."""
+
+    def __init__(self, caseta: dict[str, Any], viteza: float = 1.0) -> None:
+        """Indexează interacțiunile casetei."""
+        self.viteza = viteza
+        self.cereri: Counter[str] = Counter()
+        self._exact: dict[tuple, list[dict[str, Any]]] = defaultdict(list)
+        self._cale: dict[tuple, list[dict[str, Any]]] = defaultdict(list)
+        self._pozitii: Counter[tuple] = Counter()
+        for interactiune in caseta.get("interactiuni", []):
+            url = URL(interactiune["url"])
+            cale = (interactiune["metoda"], url.path)
+            exact = (*cale, _query(url.query), _corp(interactiune.get("cerere")))
+            self._exact[exact].append(interactiune)
+            self._cale[cale].append(interactiune)
+
+    def _urmatoarea(self, cheie: tuple, index: dict) -> dict[str, Any] | None:
+        lista = index.get(cheie)
+        if not lista:
+            return None
+        pozitie = self._pozitii[cheie]
+        self._pozitii[cheie] += 1
+        return lista[pozitie % len(lista)]
+
+    async def handler(self, request: web.Request) -> web.StreamResponse:
+        """Servește interacțiunea corespunzătoare cererii."""
+        corp = await request.json() if request.can_read_body else None
+        cale = (request.method, request.path)
+        exact = (*cale, _query(request.query), _corp(corp))
+        interactiune = self._urmatoarea(exact, self._exact) or self._urmatoarea(
+            cale, self._cale
+        )
+        if interactiune is None:
+            self.cereri["_nepotrivite"] += 1
+            raise web.HTTPNotFound(text="Cerere absentă din casetă")
+
+        self.cereri[request.path.removeprefix(PREFIX)] += 1
+        if self.viteza > 0:
+            await asyncio.sleep(interactiune.get("durata", 0) / self.viteza)
+
+        status = interactiune["status"]
+        if not isinstance(status, int):
+            # Timeout / eroare de conexiune la înregistrare
+            return web.Response(status=504, text=f"Înregistrat: {status}")
+        if "raspuns" in interactiune:
+            raspuns = web.json_response(interactiune["raspuns"], status=status)
+        else:
+            raspuns = web.Response(status=status, text=interactiune.get("text", ""))
+        if request.path.endswith("/login") and status == 200:
+            raspuns.set_cookie("JSESSIONID", secrets.token_hex(16).upper(), path="/")
+        return raspuns
+
+    async def stats(self, request: web.Request) -> web.Response:
+        return web.json_response({"cereri": dict(self.cereri)})
+
+
+def create_app(caseta: dict[str, Any], viteza: float = 1.0) -> web.Application:
+    """Construiește aplicația aiohttp care redă caseta."""
+    portal = ReplayPortal(caseta, viteza)
+    app = web.Application()
+    app["portal"] = portal
+    app.router.add_get("/_fake/stats", portal.stats)
+    app.router.add_route("*", PREFIX + "/{cale:.*}", portal.handler)
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("caseta", type=Path)
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--viteza", type=float, default=1.0)
+    args = parser.parse_args()
+
+    caseta = json.loads(args.caseta.read_bytes())
+    print(
+        f"Redare {args.caseta} ({len(caseta.get('interactiuni', []))} "
+        f"interacțiuni): http://{args.host}:{args.port}{PREFIX}"
+    )
+    web.run_app(
+        create_app(caseta, args.viteza), host=args.host, port=args.port, print=None
+    )
+
+
+if __name__ == "__main__":
+    main()